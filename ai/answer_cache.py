@@ -0,0 +1,71 @@
+"""
+Answer cache
+Normalized-question response cache with TTL for the chatbot
+"""
+
+import re
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+_PUNCTUATION = re.compile(r"[^\w\s-]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_question(question: str) -> str:
+    """
+    "Why was VM-3 skipped?" and "why was vm-3 skipped" share a cache entry.
+    """
+    text = _PUNCTUATION.sub(" ", question.lower())
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class AnswerCache:
+    """
+    LRU answer cache with per-entry TTL.
+    Call invalidate() whenever the underlying decisions change.
+
+    Entries are keyed by the normalized question plus an optional context
+    key, so one question asked about different VMs is cached separately.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, question: str, context: Hashable = None) -> Optional[str]:
+        key = (normalize_question(question), context)
+        entry = self._entries.get(key)
+
+        if entry is None or entry[1] <= self._clock():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, question: str, answer: str, context: Hashable = None):
+        key = (normalize_question(question), context)
+        self._entries[key] = (answer, self._clock() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
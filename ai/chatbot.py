@@ -1,29 +1,85 @@
 import os
+import threading
+from typing import Dict, Hashable, Optional
 
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
+from ai import intents
+from ai.answer_cache import AnswerCache
+from ai.retrieval import DecisionIndex
+from ai.streaming import AnswerStream
+from utils.optional_deps import is_available
+
+# Seconds a streamed answer may take before falling back to rules
+STREAM_TIMEOUT_SECONDS = float(os.getenv("CHAT_STREAM_TIMEOUT", "15"))
+
+GEMINI_MODEL = "models/gemini-1.5-flash"
+
+# google.generativeai takes seconds to import; it is only loaded once a
+# question actually needs the model.
+GEMINI_AVAILABLE = is_available("google.generativeai")
 
 
 class GeminiChatbot:
     """
     Chatbot for explaining cloud governance decisions.
     Uses Gemini if API key is available, otherwise falls back to rule-based answers.
+
+    Structured questions (savings totals, decision counts, "why was vm-3
+    skipped") are answered locally from the decision index; repeated
+    open-ended questions are served from a TTL cache.
     """
 
-    def __init__(self):
+    def __init__(self, model=None, cache_ttl_seconds: float = 300.0):
+        """
+        :param model: Any object with generate_content(prompt) -> .text
+                      (defaults to Gemini when configured)
+        :param cache_ttl_seconds: How long LLM answers stay cached
+        """
         self.api_key = os.getenv("GEMINI_API_KEY")
 
-        if GEMINI_AVAILABLE and self.api_key:
-            genai.configure(api_key=self.api_key)
-            self.model = genai.GenerativeModel("models/gemini-1.5-flash")
+        self._model = model
+        self._model_lock = threading.Lock()
+        # Gemini is created on first use (see the model property)
+        self._gemini_pending = model is None and GEMINI_AVAILABLE and bool(self.api_key)
 
-        else:
-            self.model = None
+        self.index: Optional[DecisionIndex] = None
+        self.cache = AnswerCache(ttl_seconds=cache_ttl_seconds)
+        self.intent_answers = 0
+        self.llm_calls = 0
+        # Counters are bumped from request handlers and stream workers
+        self._stats_lock = threading.Lock()
 
-    def answer(self, question: str, context: dict) -> str:
+        # session -> stream currently being answered for it
+        self._active_streams: Dict[Hashable, AnswerStream] = {}
+        self._streams_lock = threading.Lock()
+
+    @property
+    def model(self):
+        if self._gemini_pending:
+            with self._model_lock:
+                if self._gemini_pending:
+                    import google.generativeai as genai
+
+                    genai.configure(api_key=self.api_key)
+                    self._model = genai.GenerativeModel(GEMINI_MODEL)
+                    self._gemini_pending = False
+        return self._model
+
+    @model.setter
+    def model(self, model):
+        self._model = model
+        self._gemini_pending = False
+
+    def set_decisions(self, index: DecisionIndex):
+        """
+        Point the chatbot at the current decisions.
+        Cached answers are dropped whenever the decisions change.
+        """
+        if index is self.index:
+            return
+        self.index = index
+        self.cache.invalidate()
+
+    def answer(self, question: str, context: Optional[dict] = None) -> str:
         """
         Answer a question using system context.
 
@@ -34,17 +90,139 @@ class GeminiChatbot:
             "reason": str,
             "monthly_savings": float
         }
+
+        When decisions are set, context may be omitted and is built from
+        the decision index.
         """
 
+        # Fast path: structured questions answered from decision data
+        local = self._intent_answer(question)
+        if local is not None:
+            self._count("intent_answers")
+            return local
+
+        if context is None:
+            if self.index is None:
+                raise ValueError("context is required until set_decisions() is called")
+            context = self.index.build_context(question)
+
         # Fallback (no Gemini)
         if self.model is None:
             return self._rule_based_answer(question, context)
 
+        key = self._context_key(context)
+        cached = self.cache.get(question, key)
+        if cached is not None:
+            return cached
+
         prompt = self._build_prompt(question, context)
 
+        self._count("llm_calls")
         response = self.model.generate_content(prompt)
+
+        self.cache.put(question, response.text, key)
         return response.text
 
+    def stream_answer(
+        self,
+        question: str,
+        context: Optional[dict] = None,
+        timeout: Optional[float] = None,
+        session: Hashable = "default",
+    ) -> AnswerStream:
+        """
+        Streaming variant of answer().
+
+        Returns immediately; chunks arrive as the model produces them.
+        A new question from the same session cancels the previous stream.
+        On timeout or model error the rule-based answer is streamed instead.
+        """
+        local = self._intent_answer(question)
+        if local is not None:
+            self._count("intent_answers")
+            return self._activate(session, AnswerStream.completed(local))
+
+        if context is None:
+            if self.index is None:
+                raise ValueError("context is required until set_decisions() is called")
+            context = self.index.build_context(question)
+
+        if self.model is None:
+            return self._activate(
+                session, AnswerStream.completed(self._rule_based_answer(question, context))
+            )
+
+        key = self._context_key(context)
+        cached = self.cache.get(question, key)
+        if cached is not None:
+            return self._activate(session, AnswerStream.completed(cached))
+
+        prompt = self._build_prompt(question, context)
+
+        def produce():
+            self._count("llm_calls")
+            for chunk in self.model.generate_content(prompt, stream=True):
+                yield chunk.text
+
+        stream = AnswerStream(
+            produce,
+            fallback=lambda: self._rule_based_answer(question, context),
+            timeout=STREAM_TIMEOUT_SECONDS if timeout is None else timeout,
+            on_complete=lambda text: self.cache.put(question, text, key),
+        )
+        return self._activate(session, stream)
+
+    def _activate(self, session: Hashable, stream: AnswerStream) -> AnswerStream:
+        with self._streams_lock:
+            previous = self._active_streams.get(session)
+            self._active_streams[session] = stream
+
+        if previous is not None:
+            previous.cancel()
+        stream.add_done_callback(lambda: self._release(session, stream))
+        return stream
+
+    def _release(self, session: Hashable, stream: AnswerStream):
+        # A newer stream may already have replaced this one
+        with self._streams_lock:
+            if self._active_streams.get(session) is stream:
+                del self._active_streams[session]
+
+    @property
+    def active_streams(self) -> int:
+        with self._streams_lock:
+            return len(self._active_streams)
+
+    def _count(self, counter: str):
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self) -> dict:
+        lookups = self.cache.hits + self.cache.misses
+        return {
+            "intent_answers": self.intent_answers,
+            "cache_hits": self.cache.hits,
+            "cache_misses": self.cache.misses,
+            "cache_hit_rate": round(self.cache.hits / lookups, 4) if lookups else 0.0,
+            "llm_calls": self.llm_calls,
+        }
+
+    def _intent_answer(self, question: str) -> Optional[str]:
+        if self.index is None:
+            return None
+        intent, record = intents.classify(question, self.index)
+        return intents.answer(intent, record, question, self.index)
+
+    @staticmethod
+    def _context_key(context: dict) -> tuple:
+        """
+        The facts the prompt is built from; answers are cached per facts.
+        """
+        return tuple(
+            context.get(field)
+            for field in ("vm_name", "decision", "reason", "monthly_savings")
+        )
+
     def _build_prompt(self, question: str, context: dict) -> str:
         return f"""
 You are a cloud governance assistant.
@@ -65,6 +243,10 @@ Rules:
 """
 
     def _rule_based_answer(self, question: str, context: dict) -> str:
+        local = self._intent_answer(question)
+        if local is not None:
+            return local
+
         decision = context["decision"]
 
         if decision == "AUTO-STOP":
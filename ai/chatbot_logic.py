@@ -4,6 +4,7 @@ Connects VM configuration + pricing engine
 """
 
 from data.mock_cloud import get_vm_configuration
+from cost.pricing_catalog import UnknownSKUError
 from cost.pricing_engine import estimate_monthly_cost
 
 
@@ -19,10 +20,19 @@ def chatbot_estimate_cost(vm_name: str, hours_per_day: int):
             "error": "VM not found. Please provide a valid VM name."
         }
 
-    monthly_cost = estimate_monthly_cost(
-        vm["machine_type"],
-        hours_per_day
-    )
+    try:
+        monthly_cost = estimate_monthly_cost(
+            vm["machine_type"],
+            hours_per_day,
+            region=vm["region"]
+        )
+    except UnknownSKUError:
+        return {
+            "error": (
+                f"No pricing available for machine type '{vm['machine_type']}' "
+                f"in {vm['region']}."
+            )
+        }
 
     return {
         "vm_name": vm["name"],
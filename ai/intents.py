@@ -0,0 +1,110 @@
+"""
+Chatbot intents
+Answers structured questions directly from decision data, without the LLM
+"""
+
+import re
+from enum import Enum
+from typing import Optional, Tuple
+
+from ai.retrieval import DecisionIndex, TOKEN_RE
+
+STOP_WORDS = re.compile(r"\b(stop|stopped|stopping|auto-stop|hibernat\w*)\b")
+SKIP_WORDS = re.compile(r"\b(skip|skipped|kept|protected|not (be )?stopped)\b")
+
+# Tier-specific questions, checked before the generic stop / not-stopped words
+TIER_WORDS = (
+    (re.compile(r"\bnever[- ]stop\w*"), "NEVER-STOP", "are protected from ever being stopped"),
+    (re.compile(r"\bapprov\w*"), "APPROVAL-REQUIRED", "need approval before stopping"),
+    (re.compile(r"\bwarn\w*"), "WARN", "have an idle warning"),
+)
+
+COUNT_WORDS = re.compile(r"\bhow many\b|\bcount\b|\bnumber of\b")
+EXPLAIN_WORDS = re.compile(r"\b(why|explain\w*|reason\w*)\b")
+# Questions about decisions rather than e.g. costs or sizing
+DECISION_WORDS = re.compile(r"\b(decision|decided|status|flagged|marked)\b")
+
+
+class Intent(Enum):
+    TOTAL_SAVINGS = "total_savings"
+    COUNT_DECISIONS = "count_decisions"
+    EXPLAIN_VM = "explain_vm"
+    OPEN = "open"
+
+
+def _decision_value(decision) -> str:
+    return getattr(decision, "value", decision)
+
+
+def _mentions_decision(q: str) -> bool:
+    return any(
+        pattern.search(q)
+        for pattern in (STOP_WORDS, SKIP_WORDS, DECISION_WORDS, *(p for p, _, _ in TIER_WORDS))
+    )
+
+
+def classify(question: str, index: DecisionIndex) -> Tuple[Intent, Optional[dict]]:
+    """
+    Returns the intent and, for EXPLAIN_VM, the VM record it refers to.
+    Only questions about policy decisions are answered locally; anything
+    else about a VM or the fleet (costs, sizing, advice) is OPEN.
+    """
+    q = question.lower()
+    about_decisions = _mentions_decision(q)
+
+    if about_decisions and EXPLAIN_WORDS.search(q):
+        for token in TOKEN_RE.findall(q):
+            record = index.get(token)
+            if record is not None:
+                return Intent.EXPLAIN_VM, record
+
+    if about_decisions and COUNT_WORDS.search(q):
+        return Intent.COUNT_DECISIONS, None
+
+    if re.search(r"\bsav(e|ed|ing|ings)\b", q) and re.search(r"how much|total|overall", q):
+        return Intent.TOTAL_SAVINGS, None
+
+    return Intent.OPEN, None
+
+
+def answer(intent: Intent, record: Optional[dict], question: str, index: DecisionIndex) -> Optional[str]:
+    """
+    Local answer for a structured intent, or None if the LLM should handle it.
+    """
+    totals = index.totals
+
+    if intent == Intent.TOTAL_SAVINGS:
+        return (
+            f"Auto-hibernation prevents approximately ₹{totals['monthly_savings']:.2f} "
+            f"in monthly cost leakage across {totals['vm_count']} VMs."
+        )
+
+    if intent == Intent.COUNT_DECISIONS:
+        counts = totals["decision_counts"]
+        q = question.lower()
+        for pattern, decision, description in TIER_WORDS:
+            if pattern.search(q):
+                return f"{counts.get(decision, 0)} of {totals['vm_count']} VMs {description}."
+        if SKIP_WORDS.search(q):
+            # Every tier other than AUTO-STOP leaves the VM running
+            not_stopped = totals["vm_count"] - counts.get("AUTO-STOP", 0)
+            return f"{not_stopped} of {totals['vm_count']} VMs were not stopped."
+        if STOP_WORDS.search(q):
+            return f"{counts.get('AUTO-STOP', 0)} of {totals['vm_count']} VMs are marked for stopping."
+        summary = ", ".join(f"{d}: {c}" for d, c in sorted(counts.items()))
+        return f"The fleet has {totals['vm_count']} VMs ({summary})."
+
+    if intent == Intent.EXPLAIN_VM:
+        decision = _decision_value(record.get("decision"))
+        if decision == "AUTO-STOP":
+            return (
+                f"The VM '{record['name']}' was marked for stopping because "
+                f"{record['reason']}. This prevents approximately "
+                f"₹{record.get('savings', 0.0):.2f} in monthly cost leakage."
+            )
+        return (
+            f"The VM '{record['name']}' was not stopped ({decision}) because "
+            f"{record['reason']}. No automation was applied."
+        )
+
+    return None
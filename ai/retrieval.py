@@ -0,0 +1,191 @@
+"""
+Decision retrieval
+Inverted index over policy decisions for compact chatbot context
+
+Instead of sending every decision to the model, each question is matched
+against VM names, tags, environments, owners and reasons. Only the top-k
+matching VMs plus pre-aggregated fleet totals go into the prompt, trimmed
+to a fixed token budget, so prompt size stays flat as the fleet grows.
+"""
+
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional
+
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:[-_.][a-z0-9]+)*")
+
+# Field weights: an exact VM name match beats a word in a reason
+FIELD_WEIGHTS = {
+    "name": 5.0,
+    "name_part": 2.0,
+    "tag": 2.0,
+    "environment": 2.0,
+    "owner": 2.0,
+    "decision": 1.5,
+    "reason": 1.0,
+}
+
+# Fallback when a question matches nothing in particular
+TOP_SAVINGS_FALLBACK = 20
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lower-cased tokens; hyphenated names are kept whole and also split,
+    so "vm-3" matches both "vm-3" and "vm".
+    """
+    tokens = []
+    for match in TOKEN_RE.findall(str(text).lower()):
+        tokens.append(match)
+        parts = re.split(r"[-_.]", match)
+        if len(parts) > 1:
+            tokens.extend(p for p in parts if p)
+    return tokens
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough model token count (~4 characters per token).
+    """
+    return len(text) // 4 + 1
+
+
+def _decision_value(decision) -> str:
+    return getattr(decision, "value", decision)
+
+
+class DecisionIndex:
+    """
+    Inverted index over per-VM decision records.
+
+    record example:
+    {
+        "name": str,
+        "environment": str,
+        "tags": list,
+        "owner": str,
+        "decision": Decision | str,
+        "reason": str,
+        "savings": float
+    }
+    """
+
+    def __init__(self, records: List[dict], totals: Optional[Dict[str, float]] = None):
+        self.records = records
+        self._postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self._by_name = {}
+
+        decision_counts = Counter()
+        total_savings = 0.0
+
+        for doc_id, record in enumerate(records):
+            self._by_name[str(record.get("name", "")).lower()] = doc_id
+            decision = _decision_value(record.get("decision"))
+            decision_counts[decision] += 1
+            total_savings += record.get("savings", 0.0)
+
+            name = str(record.get("name", "")).lower()
+            self._add(doc_id, name, FIELD_WEIGHTS["name"])
+            for token in tokenize(name):
+                if token != name:
+                    self._add(doc_id, token, FIELD_WEIGHTS["name_part"])
+            for tag in record.get("tags", []) or []:
+                for token in tokenize(tag):
+                    self._add(doc_id, token, FIELD_WEIGHTS["tag"])
+            for field in ("environment", "owner"):
+                for token in tokenize(record.get(field) or ""):
+                    self._add(doc_id, token, FIELD_WEIGHTS[field])
+            for token in tokenize(decision or ""):
+                self._add(doc_id, token, FIELD_WEIGHTS["decision"])
+            for token in set(tokenize(record.get("reason", ""))):
+                self._add(doc_id, token, FIELD_WEIGHTS["reason"])
+
+        # Pre-aggregated facts, independent of the question
+        self.totals = {
+            "vm_count": len(records),
+            "decision_counts": dict(decision_counts),
+            "monthly_savings": round(total_savings, 2),
+        }
+        if totals:
+            self.totals.update(totals)
+
+        self._top_savings = heapq.nlargest(
+            TOP_SAVINGS_FALLBACK,
+            range(len(records)),
+            key=lambda i: records[i].get("savings", 0.0),
+        )
+
+    def _add(self, doc_id: int, token: str, weight: float):
+        postings = self._postings[token]
+        postings[doc_id] = max(postings.get(doc_id, 0.0), weight)
+
+    # --------------------------------
+    # Retrieval
+    # --------------------------------
+    def get(self, vm_name: str) -> Optional[dict]:
+        doc_id = self._by_name.get(vm_name.lower())
+        return None if doc_id is None else self.records[doc_id]
+
+    def search(self, question: str, k: int = 5) -> List[dict]:
+        """
+        Top-k records by field-weighted TF-IDF score.
+        """
+        n = len(self.records)
+        scores: Dict[int, float] = defaultdict(float)
+
+        for token in set(tokenize(question)):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = math.log(1 + n / len(postings))
+            for doc_id, weight in postings.items():
+                scores[doc_id] += weight * idf
+
+        if not scores:
+            return [self.records[i] for i in self._top_savings[:k]]
+
+        best = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [self.records[doc_id] for doc_id, _ in best]
+
+    def build_context(self, question: str, k: int = 5, token_budget: int = 600) -> dict:
+        """
+        Chatbot context (same keys GeminiChatbot expects) built from the
+        fleet totals and the top-k relevant VMs, within token_budget.
+        """
+        counts = ", ".join(f"{d}: {c}" for d, c in sorted(self.totals["decision_counts"].items()))
+        extra = "".join(
+            f"; {label} ₹{self.totals[key]:.2f}"
+            for key, label in (("monthly_cost", "monthly cost"), ("leakage", "idle leakage"))
+            if key in self.totals
+        )
+        lines = [
+            f"Fleet: {self.totals['vm_count']} VMs ({counts}); "
+            f"monthly savings ₹{self.totals['monthly_savings']:.2f}{extra}"
+        ]
+        used = estimate_tokens(lines[0])
+
+        selected = []
+        for record in self.search(question, k):
+            environment = f" [{record['environment']}]" if record.get("environment") else ""
+            line = (
+                f"{record.get('name')}{environment} "
+                f"{_decision_value(record.get('decision'))}: {record.get('reason')} "
+                f"(savings ₹{record.get('savings', 0.0):.0f})"
+            )
+            cost = estimate_tokens(line)
+            if used + cost > token_budget:
+                break
+            lines.append(line)
+            used += cost
+            selected.append(record)
+
+        decisions = {_decision_value(r.get("decision")) for r in selected}
+
+        return {
+            "vm_name": ", ".join(str(r.get("name")) for r in selected) or "multiple",
+            "decision": decisions.pop() if len(decisions) == 1 else "mixed",
+            "reason": "\n".join(lines),
+            "monthly_savings": self.totals["monthly_savings"],
+        }
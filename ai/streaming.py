@@ -0,0 +1,189 @@
+"""
+Streaming answers
+Non-blocking, cancellable token streams for the chatbot
+
+The model call runs on a worker thread that pushes chunks into a queue.
+Consumers read the queue either synchronously (Streamlit) or
+asynchronously (FastAPI) under an overall deadline; on timeout or model
+error the stream switches to the rule-based fallback answer.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from typing import Callable, Iterable, Iterator, Optional
+
+_CHUNK = "chunk"
+_ERROR = "error"
+_DONE = "done"
+_CANCELLED = "cancelled"
+
+
+class AnswerStream:
+    """
+    Iterable (sync and async) stream of answer chunks.
+    """
+
+    def __init__(
+        self,
+        produce: Callable[[], Iterable[str]],
+        fallback: Callable[[], str],
+        timeout: Optional[float],
+        on_complete: Optional[Callable[[str], None]] = None,
+    ):
+        """
+        :param produce: Returns an iterable of text chunks (runs on a worker thread)
+        :param fallback: Answer to use on timeout or model error
+        :param timeout: Seconds allowed for the whole answer (None = no limit)
+        :param on_complete: Called with the full text when the model finishes
+        """
+        self._fallback = fallback
+        self._on_complete = on_complete
+        self._queue: "queue.Queue" = queue.Queue()
+        self._cancelled = threading.Event()
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+        self._finished = False
+        self._parts = []
+        self._done_callbacks = []
+        self._done = False
+        self._done_lock = threading.Lock()
+
+        self.timed_out = False
+        self.failed = False
+
+        self._worker = threading.Thread(target=self._run, args=(produce,), daemon=True)
+        self._worker.start()
+
+    @classmethod
+    def completed(cls, text: str) -> "AnswerStream":
+        """
+        Stream for an answer that is already known (intent fast path, cache hit).
+        """
+        return cls(lambda: [text], fallback=lambda: text, timeout=None)
+
+    # --------------------------------
+    # Producer side
+    # --------------------------------
+    def _run(self, produce):
+        try:
+            for chunk in produce():
+                if self._cancelled.is_set():
+                    return
+                if chunk:
+                    self._queue.put((_CHUNK, chunk))
+        except Exception as exc:
+            self._queue.put((_ERROR, exc))
+        finally:
+            self._queue.put((_DONE, None))
+
+    def cancel(self):
+        """
+        Stop streaming; the worker drops the rest of the model output.
+        """
+        if not self._cancelled.is_set():
+            self._cancelled.set()
+            self._queue.put((_CANCELLED, None))
+        self._notify_done()
+
+    def add_done_callback(self, callback: Callable[[], None]):
+        """
+        Called once when the stream ends: answered, fell back or cancelled.
+        """
+        with self._done_lock:
+            if not self._done:
+                self._done_callbacks.append(callback)
+                return
+        callback()
+
+    def _notify_done(self):
+        with self._done_lock:
+            if self._done:
+                return
+            self._done = True
+            callbacks, self._done_callbacks = self._done_callbacks, []
+        for callback in callbacks:
+            callback()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    # --------------------------------
+    # Consumer side
+    # --------------------------------
+    def _next(self) -> Optional[str]:
+        """
+        Next chunk, or None when the stream is over.
+        """
+        if self._finished:
+            return None
+
+        if self._cancelled.is_set():
+            self._finished = True
+            self._notify_done()
+            return None
+
+        try:
+            if self._deadline is None:
+                kind, value = self._queue.get()
+            else:
+                remaining = self._deadline - time.monotonic()
+                if remaining <= 0:
+                    raise queue.Empty
+                kind, value = self._queue.get(timeout=remaining)
+        except queue.Empty:
+            self.timed_out = True
+            return self._switch_to_fallback()
+
+        if kind == _CHUNK:
+            self._parts.append(value)
+            return value
+
+        if kind == _ERROR:
+            self.failed = True
+            return self._switch_to_fallback()
+
+        self._finished = True
+        if kind == _DONE and not self._cancelled.is_set() and self._on_complete:
+            self._on_complete(self.text)
+        self._notify_done()
+        return None
+
+    def _switch_to_fallback(self) -> str:
+        self.cancel()
+        self._finished = True
+
+        answer = self._fallback()
+        if self._parts:
+            answer = "\n\n" + answer
+        self._parts.append(answer)
+        return answer
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def __iter__(self) -> Iterator[str]:
+        try:
+            while True:
+                chunk = self._next()
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            # Consumer went away (e.g. Streamlit rerun) -> stop the model
+            if not self._finished:
+                self.cancel()
+
+    async def __aiter__(self):
+        try:
+            while True:
+                chunk = await asyncio.to_thread(self._next)
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            # Client disconnected -> stop the model
+            if not self._finished:
+                self.cancel()
@@ -1,7 +1,22 @@
+import time
+from contextlib import contextmanager
+from typing import Optional
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from datetime import datetime
 
+from ai.chatbot import GeminiChatbot
+from ai.retrieval import DecisionIndex
+from cost.pricing_catalog import UnknownSKUError
+from cost.pricing_engine import estimate_monthly_cost
+from data.change_log import ChangeLog
+from engine.metrics import CONTENT_TYPE, REGISTRY
+from engine.policy_engine import Decision, PolicyEngine
+from execution.gcp_executor import GCPExecutor
+from policies.config import policies_from_config
+
 app = FastAPI(title="Cloud Auto-Hibernation Engine API")
 
 app.add_middleware(
@@ -16,6 +31,37 @@ app.add_middleware(
 def root():
     return {"status": "API running"}
 
+# --------------------------------
+# METRICS
+# --------------------------------
+REQUEST_LATENCY = REGISTRY.histogram(
+    "api_request_duration_seconds",
+    "API request latency",
+    ("route", "status"),
+)
+
+@contextmanager
+def observe_request(route: str):
+    status = 200
+    started = time.perf_counter()
+    try:
+        yield
+    except HTTPException as exc:
+        status = exc.status_code
+        raise
+    except Exception:
+        status = 500
+        raise
+    finally:
+        REQUEST_LATENCY.labels(route, status).observe(time.perf_counter() - started)
+
+@app.get("/metrics")
+def metrics():
+    """
+    Prometheus scrape endpoint.
+    """
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
 # --------------------------------
 # POLICY
 # --------------------------------
@@ -27,6 +73,13 @@ POLICY = {
     "never_stop_tags": ["never-stop"],
 }
 
+# Catalog region used for each provider's price quote
+PROVIDER_REGIONS = {
+    "gcp": "asia-south1",
+    "aws": "ap-south-1",
+    "azure": "centralindia",
+}
+
 # --------------------------------
 # COMPUTE RESOURCES (5 STATES)
 # --------------------------------
@@ -40,7 +93,7 @@ COMPUTE_RESOURCES = [
         "idle_minutes": 10,
         "state": "running",
         "tags": ["prod"],
-        "cost": {"gcp": 140, "aws": 165, "azure": 158},
+        "skus": {"gcp": "n2-standard-4", "aws": "m5.xlarge", "azure": "Standard_D4s_v5"},
     },
 
     # ⚠️ WARNING
@@ -52,7 +105,7 @@ COMPUTE_RESOURCES = [
         "idle_minutes": 50,
         "state": "running",
         "tags": ["staging"],
-        "cost": {"gcp": 210, "aws": 260, "azure": 245},
+        "skus": {"gcp": "g2-standard-4", "aws": "g4dn.xlarge", "azure": "Standard_NC4as_T4_v3"},
     },
 
     # ⛔ AUTO-STOPPED
@@ -64,7 +117,7 @@ COMPUTE_RESOURCES = [
         "idle_minutes": 90,
         "state": "stopped",
         "tags": ["batch"],
-        "cost": {"gcp": 92, "aws": 108, "azure": 101},
+        "skus": {"gcp": "e2-standard-2", "aws": "t3.large", "azure": "Standard_B2ms"},
     },
 
     # ✋ APPROVAL REQUIRED
@@ -76,7 +129,7 @@ COMPUTE_RESOURCES = [
         "idle_minutes": 85,
         "state": "running",
         "tags": ["finance"],
-        "cost": {"gcp": 310, "aws": 355, "azure": 342},
+        "skus": {"gcp": "c2-standard-8", "aws": "c5.2xlarge", "azure": "Standard_F8s_v2"},
     },
 
     # 🔒 NEVER STOP
@@ -88,56 +141,96 @@ COMPUTE_RESOURCES = [
         "idle_minutes": 120,
         "state": "running",
         "tags": ["never-stop", "core"],
-        "cost": {"gcp": 520, "aws": 610, "azure": 590},
+        "skus": {"gcp": "c2-standard-16", "aws": "c5.4xlarge", "azure": "Standard_F16s_v2"},
     },
 ]
 
 # --------------------------------
 # POLICY LOGIC
 # --------------------------------
-def has_never_stop(resource):
-    return any(
-        tag in POLICY["never_stop_tags"]
-        for tag in resource.get("tags", [])
-    )
-
-def requires_approval(resource):
-    return any(
-        tag in POLICY["require_approval_for"]
-        for tag in resource.get("tags", [])
-    )
+POLICY_ENGINE = PolicyEngine(policies_from_config(POLICY), metrics=REGISTRY)
+
+# Engine decision -> policy_status reported to clients
+POLICY_STATUS = {
+    Decision.NEVER_STOP: "never-stop",
+    Decision.APPROVAL_REQUIRED: "approval-required",
+    Decision.AUTO_STOP: "auto-stopped",
+    Decision.WARN: "warning",
+    Decision.SKIP: "healthy",
+}
+
+def engine_view(resource):
+    """
+    The resource in PolicyEngine's field names
+    (cpu -> cpu_utilization, idle_minutes -> idle_hours).
+    """
+    return {
+        "name": resource["id"],
+        "tags": resource.get("tags", []),
+        "cpu_utilization": resource["cpu"],
+        "idle_hours": resource["idle_minutes"] / 60,
+        "state": resource["state"],
+    }
 
 def evaluate_resource(resource):
+    """
+    Runs the shared PolicyEngine and maps its decision to a policy_status.
+    Returns (status, engine result).
+    """
+    result = POLICY_ENGINE.evaluate(engine_view(resource))
+    decision = result["decision"]
+
     # 🔒 NEVER STOP OVERRIDES EVERYTHING
-    if has_never_stop(resource):
-        return "never-stop"
+    if decision == Decision.NEVER_STOP:
+        return POLICY_STATUS[decision], result
 
     if resource["state"] == "stopped":
-        return "auto-stopped"
+        return "auto-stopped", result
 
-    if resource["cpu"] > POLICY["cpu_idle_threshold"]:
-        return "healthy"
-
-    if resource["idle_minutes"] >= POLICY["idle_stop_minutes"]:
-        if requires_approval(resource):
-            return "approval-required"
+    if decision == Decision.AUTO_STOP:
         resource["state"] = "stopped"
-        return "auto-stopped"
 
-    if resource["idle_minutes"] >= POLICY["idle_warn_minutes"]:
-        return "warning"
+    return POLICY_STATUS[decision], result
 
-    return "healthy"
+def resource_costs(resource):
+    """
+    Monthly (24x7) cost per provider, resolved through the pricing catalog.
+    Unknown SKUs are reported as None rather than guessed.
+    """
+    costs = {}
+    for provider, machine_type in resource["skus"].items():
+        try:
+            costs[provider] = estimate_monthly_cost(
+                machine_type,
+                24,
+                provider=provider,
+                region=PROVIDER_REGIONS[provider],
+            )
+        except UnknownSKUError:
+            costs[provider] = None
+    return costs
 
 # --------------------------------
 # LIST RESOURCES
 # --------------------------------
+# Versions start at the process start time (ms), so clients that synced
+# with an earlier process fall below the log and resync in full
+CHANGE_LOG = ChangeLog(capacity=1000, start=time.time_ns() // 1_000_000)
+
 @app.get("/resources")
-def list_resources():
+def list_resources(since: Optional[int] = None):
+    """
+    Full resource list, or with `since=<version>` only the resources
+    added, changed or removed after that version.
+    """
+    with observe_request("/resources"):
+        return _list_resources(since)
+
+def _list_resources(since: Optional[int] = None):
     response = []
 
     for r in COMPUTE_RESOURCES:
-        status = evaluate_resource(r)
+        status, _ = evaluate_resource(r)
 
         response.append({
             "id": r["id"],
@@ -148,33 +241,115 @@ def list_resources():
             "state": r["state"],
             "policy_status": status,
             "tags": r["tags"],
-            "cost": r["cost"],
+            "cost": resource_costs(r),
         })
 
+    version = CHANGE_LOG.update({item["id"]: item for item in response})
+    timestamp = datetime.utcnow().isoformat()
+
+    if since is not None:
+        delta = CHANGE_LOG.changes_since(since)
+        if delta is not None:
+            return {"version": version, "since": since, "timestamp": timestamp, **delta}
+
     return {
         "policy": POLICY,
-        "timestamp": datetime.utcnow().isoformat(),
+        "version": version,
+        "timestamp": timestamp,
+        # Tells a delta client to replace its local copy
+        "full_resync": since is not None,
         "resources": response,
     }
 
 # --------------------------------
 # APPROVE & STOP
 # --------------------------------
+# Real stops stay behind the executor's gates (dry run by default)
+EXECUTOR = GCPExecutor(metrics=REGISTRY)
+
+# Executor outcomes after which the VM counts as stopped
+STOPPED_OUTCOMES = ("success", "dry-run")
+
 @app.post("/resources/{resource_id}/approve-stop")
 def approve_stop(resource_id: str):
+    with observe_request("/resources/{resource_id}/approve-stop"):
+        return _approve_stop(resource_id)
+
+def _approve_stop(resource_id: str):
     for r in COMPUTE_RESOURCES:
         if r["id"] == resource_id:
-            if has_never_stop(r):
+            status, _ = evaluate_resource(r)
+            if status == "never-stop":
                 raise HTTPException(
                     status_code=403,
                     detail="This VM has a never-stop policy"
                 )
 
+            execution = EXECUTOR.execute({
+                "resource_name": r["id"],
+                "decision": Decision.AUTO_STOP,
+            })
+
+            if execution not in STOPPED_OUTCOMES:
+                return {
+                    "message": f"VM not stopped: execution {execution}",
+                    "id": r["id"],
+                    "state": r["state"],
+                    "execution": execution,
+                }
+
             r["state"] = "stopped"
             return {
                 "message": "VM stopped after user approval",
                 "id": r["id"],
                 "state": r["state"],
+                "execution": execution,
             }
 
     raise HTTPException(status_code=404, detail="Resource not found")
+
+# --------------------------------
+# CHAT (STREAMING)
+# --------------------------------
+CHATBOT = GeminiChatbot()
+
+_decision_index = {"key": None, "index": None}
+
+def current_decision_index():
+    """
+    Decision index over the current resource view, rebuilt only when a
+    resource's status changes (so cached answers survive otherwise).
+    Resources carry tags but no environment, so records have none.
+    """
+    evaluated = [(r, *evaluate_resource(r)) for r in COMPUTE_RESOURCES]
+    key = tuple((r["id"], status, r["state"]) for r, status, _ in evaluated)
+
+    if _decision_index["key"] != key:
+        records = [
+            {
+                "name": r["id"],
+                "tags": r["tags"],
+                "decision": result["decision"],
+                "reason": f"{result['reason']} "
+                          f"(status {status}, CPU {r['cpu']}%, idle {r['idle_minutes']} min)",
+                "savings": (
+                    resource_costs(r).get("gcp") or 0.0
+                    if result["decision"] == Decision.AUTO_STOP else 0.0
+                ),
+            }
+            for r, status, result in evaluated
+        ]
+        _decision_index["key"] = key
+        _decision_index["index"] = DecisionIndex(records)
+
+    return _decision_index["index"]
+
+@app.get("/chat/stream")
+def chat_stream(q: str, session_id: str = "default", timeout: Optional[float] = None):
+    """
+    Streams the assistant's answer as plain text chunks.
+    A new question with the same session_id cancels the previous answer.
+    """
+    CHATBOT.set_decisions(current_decision_index())
+    stream = CHATBOT.stream_answer(q, session=session_id, timeout=timeout)
+    return StreamingResponse(stream, media_type="text/plain; charset=utf-8")
@@ -0,0 +1 @@
+from .harness import Benchmark, run_benchmark, compare, format_results
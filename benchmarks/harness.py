@@ -0,0 +1,181 @@
+"""
+Benchmark harness
+Timing, memory and baseline comparison for the benchmark suite
+
+Each benchmark times a sequence of operations individually, so results
+carry a latency distribution (p50 / p99) as well as throughput. Like
+timeit, the sequence is repeated and throughput comes from the fastest
+round, which filters out interference from other processes; p99 is the
+median of the rounds' p99, since a single round's tail is mostly noise.
+Benchmarks that stay noisy anyway (e.g. through an HTTP stack) can ask
+for more warmup and rounds. Noise that lasts a whole process is handled
+by the runner, which repeats the suite and keeps the median of each
+metric. Peak memory is measured in a separate pass under tracemalloc, because tracing
+slows Python code down too much to time it at the same time.
+"""
+
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+# Metrics compared against the baseline, and the direction that is worse
+REGRESSION_METRICS = {
+    "throughput": "lower",
+    "p99_ms": "higher",
+    "peak_memory_mb": "higher",
+}
+
+# Tail latency is noisier than the median, so it gets a wider allowance
+THRESHOLD_SCALE = {
+    "p99_ms": 2.0,
+}
+
+# Differences below these absolute amounts are treated as noise
+NOISE_FLOOR = {
+    "p99_ms": 0.05,
+    "peak_memory_mb": 1.0,
+}
+
+
+@dataclass
+class Benchmark:
+    """
+    setup() builds the state once; op(state, i) is the timed operation.
+    """
+    name: str
+    setup: Callable[[], Any]
+    op: Callable[[Any, int], Any]
+    ops: int
+    items_per_op: int = 1
+    warmup: int = 1
+    memory_ops: int = 20
+    # Minimum timing rounds, whatever the runner asks for
+    min_rounds: int = 1
+
+
+def _time_ops(benchmark: Benchmark, state) -> np.ndarray:
+    timings = np.empty(benchmark.ops)
+    for i in range(benchmark.ops):
+        t0 = time.perf_counter()
+        benchmark.op(state, i)
+        timings[i] = time.perf_counter() - t0
+    return timings
+
+
+def run_benchmark(benchmark: Benchmark, rounds: int = 3) -> Dict[str, float]:
+    """
+    Runs one benchmark: throughput and p50 of its fastest round, p99 as
+    the median over rounds.
+    """
+    state = benchmark.setup()
+    for i in range(benchmark.warmup):
+        benchmark.op(state, i)
+
+    timings = None
+    round_p99 = []
+    for _ in range(max(rounds, benchmark.min_rounds, 1)):
+        gc.collect()
+        current = _time_ops(benchmark, state)
+        round_p99.append(np.percentile(current * 1000, 99))
+        if timings is None or np.median(current) < np.median(timings):
+            timings = current
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for i in range(min(benchmark.ops, benchmark.memory_ops)):
+            benchmark.op(state, i)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del state
+    gc.collect()
+
+    # Throughput from the median op, so one stalled op does not skew it
+    p50 = np.percentile(timings * 1000, 50)
+    p99 = max(np.median(round_p99), p50)
+    return {
+        "ops": benchmark.ops,
+        "items": benchmark.ops * benchmark.items_per_op,
+        "throughput": round(benchmark.items_per_op / (p50 / 1000), 2),
+        "p50_ms": round(float(p50), 4),
+        "p99_ms": round(float(p99), 4),
+        "peak_memory_mb": round(peak / 2**20, 3),
+    }
+
+
+def median_results(runs: List[Dict[str, float]]) -> Dict[str, float]:
+    """
+    Per-metric median of several runs of one benchmark.
+    """
+    merged = {}
+    for metric, first in runs[0].items():
+        value = float(np.median([run[metric] for run in runs]))
+        merged[metric] = type(first)(value) if isinstance(first, int) else round(value, 4)
+    return merged
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float = 0.25,
+) -> List[dict]:
+    """
+    Regressions of `results` against `baseline`.
+
+    A metric regresses when it is worse than the baseline by more than
+    `threshold` (a fraction, 0.25 = 25%; doubled for p99). Benchmarks
+    missing from the baseline are never regressions.
+    """
+    regressions = []
+
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+
+        for metric, worse in REGRESSION_METRICS.items():
+            old, new = reference.get(metric), current.get(metric)
+            if old is None or new is None or old <= 0:
+                continue
+            if abs(new - old) < NOISE_FLOOR.get(metric, 0.0):
+                continue
+
+            change = (new - old) / old
+            allowed = threshold * THRESHOLD_SCALE.get(metric, 1.0)
+            if (worse == "lower" and change < -allowed) or (worse == "higher" and change > allowed):
+                regressions.append({
+                    "benchmark": name,
+                    "metric": metric,
+                    "baseline": old,
+                    "current": new,
+                    "change": round(change, 4),
+                })
+
+    return regressions
+
+
+def format_results(
+    results: Dict[str, Dict[str, float]],
+    baseline: Optional[Dict[str, Dict[str, float]]] = None,
+) -> str:
+    """
+    Plain-text table of results, with the change in throughput versus baseline.
+    """
+    baseline = baseline or {}
+    lines = [
+        f"{'benchmark':<34} {'items/s':>14} {'p50 ms':>10} {'p99 ms':>10} {'peak MB':>9} {'vs base':>8}"
+    ]
+    for name, r in results.items():
+        reference = baseline.get(name, {}).get("throughput")
+        delta = f"{(r['throughput'] - reference) / reference:+.0%}" if reference else "new"
+        lines.append(
+            f"{name:<34} {r['throughput']:>14,.0f} {r['p50_ms']:>10.3f} "
+            f"{r['p99_ms']:>10.3f} {r['peak_memory_mb']:>9.2f} {delta:>8}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,120 @@
+"""
+Benchmark runner
+Runs the suite, writes a results file and gates on regressions
+
+Usage:
+    python -m benchmarks.run                       # run all, compare to baseline
+    python -m benchmarks.run --only policy_engine  # subset by name
+    python -m benchmarks.run --threshold 0.4       # allow 40% drift
+    python -m benchmarks.run --update-baseline     # accept current numbers
+    python -m benchmarks.run --repeat 5            # median of 5 suite passes
+
+Exits with status 1 when any benchmark regresses beyond the threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import datetime
+
+from benchmarks.harness import compare, format_results, median_results, run_benchmark
+from benchmarks.suites import all_benchmarks
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+DEFAULT_OUTPUT = os.path.join(HERE, "results.json")
+
+
+def _load_baseline(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f).get("results", {})
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run benchmarks with regression gates")
+    parser.add_argument("--only", action="append", default=[],
+                        help="Run benchmarks whose name contains this text (repeatable)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--threshold", type=float,
+                        default=float(os.getenv("BENCHMARK_THRESHOLD", "0.25")),
+                        help="Allowed relative regression (0.25 = 25%%)")
+    parser.add_argument("--rounds", type=int, default=5,
+                        help="Timing rounds per benchmark; the fastest is kept")
+    parser.add_argument("--repeat", type=int,
+                        default=int(os.getenv("BENCHMARK_REPEAT", "5")),
+                        help="Suite passes; each metric is the median across them")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Write these results as the new baseline")
+    args = parser.parse_args(argv)
+
+    benchmarks = [
+        b for b in all_benchmarks()
+        if not args.only or any(text in b.name for text in args.only)
+    ]
+
+    # Passes interleave the benchmarks, so a slow spell on the machine
+    # hits one pass of several benchmarks rather than every pass of one
+    runs, skipped = {}, {}
+    for n in range(1, max(args.repeat, 1) + 1):
+        for benchmark in benchmarks:
+            if benchmark.name in skipped:
+                continue
+            print(f"Running {benchmark.name} (pass {n}/{args.repeat}) ...", flush=True)
+            try:
+                runs.setdefault(benchmark.name, []).append(run_benchmark(benchmark, rounds=args.rounds))
+            except ImportError as exc:
+                # Optional dependency missing (e.g. fastapi for the API benchmark)
+                skipped[benchmark.name] = str(exc)
+                print(f"  skipped: {exc}")
+
+    results = {name: median_results(r) for name, r in runs.items()}
+
+    baseline = _load_baseline(args.baseline)
+    regressions = compare(results, baseline, args.threshold)
+
+    report = {
+        "timestamp": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "threshold": args.threshold,
+        "rounds": args.rounds,
+        "repeat": args.repeat,
+        "results": results,
+        "skipped": skipped,
+        "regressions": regressions,
+    }
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    print()
+    print(format_results(results, baseline))
+    print(f"\nResults written to {args.output}")
+
+    if args.update_baseline:
+        merged = {**baseline, **results}
+        with open(args.baseline, "w") as f:
+            json.dump({**report, "results": merged, "regressions": []}, f, indent=2)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for r in regressions:
+            print(
+                f"  {r['benchmark']} {r['metric']}: "
+                f"{r['baseline']} -> {r['current']} ({r['change']:+.0%})"
+            )
+        return 1
+
+    print("\n✅ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,260 @@
+"""
+Benchmark suites
+Hot paths covered by the regression gate
+
+- policy engine: PolicyEngine.evaluate over whole 1k / 100k / 1M VM
+  fleets, and the vectorized engine at 1M
+- API: GET /resources through the ASGI test client
+- cost: fleet_cost and the scalar CostModel
+- JSON: loading VM snapshots from disk and from memory
+"""
+
+import json
+import os
+import tempfile
+from typing import List
+
+import numpy as np
+
+from benchmarks.harness import Benchmark
+
+
+def _policies():
+    from policies.vm_policies import (
+        NeverStopProdPolicy,
+        NeverStopTaggedPolicy,
+        StopIdleVMPolicy,
+    )
+    return [NeverStopProdPolicy(), NeverStopTaggedPolicy(), StopIdleVMPolicy()]
+
+
+def _policy_records(count: int) -> List[dict]:
+    """
+    Minimal VM dicts (only the fields policies read), built straight from
+    fleet columns so the 1M case fits comfortably in memory.
+    """
+    from data.synthetic_fleet import ENVIRONMENTS, TAGS, generate_fleet
+
+    fleet = generate_fleet(count, seed=0)
+    cpu, idle = fleet.snapshot()
+
+    # One shared list per tag combination
+    tag_lists = {
+        mask: [tag for bit, tag in enumerate(TAGS) if mask >> bit & 1]
+        for mask in np.unique(fleet.tags).tolist()
+    }
+
+    return [
+        {
+            "name": f"vm-{i}",
+            "environment": ENVIRONMENTS[env],
+            "tags": tag_lists[tags],
+            "cpu_utilization": c,
+            "idle_hours": h,
+        }
+        for i, (env, tags, c, h) in enumerate(zip(
+            fleet.environment.tolist(), fleet.tags.tolist(), cpu.tolist(), idle.tolist()
+        ))
+    ]
+
+
+# --------------------------------
+# Policy engine
+# --------------------------------
+def _policy_engine(count: int) -> Benchmark:
+    def setup():
+        from engine.policy_engine import PolicyEngine
+        return PolicyEngine(_policies()), _policy_records(count)
+
+    def op(state, i):
+        engine, vms = state
+        return [engine.evaluate(vm) for vm in vms]
+
+    # Each op evaluates the whole fleet: more ops for small fleets, so a
+    # round lasts long enough for the fastest one to miss slow spells
+    return Benchmark(
+        name=f"policy_engine.evaluate_{_label(count)}",
+        setup=setup,
+        op=op,
+        ops=max(2, min(200, 500_000 // count)),
+        items_per_op=count,
+        warmup=1 if count > 100_000 else 3,
+        memory_ops=1,
+    )
+
+
+def _vectorized_engine(count: int) -> Benchmark:
+    def setup():
+        from data.synthetic_fleet import generate_fleet
+        from engine.vectorized import VectorizedPolicyEngine
+
+        fleet = generate_fleet(count, seed=0)
+        cpu, idle = fleet.snapshot()
+        return VectorizedPolicyEngine(_policies()), fleet, cpu, idle
+
+    def op(state, i):
+        engine, fleet, cpu, idle = state
+        return engine.stop_mask(cpu, idle, engine.protected(fleet))
+
+    return Benchmark(
+        name=f"vectorized_engine.stop_mask_{_label(count)}",
+        setup=setup,
+        op=op,
+        ops=20,
+        items_per_op=count,
+    )
+
+
+# --------------------------------
+# API
+# --------------------------------
+def _api_list_resources() -> Benchmark:
+    def setup():
+        from fastapi.testclient import TestClient
+
+        import api
+        return TestClient(api.app)
+
+    def op(client, i):
+        response = client.get("/resources")
+        response.raise_for_status()
+        return response
+
+    # The HTTP stack (TestClient, event loop thread) is noisy: warm it up
+    # well and time more rounds
+    return Benchmark(
+        name="api.list_resources",
+        setup=setup,
+        op=op,
+        ops=200,
+        warmup=100,
+        min_rounds=9,
+    )
+
+
+# --------------------------------
+# Cost
+# --------------------------------
+def _fleet_cost(count: int) -> Benchmark:
+    def setup():
+        from data.synthetic_fleet import generate_fleet
+        from engine.vectorized import VectorizedPolicyEngine
+
+        vms = generate_fleet(count, seed=0).records()
+        return vms, VectorizedPolicyEngine(_policies()).evaluate(vms)
+
+    def op(state, i):
+        from cost.fleet_cost import fleet_cost
+
+        vms, stop = state
+        return fleet_cost(vms, stop)
+
+    return Benchmark(
+        name=f"cost.fleet_cost_{_label(count)}",
+        setup=setup,
+        op=op,
+        ops=10,
+        items_per_op=count,
+    )
+
+
+def _cost_model_scalar(count: int) -> Benchmark:
+    def setup():
+        from data.synthetic_fleet import generate_fleet
+        return generate_fleet(count, seed=0).records()
+
+    def op(vms, i):
+        from cost.cost_model import CostModel
+
+        total = 0.0
+        for vm in vms:
+            model = CostModel(hourly_cost=vm["hourly_cost"])
+            total += model.monthly() + model.cost_leakage(vm["idle_hours"])
+        return total
+
+    # Whole fleet per op, like cost.fleet_cost, so the two compare directly
+    return Benchmark(
+        name=f"cost.cost_model_scalar_{_label(count)}",
+        setup=setup,
+        op=op,
+        ops=20,
+        items_per_op=count,
+        memory_ops=1,
+    )
+
+
+# --------------------------------
+# JSON
+# --------------------------------
+def _json_load_file(count: int) -> Benchmark:
+    def setup():
+        from data.synthetic_fleet import generate_fleet
+
+        fd, path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(fd, "w") as f:
+            json.dump(generate_fleet(count, seed=0).records(), f)
+        return _TempFile(path)
+
+    def op(temp, i):
+        with open(temp.path, "r") as f:
+            return json.load(f)
+
+    return Benchmark(
+        name=f"json.load_file_{_label(count)}",
+        setup=setup,
+        op=op,
+        ops=20,
+        items_per_op=count,
+        memory_ops=3,
+    )
+
+
+def _json_loads(count: int) -> Benchmark:
+    def setup():
+        from data.synthetic_fleet import generate_fleet
+        return json.dumps(generate_fleet(count, seed=0).records()).encode("utf-8")
+
+    return Benchmark(
+        name=f"json.loads_{_label(count)}",
+        setup=setup,
+        op=lambda payload, i: json.loads(payload),
+        ops=5,
+        items_per_op=count,
+        memory_ops=2,
+    )
+
+
+class _TempFile:
+    """
+    Deletes the file when the benchmark state is released.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def __del__(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+def _label(count: int) -> str:
+    for size, suffix in ((1_000_000, "m"), (1_000, "k")):
+        if count >= size and count % size == 0:
+            return f"{count // size}{suffix}"
+    return str(count)
+
+
+def all_benchmarks() -> List[Benchmark]:
+    return [
+        _policy_engine(1_000),
+        _policy_engine(100_000),
+        _policy_engine(1_000_000),
+        _vectorized_engine(1_000_000),
+        _api_list_resources(),
+        _fleet_cost(100_000),
+        _cost_model_scalar(100_000),
+        _json_load_file(10_000),
+        _json_loads(100_000),
+    ]
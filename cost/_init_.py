@@ -1 +1,5 @@
 from .cost_model import CostModel
+from .fleet_cost import FleetCostModel, FleetCost, fleet_cost
+from .forecast import SavingsForecaster, SavingsForecast
+from .pricing_catalog import PricingCatalog, SkuPrice, UnknownSKUError, get_catalog
+from .rollups import CostRollup
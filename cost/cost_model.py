@@ -1,3 +1,7 @@
+# Group key for VMs with no environment or owner recorded
+UNASSIGNED = "unassigned"
+
+
 class CostModel:
     """
     Simple, explainable cost model for VMs.
@@ -30,6 +34,12 @@ class CostModel:
         """
         return self.daily() * 30
 
+    def cost_for_hours(self, hours: float) -> float:
+        """
+        Cost of running the VM for the given hours.
+        """
+        return self.hourly_cost * hours
+
     def cost_leakage(self, hours_idle: int) -> float:
         """
         Cost leaked if VM stays idle for given hours.
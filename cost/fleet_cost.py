@@ -0,0 +1,163 @@
+"""
+Fleet cost model
+Vectorized counterpart of CostModel for whole fleets (NumPy)
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from cost.cost_model import UNASSIGNED
+
+AUTO_STOP = "AUTO-STOP"
+
+
+@dataclass
+class FleetCost:
+    """
+    Per-VM cost arrays plus pre-aggregated totals.
+
+    Group breakdowns map a group key to
+    {"monthly_cost": float, "leakage": float, "savings": float}.
+    """
+    monthly: np.ndarray
+    leakage: np.ndarray
+    savings: np.ndarray
+    totals: Dict[str, float]
+    by_environment: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    by_tag: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+
+def _stop_mask(decisions) -> np.ndarray:
+    """
+    Accepts a boolean stop mask, Decision enums or raw decision strings.
+    """
+    if isinstance(decisions, np.ndarray) and decisions.dtype == bool:
+        return decisions
+
+    return np.fromiter(
+        (getattr(d, "value", d) == AUTO_STOP for d in decisions),
+        dtype=bool,
+        count=len(decisions),
+    )
+
+
+def _group_totals(keys, index, monthly, leakage, savings) -> Dict[str, Dict[str, float]]:
+    """
+    Sums the three cost arrays per group in a single bincount pass each.
+    `keys` are the group labels, `index` maps every row to its VM; a VM
+    listed twice under the same label counts once.
+    """
+    if len(keys) == 0:
+        return {}
+
+    labels, inverse = np.unique(np.asarray(keys, dtype=object).astype(str), return_inverse=True)
+    size = len(labels)
+
+    _, first = np.unique(index * size + inverse, return_index=True)
+    if len(first) < len(inverse):
+        index, inverse = index[first], inverse[first]
+
+    sums = {
+        "monthly_cost": np.bincount(inverse, weights=monthly[index], minlength=size),
+        "leakage": np.bincount(inverse, weights=leakage[index], minlength=size),
+        "savings": np.bincount(inverse, weights=savings[index], minlength=size),
+    }
+
+    return {
+        str(label): {metric: round(float(values[i]), 2) for metric, values in sums.items()}
+        for i, label in enumerate(labels)
+    }
+
+
+class FleetCostModel:
+    """
+    Vectorized cost model for a fleet of VMs.
+
+    Uses the same arithmetic as CostModel (24h days, 30-day months),
+    so per-VM values match the scalar model exactly.
+    """
+
+    def __init__(self, hourly_costs: Sequence[float]):
+        """
+        :param hourly_costs: Cost per hour for every VM in the fleet
+        """
+        self.hourly_costs = np.asarray(hourly_costs, dtype=np.float64)
+
+    def hourly(self) -> np.ndarray:
+        return self.hourly_costs
+
+    def daily(self) -> np.ndarray:
+        return self.hourly_costs * 24
+
+    def monthly(self) -> np.ndarray:
+        return self.daily() * 30
+
+    def cost_for_hours(self, hours: Sequence[float]) -> np.ndarray:
+        return self.hourly_costs * np.asarray(hours, dtype=np.float64)
+
+    def cost_leakage(self, hours_idle: Sequence[float]) -> np.ndarray:
+        return self.hourly_costs * np.asarray(hours_idle, dtype=np.float64)
+
+    def prevented_savings(self, decisions) -> np.ndarray:
+        return np.where(_stop_mask(decisions), self.monthly(), 0.0)
+
+    def evaluate(
+        self,
+        hours_idle: Sequence[float],
+        decisions,
+        environments: Optional[Sequence[str]] = None,
+        tags: Optional[Sequence[List[str]]] = None,
+    ) -> FleetCost:
+        """
+        Computes monthly cost, leakage and prevented savings for every VM,
+        fleet totals and optional environment / tag breakdowns.
+        """
+        monthly = self.monthly()
+        leakage = self.cost_leakage(hours_idle)
+        savings = self.prevented_savings(decisions)
+
+        totals = {
+            "monthly_cost": round(float(monthly.sum()), 2),
+            "leakage": round(float(leakage.sum()), 2),
+            "savings": round(float(savings.sum()), 2),
+        }
+
+        by_environment = {}
+        if environments is not None:
+            by_environment = _group_totals(
+                environments, np.arange(len(monthly)), monthly, leakage, savings
+            )
+
+        by_tag = {}
+        if tags is not None:
+            lengths = np.fromiter((len(t) for t in tags), dtype=np.int64, count=len(tags))
+            flat_tags = [tag for vm_tags in tags for tag in vm_tags]
+            by_tag = _group_totals(
+                flat_tags, np.repeat(np.arange(len(tags)), lengths), monthly, leakage, savings
+            )
+
+        return FleetCost(
+            monthly=monthly,
+            leakage=leakage,
+            savings=savings,
+            totals=totals,
+            by_environment=by_environment,
+            by_tag=by_tag,
+        )
+
+
+def fleet_cost(vms: List[dict], decisions) -> FleetCost:
+    """
+    Convenience wrapper for the VM dicts used across the project
+    (hourly_cost, idle_hours, environment, tags).
+    """
+    model = FleetCostModel([vm["hourly_cost"] for vm in vms])
+
+    return model.evaluate(
+        [vm.get("idle_hours", 0) for vm in vms],
+        decisions,
+        environments=[vm.get("environment") or UNASSIGNED for vm in vms],
+        tags=[vm.get("tags", []) for vm in vms],
+    )
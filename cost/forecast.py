@@ -0,0 +1,319 @@
+"""
+Savings forecast
+Monte Carlo forecast of auto-hibernation savings (NumPy)
+
+Each VM alternates between idle and active runs whose lengths are modelled
+as exponential distributions fitted to its utilization history. A path is
+sampled at the level of runs rather than hours:
+
+- the current idle run (memoryless residual),
+- the idle runs starting within the horizon that outlast the policy's idle
+  threshold (a thinned Poisson count),
+- how long the VM then stays hibernated (a Gamma-distributed sum).
+
+All three have closed forms under the exponential model, so a path costs
+O(1) draws regardless of horizon length and a whole fleet is sampled in a
+few vectorized calls per chunk.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from policies.vm_policies import StopIdleVMPolicy
+
+PERCENTILES = (10, 50, 90)
+
+# Probability below which an idle run is treated as never reaching the threshold
+_NEGLIGIBLE = 1e-9
+
+
+@dataclass
+class SavingsForecast:
+    """
+    Per-VM and fleet savings percentiles (INR over the horizon).
+    """
+    names: List[str]
+    p10: np.ndarray
+    p50: np.ndarray
+    p90: np.ndarray
+    mean: np.ndarray
+    fleet: Dict[str, float]
+    paths: int
+    horizon_hours: int
+
+    def for_vm(self, index: int) -> Dict[str, float]:
+        return {
+            "p10": float(self.p10[index]),
+            "p50": float(self.p50[index]),
+            "p90": float(self.p90[index]),
+            "mean": float(self.mean[index]),
+        }
+
+
+def _cpu_series(history) -> np.ndarray:
+    return np.fromiter(
+        (s["cpu_utilization"] if isinstance(s, dict) else s for s in history),
+        dtype=np.float64,
+    )
+
+
+def _mean_run_lengths(idle: np.ndarray):
+    """
+    Mean idle / active run length (hours) of a boolean hourly series.
+    """
+    if len(idle) == 0:
+        return None, None
+
+    boundaries = np.flatnonzero(idle[1:] != idle[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    lengths = np.diff(np.concatenate((starts, [len(idle)])))
+    run_is_idle = idle[starts]
+
+    idle_runs = lengths[run_is_idle]
+    active_runs = lengths[~run_is_idle]
+
+    mean_idle = float(idle_runs.mean()) if len(idle_runs) else None
+    mean_active = float(active_runs.mean()) if len(active_runs) else None
+    return mean_idle, mean_active
+
+
+class SavingsForecaster:
+    """
+    Vectorized Monte Carlo forecaster for hibernation savings.
+    """
+
+    def __init__(
+        self,
+        cpu_threshold: float = 5.0,
+        idle_hours: int = 24,
+        horizon_hours: int = 720,
+        paths: int = 1000,
+        default_active_hours: float = 8.0,
+        guards: Optional[list] = None,
+        seed: Optional[int] = None,
+        workers: int = 1,
+        chunk_elements: int = 4_000_000,
+    ):
+        """
+        :param cpu_threshold: CPU % below which an hour counts as idle
+        :param idle_hours: Idle hours before the policy stops a VM
+        :param horizon_hours: Forecast horizon (default 30 days)
+        :param paths: Simulated paths per VM
+        :param default_active_hours: Mean active run when a VM has no history
+        :param guards: Policies that can veto a stop (e.g. NeverStopProdPolicy)
+        :param seed: Seed for reproducible forecasts
+        :param workers: Threads used to sample chunks in parallel
+        :param chunk_elements: Upper bound on VMs x paths sampled at once
+        """
+        self.cpu_threshold = cpu_threshold
+        self.idle_hours = idle_hours
+        self.horizon_hours = horizon_hours
+        self.paths = paths
+        self.default_active_hours = default_active_hours
+        self.guards = guards or []
+        self.seed = seed
+        self.workers = workers
+        self.chunk_elements = chunk_elements
+
+    @classmethod
+    def from_policies(cls, policies: list, **kwargs) -> "SavingsForecaster":
+        """
+        Uses the thresholds of the active StopIdleVMPolicy and treats every
+        other policy as a guard that can veto stopping.
+        """
+        idle_policy = next((p for p in policies if isinstance(p, StopIdleVMPolicy)), None)
+        guards = [p for p in policies if not isinstance(p, StopIdleVMPolicy)]
+
+        if idle_policy is not None:
+            kwargs.setdefault("cpu_threshold", idle_policy.cpu_threshold)
+            kwargs.setdefault("idle_hours", idle_policy.idle_hours)
+
+        return cls(guards=guards, **kwargs)
+
+    # --------------------------------
+    # Model fitting
+    # --------------------------------
+    def _is_protected(self, vm: dict) -> bool:
+        for policy in self.guards:
+            result = policy.evaluate(vm)
+            if result is not None and result.allowed is False:
+                return True
+        return False
+
+    def _fit(self, vms: List[dict]):
+        n = len(vms)
+        mean_idle = np.empty(n)
+        mean_active = np.empty(n)
+        idle_now = np.empty(n, dtype=bool)
+        elapsed = np.empty(n)
+        hourly = np.empty(n)
+        protected = np.empty(n, dtype=bool)
+
+        for i, vm in enumerate(vms):
+            cpu_now = vm.get("cpu_utilization", 100)
+            idle_now[i] = cpu_now < self.cpu_threshold
+            elapsed[i] = vm.get("idle_hours", 0) if idle_now[i] else 0
+            hourly[i] = vm.get("hourly_cost", 0.0)
+            protected[i] = self._is_protected(vm)
+
+            m_idle, m_active = None, None
+            history = vm.get("utilization_history")
+            if history:
+                m_idle, m_active = _mean_run_lengths(_cpu_series(history) < self.cpu_threshold)
+
+            # Without history the current idle streak is the only sample we have
+            mean_idle[i] = max(m_idle or elapsed[i], 1.0)
+            mean_active[i] = max(m_active or self.default_active_hours, 1.0)
+
+        return mean_idle, mean_active, idle_now, elapsed, hourly, protected
+
+    # --------------------------------
+    # Sampling
+    # --------------------------------
+    def _sample_hours(self, rng, mean_idle, mean_active, idle_now, elapsed) -> np.ndarray:
+        """
+        Hibernated hours per (VM, path) within the horizon.
+        """
+        shape = (len(mean_idle), self.paths)
+        horizon = float(self.horizon_hours)
+        hours = np.zeros(shape)
+
+        # Current idle run: memoryless residual, threshold counts hours already idle
+        rows = np.flatnonzero(idle_now)
+        if len(rows):
+            residual = rng.exponential(1.0, size=(len(rows), self.paths)) * mean_idle[rows, None]
+            wait_now = np.maximum(self.idle_hours - elapsed[rows], 0)[:, None]
+            hours[rows] = np.maximum(residual - wait_now, 0)
+
+        # Future idle runs outlasting the threshold, and how long each stays stopped
+        outlast = np.exp(-self.idle_hours / mean_idle)
+        rate = horizon / (mean_idle + mean_active) * outlast
+        stops = rng.poisson(np.broadcast_to(rate[:, None], shape))
+
+        stopped = stops > 0
+        if stopped.any():
+            scale = np.broadcast_to(mean_idle[:, None], shape)
+            hours[stopped] += rng.gamma(stops[stopped], scale[stopped])
+
+        return np.minimum(hours, horizon, out=hours)
+
+    def _forecast_chunk(self, seed_seq, mean_idle, mean_active, idle_now, elapsed, hourly, protected):
+        rng = np.random.default_rng(seed_seq)
+        n = len(mean_idle)
+
+        p10, p50, p90, mean = (np.zeros(n) for _ in range(4))
+        fleet_paths = np.zeros(self.paths)
+
+        # Protected VMs and VMs that practically never idle past the
+        # threshold save nothing; skip sampling them entirely.
+        outlast = np.exp(-self.idle_hours / mean_idle)
+        can_save = ~protected & (idle_now | (outlast > _NEGLIGIBLE)) & (hourly > 0)
+        rows = np.flatnonzero(can_save)
+        if len(rows) == 0:
+            return p10, p50, p90, mean, fleet_paths
+
+        hours = self._sample_hours(
+            rng, mean_idle[rows], mean_active[rows], idle_now[rows], elapsed[rows]
+        )
+        savings = hours * hourly[rows, None]
+
+        p10[rows], p50[rows], p90[rows] = np.percentile(savings, PERCENTILES, axis=1)
+        mean[rows] = savings.mean(axis=1)
+        fleet_paths += savings.sum(axis=0)
+
+        return p10, p50, p90, mean, fleet_paths
+
+    def cumulative(self, vm: dict, checkpoints: List[float]) -> List[Dict[str, float]]:
+        """
+        Savings percentiles for one VM at each checkpoint (hours from now)
+        of a single forecast over the last checkpoint.
+
+        Every path is accumulated checkpoint by checkpoint before taking
+        percentiles, so each series is non-decreasing. Idle runs are
+        sampled individually here (start uniform over the horizon, stopped
+        time exponential) to know how much of each falls before a checkpoint.
+        """
+        checkpoints = np.sort(np.asarray(checkpoints, dtype=np.float64))
+        mean_idle, mean_active, idle_now, elapsed, hourly, protected = (a[0] for a in self._fit([vm]))
+        hours = np.zeros((self.paths, len(checkpoints)))
+
+        outlast = np.exp(-self.idle_hours / mean_idle)
+        if not protected and hourly > 0 and (idle_now or outlast > _NEGLIGIBLE):
+            rng = np.random.default_rng(self.seed)
+            horizon = checkpoints[-1]
+
+            if idle_now:
+                residual = rng.exponential(mean_idle, size=self.paths)
+                wait_now = max(self.idle_hours - elapsed, 0)
+                hours += np.maximum(np.minimum(residual[:, None], checkpoints) - wait_now, 0)
+
+            stops = rng.poisson(horizon / (mean_idle + mean_active) * outlast, size=self.paths)
+            total = int(stops.sum())
+            if total:
+                path = np.repeat(np.arange(self.paths), stops)
+                start = rng.uniform(0, horizon, size=total)
+                stopped = rng.exponential(mean_idle, size=total)
+                covered = np.clip(checkpoints - start[:, None], 0, stopped[:, None])
+                for k in range(len(checkpoints)):
+                    hours[:, k] += np.bincount(path, weights=covered[:, k], minlength=self.paths)
+
+            np.minimum(hours, checkpoints, out=hours)
+
+        savings = hours * hourly
+        p10, p50, p90 = np.percentile(savings, PERCENTILES, axis=0)
+        mean = savings.mean(axis=0)
+        return [
+            {"p10": float(p10[k]), "p50": float(p50[k]), "p90": float(p90[k]), "mean": float(mean[k])}
+            for k in range(len(checkpoints))
+        ]
+
+    def forecast(self, vms: List[dict]) -> SavingsForecast:
+        """
+        Forecast savings percentiles per VM and for the whole fleet.
+        Fleet percentiles come from summing all VMs path by path.
+        """
+        fitted = self._fit(vms)
+        n = len(vms)
+
+        chunk = max(1, self.chunk_elements // max(self.paths, 1))
+        bounds = [(start, min(start + chunk, n)) for start in range(0, n, chunk)]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(bounds))
+
+        def run(args):
+            (start, end), seed_seq = args
+            return self._forecast_chunk(seed_seq, *(a[start:end] for a in fitted))
+
+        jobs = list(zip(bounds, seeds))
+        if self.workers > 1 and len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                results = list(pool.map(run, jobs))
+        else:
+            results = [run(job) for job in jobs]
+
+        fleet_paths = np.zeros(self.paths)
+        for *_, chunk_paths in results:
+            fleet_paths += chunk_paths
+
+        def stack(i):
+            return np.concatenate([r[i] for r in results]) if results else np.empty(0)
+
+        fleet_p10, fleet_p50, fleet_p90 = np.percentile(fleet_paths, PERCENTILES)
+
+        return SavingsForecast(
+            names=[vm.get("name") for vm in vms],
+            p10=stack(0),
+            p50=stack(1),
+            p90=stack(2),
+            mean=stack(3),
+            fleet={
+                "p10": round(float(fleet_p10), 2),
+                "p50": round(float(fleet_p50), 2),
+                "p90": round(float(fleet_p90), 2),
+                "mean": round(float(fleet_paths.mean()), 2),
+            },
+            paths=self.paths,
+            horizon_hours=self.horizon_hours,
+        )
@@ -0,0 +1,340 @@
+"""
+Pricing catalog
+Multi-cloud SKU prices (GCP / AWS / Azure) behind a memory-mapped index
+
+SKU tables live as CSV files (one per provider) with the columns:
+    region,machine_type,vcpus,memory_gb,hourly_cost
+
+On first lookup the tables are compiled into a compact binary
+open-addressing hash table keyed by (provider, region, machine type)
+and memory-mapped, so every lookup is O(1) and reads only a few bytes.
+The index is rebuilt automatically when any source table changes.
+"""
+
+import csv
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+DEFAULT_SOURCE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "pricing"
+)
+INDEX_FILENAME = "pricing.idx"
+
+PROVIDERS = ("gcp", "aws", "azure")
+
+# Region used when a caller does not specify one
+DEFAULT_REGIONS = {
+    "gcp": "us-central1",
+    "aws": "us-east-1",
+    "azure": "eastus",
+}
+
+_MAGIC = b"PRICEIDX"
+_VERSION = 1
+
+# magic, version, record count, slot capacity, strings offset, source fingerprint
+_HEADER = struct.Struct("<8sIIIQQ")
+
+# key hash, string offset, string length, vcpus, memory_gb, hourly_cost
+_SLOT = struct.Struct("<QIHHfd")
+
+
+class UnknownSKUError(KeyError):
+    """
+    Raised when a (provider, region, machine type) is not in the catalog.
+    """
+
+    def __init__(self, provider: str, region: str, machine_type: str):
+        super().__init__(f"Unknown SKU: {provider}/{region}/{machine_type}")
+        self.provider = provider
+        self.region = region
+        self.machine_type = machine_type
+
+
+def default_region(provider: str) -> str:
+    """
+    Region used when a caller does not name one.
+    """
+    try:
+        return DEFAULT_REGIONS[provider]
+    except KeyError:
+        raise ValueError(
+            f"Unknown provider '{provider}' (expected one of {', '.join(DEFAULT_REGIONS)})"
+        ) from None
+
+
+@dataclass(frozen=True)
+class SkuPrice:
+    provider: str
+    region: str
+    machine_type: str
+    vcpus: int
+    memory_gb: float
+    hourly_cost: float
+
+
+def _key(provider: str, region: str, machine_type: str) -> bytes:
+    return f"{provider}|{region}|{machine_type}".lower().encode("utf-8")
+
+
+def _hash(key: bytes) -> int:
+    # Stable across processes, unlike hash()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def _capacity_for(count: int) -> int:
+    # Power of two with load factor <= 0.5 keeps probe chains short
+    capacity = 8
+    while capacity < count * 2:
+        capacity *= 2
+    return capacity
+
+
+class PricingCatalog:
+    """
+    Lazily loaded, memory-mapped pricing catalog.
+    """
+
+    def __init__(self, source_dir: Optional[str] = None, index_path: Optional[str] = None):
+        """
+        :param source_dir: Directory holding <provider>.csv SKU tables
+        :param index_path: Where to cache the compiled index (default: inside source_dir)
+        """
+        self.source_dir = source_dir or os.getenv("PRICING_CATALOG_DIR", DEFAULT_SOURCE_DIR)
+        self.index_path = index_path or os.path.join(self.source_dir, INDEX_FILENAME)
+
+        self._buffer = None
+        self._file = None
+        self._count = 0
+        self._capacity = 0
+        self._strings_offset = 0
+        self._lock = threading.Lock()
+
+    # --------------------------------
+    # Public API
+    # --------------------------------
+    def lookup(self, provider: str, region: str, machine_type: str) -> Optional[SkuPrice]:
+        """
+        Returns the SKU price, or None if the SKU is unknown.
+        """
+        self._ensure_loaded()
+
+        key = _key(provider, region, machine_type)
+        h = _hash(key)
+        mask = self._capacity - 1
+        slot = h & mask
+
+        while True:
+            entry = _SLOT.unpack_from(self._buffer, _HEADER.size + slot * _SLOT.size)
+            slot_hash, str_off, str_len, vcpus, memory_gb, hourly_cost = entry
+
+            if str_len == 0:
+                return None
+
+            if slot_hash == h:
+                raw = self._read_string(str_off, str_len)
+                if raw.lower().encode("utf-8") == key:
+                    return self._to_price(raw, vcpus, memory_gb, hourly_cost)
+
+            slot = (slot + 1) & mask
+
+    def price(self, provider: str, region: str, machine_type: str) -> SkuPrice:
+        """
+        Same as lookup(), but raises UnknownSKUError instead of returning None.
+        """
+        sku = self.lookup(provider, region, machine_type)
+        if sku is None:
+            raise UnknownSKUError(provider, region, machine_type)
+        return sku
+
+    def skus(self, provider: Optional[str] = None, region: Optional[str] = None) -> Iterator[SkuPrice]:
+        """
+        Iterates catalog entries, optionally filtered by provider / region.
+        """
+        self._ensure_loaded()
+
+        for slot in range(self._capacity):
+            entry = _SLOT.unpack_from(self._buffer, _HEADER.size + slot * _SLOT.size)
+            _, str_off, str_len, vcpus, memory_gb, hourly_cost = entry
+            if str_len == 0:
+                continue
+
+            sku = self._to_price(self._read_string(str_off, str_len), vcpus, memory_gb, hourly_cost)
+
+            if provider is not None and sku.provider != provider.lower():
+                continue
+            if region is not None and sku.region.lower() != region.lower():
+                continue
+
+            yield sku
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return self._count
+
+    def close(self):
+        with self._lock:
+            if isinstance(self._buffer, mmap.mmap):
+                self._buffer.close()
+            if self._file is not None:
+                self._file.close()
+            self._buffer = None
+            self._file = None
+
+    # --------------------------------
+    # Loading / building
+    # --------------------------------
+    def _ensure_loaded(self):
+        if self._buffer is not None:
+            return
+
+        with self._lock:
+            if self._buffer is not None:
+                return
+
+            fingerprint = self._source_fingerprint()
+
+            if not self._open_index(fingerprint):
+                data = self._build_index(fingerprint)
+                try:
+                    tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+                    with open(tmp_path, "wb") as f:
+                        f.write(data)
+                    os.replace(tmp_path, self.index_path)
+                    self._open_index(fingerprint)
+                except OSError:
+                    # Read-only location: serve the index from memory
+                    self._load_header(data)
+                    self._buffer = data
+
+    def _source_files(self):
+        return [
+            (provider, os.path.join(self.source_dir, f"{provider}.csv"))
+            for provider in PROVIDERS
+            if os.path.exists(os.path.join(self.source_dir, f"{provider}.csv"))
+        ]
+
+    def _source_fingerprint(self) -> int:
+        parts = []
+        for provider, path in self._source_files():
+            stat = os.stat(path)
+            parts.append(f"{provider}:{stat.st_size}:{stat.st_mtime_ns}")
+        return _hash("|".join(parts).encode("utf-8"))
+
+    def _open_index(self, fingerprint: int) -> bool:
+        if not os.path.exists(self.index_path):
+            return False
+
+        f = buffer = None
+        try:
+            f = open(self.index_path, "rb")
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, _, _, _, stored = _HEADER.unpack_from(buffer, 0)
+        except (OSError, ValueError, struct.error):
+            # Unreadable, empty or truncated index: rebuild it
+            magic = None
+
+        if magic != _MAGIC or version != _VERSION or stored != fingerprint:
+            if buffer is not None:
+                buffer.close()
+            if f is not None:
+                f.close()
+            return False
+
+        self._load_header(buffer)
+        self._file = f
+        self._buffer = buffer
+        return True
+
+    def _load_header(self, buffer):
+        _, _, count, capacity, strings_offset, _ = _HEADER.unpack_from(buffer, 0)
+        self._count = count
+        self._capacity = capacity
+        self._strings_offset = strings_offset
+
+    def _build_index(self, fingerprint: int) -> bytes:
+        rows = []
+        for provider, path in self._source_files():
+            with open(path, newline="") as f:
+                for row in csv.DictReader(f):
+                    rows.append((
+                        f"{provider}|{row['region']}|{row['machine_type']}",
+                        int(row["vcpus"]),
+                        float(row["memory_gb"]),
+                        float(row["hourly_cost"]),
+                    ))
+
+        capacity = _capacity_for(len(rows))
+        slots = bytearray(capacity * _SLOT.size)
+        strings = bytearray()
+        mask = capacity - 1
+        count = 0
+
+        for raw, vcpus, memory_gb, hourly_cost in rows:
+            key = raw.lower().encode("utf-8")
+            h = _hash(key)
+            slot = h & mask
+
+            while True:
+                slot_hash, str_off, str_len, *_ = _SLOT.unpack_from(slots, slot * _SLOT.size)
+                if str_len == 0:
+                    break
+                # Later tables override earlier duplicates
+                if slot_hash == h and self._decode(strings, str_off, str_len).lower().encode("utf-8") == key:
+                    count -= 1
+                    break
+                slot = (slot + 1) & mask
+
+            encoded = raw.encode("utf-8")
+            _SLOT.pack_into(
+                slots, slot * _SLOT.size,
+                h, len(strings), len(encoded), vcpus, memory_gb, hourly_cost,
+            )
+            strings += encoded
+            count += 1
+
+        strings_offset = _HEADER.size + len(slots)
+        header = _HEADER.pack(_MAGIC, _VERSION, count, capacity, strings_offset, fingerprint)
+
+        return header + bytes(slots) + bytes(strings)
+
+    # --------------------------------
+    # Helpers
+    # --------------------------------
+    @staticmethod
+    def _decode(buffer, offset: int, length: int) -> str:
+        return bytes(buffer[offset:offset + length]).decode("utf-8")
+
+    def _read_string(self, offset: int, length: int) -> str:
+        start = self._strings_offset + offset
+        return self._decode(self._buffer, start, length)
+
+    @staticmethod
+    def _to_price(raw: str, vcpus: int, memory_gb: float, hourly_cost: float) -> SkuPrice:
+        provider, region, machine_type = raw.split("|", 2)
+        return SkuPrice(
+            provider=provider,
+            region=region,
+            machine_type=machine_type,
+            vcpus=vcpus,
+            memory_gb=round(memory_gb, 3),
+            hourly_cost=hourly_cost,
+        )
+
+
+_default_catalog: Optional[PricingCatalog] = None
+
+
+def get_catalog() -> PricingCatalog:
+    """
+    Process-wide catalog (created lazily, loaded on first lookup).
+    """
+    global _default_catalog
+    if _default_catalog is None:
+        _default_catalog = PricingCatalog()
+    return _default_catalog
@@ -3,19 +3,28 @@ Pricing engine
 Handles cost calculation logic (mock pricing)
 """
 
-# Mock hourly pricing in INR
-PRICING_PER_HOUR = {
-    "e2-small": 2.5,
-    "e2-medium": 5.0,
-    "e2-large": 10.0
-}
+from typing import Optional
 
+from cost.pricing_catalog import default_region, get_catalog
 
-def estimate_monthly_cost(machine_type: str, hours_per_day: int) -> float:
+
+def hourly_rate(machine_type: str, provider: str = "gcp", region: Optional[str] = None) -> float:
+    """
+    Hourly price in INR from the pricing catalog.
+    Raises UnknownSKUError for SKUs the catalog does not know.
+    """
+    region = region or default_region(provider)
+    return get_catalog().price(provider, region, machine_type).hourly_cost
+
+
+def estimate_monthly_cost(
+    machine_type: str,
+    hours_per_day: int,
+    provider: str = "gcp",
+    region: Optional[str] = None,
+) -> float:
     """
     Estimate monthly VM cost based on usage
     """
-    hourly_rate = PRICING_PER_HOUR.get(machine_type, 5.0)
     monthly_hours = hours_per_day * 30
-    return round(hourly_rate * monthly_hours, 2)
-
+    return round(hourly_rate(machine_type, provider, region) * monthly_hours, 2)
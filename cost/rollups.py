@@ -0,0 +1,202 @@
+"""
+Cost rollups
+Incrementally maintained cost, leakage and savings totals
+
+Totals are kept per environment, tag and owner (team) and updated by
+applying the difference of a single VM's contribution whenever its
+decision, price or idle time changes. Summary queries are O(1). The
+top-N wasteful groups come from a sorted list per dimension: each change
+finds its position by bisection and inserts/deletes in O(g) for g groups
+(environments, tags or teams, so g stays small), and reading the top N
+is a slice. `sync()` applies a new snapshot of the fleet as per-VM
+updates, touching only the VMs that changed.
+
+Amounts are stored as integer paise so repeated add/subtract cycles never
+drift away from a full recomputation.
+"""
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from cost.cost_model import UNASSIGNED, CostModel
+
+METRICS = ("monthly_cost", "leakage", "savings")
+DIMENSIONS = ("environment", "tag", "owner")
+
+
+def _paise(amount: float) -> int:
+    return int(round(amount * 100))
+
+
+def _decision_value(decision) -> str:
+    return getattr(decision, "value", decision)
+
+
+@dataclass
+class _Entry:
+    environment: str
+    tags: Tuple[str, ...]
+    owner: str
+    hourly_cost: float
+    idle_hours: float
+    decision: str
+
+    def contribution(self) -> Tuple[int, int, int]:
+        model = CostModel(hourly_cost=self.hourly_cost)
+        return (
+            _paise(model.monthly()),
+            _paise(model.cost_leakage(self.idle_hours)),
+            _paise(model.prevented_savings(self.decision)),
+        )
+
+    def groups(self):
+        yield "environment", self.environment
+        for tag in self.tags:
+            yield "tag", tag
+        yield "owner", self.owner
+
+
+class CostRollup:
+    """
+    Pre-aggregated cost totals that stay current under per-VM updates.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _Entry] = {}
+        self._totals = [0, 0, 0]
+
+        # dimension -> key -> [monthly, leakage, savings, vm_count]
+        self._groups: Dict[str, Dict[str, List[int]]] = {d: {} for d in DIMENSIONS}
+
+        # dimension -> sorted [(-leakage, key)] for top-N queries
+        self._ranking: Dict[str, List[Tuple[int, str]]] = {d: [] for d in DIMENSIONS}
+
+    # --------------------------------
+    # Updates
+    # --------------------------------
+    def upsert(self, vm: dict, decision):
+        """
+        Add a VM or replace its previous contribution.
+        """
+        self._replace(vm["name"], self._entry(vm, decision))
+
+    def sync(self, vms: List[dict], decisions) -> int:
+        """
+        Bring the rollup in line with a full fleet snapshot: VMs whose
+        contribution changed are replaced, missing ones removed.
+        Returns the number of VMs updated or removed.
+        """
+        changed = 0
+        seen = set()
+        for vm, decision in zip(vms, decisions):
+            seen.add(vm["name"])
+            entry = self._entry(vm, decision)
+            if self._entries.get(vm["name"]) != entry:
+                self._replace(vm["name"], entry)
+                changed += 1
+
+        for vm_name in [name for name in self._entries if name not in seen]:
+            self.remove(vm_name)
+            changed += 1
+        return changed
+
+    @staticmethod
+    def _entry(vm: dict, decision) -> _Entry:
+        return _Entry(
+            environment=vm.get("environment") or UNASSIGNED,
+            tags=tuple(dict.fromkeys(vm.get("tags", []))),
+            owner=vm.get("owner") or UNASSIGNED,
+            hourly_cost=vm["hourly_cost"],
+            idle_hours=vm.get("idle_hours", 0),
+            decision=_decision_value(decision),
+        )
+
+    def update_decision(self, vm_name: str, decision):
+        entry = self._entries[vm_name]
+        self._replace(vm_name, _Entry(**{**entry.__dict__, "decision": _decision_value(decision)}))
+
+    def update_price(self, vm_name: str, hourly_cost: float):
+        entry = self._entries[vm_name]
+        self._replace(vm_name, _Entry(**{**entry.__dict__, "hourly_cost": hourly_cost}))
+
+    def update_idle_hours(self, vm_name: str, idle_hours: float):
+        entry = self._entries[vm_name]
+        self._replace(vm_name, _Entry(**{**entry.__dict__, "idle_hours": idle_hours}))
+
+    def remove(self, vm_name: str):
+        entry = self._entries.pop(vm_name, None)
+        if entry is not None:
+            self._apply(entry, -1)
+
+    def _replace(self, vm_name: str, entry: _Entry):
+        previous = self._entries.get(vm_name)
+        if previous is not None:
+            self._apply(previous, -1)
+
+        self._entries[vm_name] = entry
+        self._apply(entry, 1)
+
+    def _apply(self, entry: _Entry, sign: int):
+        contribution = entry.contribution()
+
+        for i, amount in enumerate(contribution):
+            self._totals[i] += sign * amount
+
+        for dimension, key in entry.groups():
+            groups = self._groups[dimension]
+            values = groups.get(key)
+
+            if values is None:
+                values = groups[key] = [0, 0, 0, 0]
+            else:
+                self._unrank(dimension, key, values[1])
+
+            for i, amount in enumerate(contribution):
+                values[i] += sign * amount
+            values[3] += sign
+
+            if values[3] == 0:
+                del groups[key]
+            else:
+                insort(self._ranking[dimension], (-values[1], key))
+
+    def _unrank(self, dimension: str, key: str, leakage: int):
+        ranking = self._ranking[dimension]
+        i = bisect_left(ranking, (-leakage, key))
+        del ranking[i]
+
+    # --------------------------------
+    # Queries
+    # --------------------------------
+    def totals(self) -> Dict[str, float]:
+        """
+        Fleet-wide totals, O(1).
+        """
+        return {metric: self._totals[i] / 100 for i, metric in enumerate(METRICS)}
+
+    def group(self, dimension: str, key: str) -> Optional[Dict[str, float]]:
+        """
+        Totals for one environment / tag / owner, O(1).
+        """
+        values = self._groups[dimension].get(key)
+        if values is None:
+            return None
+        result = {metric: values[i] / 100 for i, metric in enumerate(METRICS)}
+        result["vm_count"] = values[3]
+        return result
+
+    def groups(self, dimension: str) -> Dict[str, Dict[str, float]]:
+        return {key: self.group(dimension, key) for key in self._groups[dimension]}
+
+    def top_wasteful(self, n: int = 5, dimension: str = "owner") -> List[Tuple[str, float]]:
+        """
+        Groups with the highest cost leakage (a slice of the ranking).
+        """
+        return [(key, -leakage / 100) for leakage, key in self._ranking[dimension][:n]]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, vm_name: str) -> bool:
+        return vm_name in self._entries
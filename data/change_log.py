@@ -0,0 +1,116 @@
+"""
+Change log
+Versioned, bounded history of resource changes for delta sync
+
+The API publishes its current resource view with `update()`; inventory
+providers record single items with `put()` / `delete()`. Each resource
+that was added, changed or removed gets a new version number. Clients
+remember the version they last saw and ask for `changes_since(version)`.
+Only the most recent `capacity` changes are kept, so a client that falls
+further behind than that is told to resync in full.
+"""
+
+import threading
+from collections import deque
+from typing import Dict, Hashable, List, Optional
+
+ADDED = "added"
+CHANGED = "changed"
+REMOVED = "removed"
+
+
+class ChangeLog:
+    """
+    Tracks {id: item} snapshots and the changes between them.
+    """
+
+    def __init__(self, capacity: int = 1000, start: int = 0):
+        """
+        :param capacity: Changes retained for delta requests
+        :param start: First version number; starting each process above the
+                      previous one's versions (e.g. a timestamp) makes
+                      clients of an earlier process resync
+        """
+        self.capacity = capacity
+        self.version = start
+        self._entries = deque(maxlen=capacity)  # (version, id, kind)
+        # Changes at or below this version are no longer in the log
+        self._floor = start
+        self._items: Dict[Hashable, dict] = {}
+        self._lock = threading.Lock()
+
+    def update(self, items: Dict[Hashable, dict]) -> int:
+        """
+        Records the difference from the previous snapshot; returns the
+        current version.
+        """
+        with self._lock:
+            for key, item in items.items():
+                previous = self._items.get(key)
+                if previous is None:
+                    self._record(key, ADDED)
+                elif previous != item:
+                    self._record(key, CHANGED)
+
+            for key in self._items.keys() - items.keys():
+                self._record(key, REMOVED)
+
+            self._items = dict(items)
+            return self.version
+
+    def put(self, key: Hashable, item: dict) -> int:
+        """
+        Adds or replaces one item without diffing the whole snapshot.
+        """
+        with self._lock:
+            previous = self._items.get(key)
+            if previous is None:
+                self._record(key, ADDED)
+            elif previous != item:
+                self._record(key, CHANGED)
+            self._items[key] = item
+            return self.version
+
+    def delete(self, key: Hashable) -> int:
+        with self._lock:
+            if self._items.pop(key, None) is not None:
+                self._record(key, REMOVED)
+            return self.version
+
+    def _record(self, key: Hashable, kind: str):
+        if len(self._entries) == self._entries.maxlen:
+            self._floor = self._entries[0][0]
+        self.version += 1
+        self._entries.append((self.version, key, kind))
+
+    def changes_since(self, version: int) -> Optional[dict]:
+        """
+        {"added": [...], "changed": [...], "removed": [ids]} relative to
+        `version`, or None when the log cannot cover it (full resync).
+        """
+        with self._lock:
+            if version < self._floor or version > self.version:
+                return None
+
+            # Net effect per id: the first and last change after `version`
+            first: Dict[Hashable, str] = {}
+            last: Dict[Hashable, str] = {}
+            for entry_version, key, kind in reversed(self._entries):
+                if entry_version <= version:
+                    break
+                first[key] = kind
+                last.setdefault(key, kind)
+
+            added: List[dict] = []
+            changed: List[dict] = []
+            removed: List[Hashable] = []
+            # Oldest change first; cost is proportional to the changes only
+            for key in reversed(list(last)):
+                if last[key] != REMOVED:
+                    item = self._items[key]
+                    (added if first[key] == ADDED else changed).append(item)
+                elif first[key] != ADDED:
+                    # Added and removed again in between: the client never saw it
+                    removed.append(key)
+
+            return {"added": added, "changed": changed, "removed": removed}
@@ -0,0 +1,331 @@
+"""
+Inventory
+Paged, zone-parallel instance listing behind a TTL-cached local mirror
+
+Cloud inventory APIs list instances one zone and one page at a time, and
+a full listing of a large project takes many round trips. Providers
+implement that paged interface (plus change tokens for incremental
+sync), and InventoryMirror keeps a local copy in front of them:
+
+- lookups are served from memory while the copy is younger than the TTL,
+- an expired copy is refreshed with only the changes since the last
+  change token (a full listing only when the token has expired),
+- concurrent lookups share one in-flight refresh instead of each
+  issuing their own.
+
+The mirror runs its async work on a private event loop thread, so sync
+callers (chatbot, Streamlit) and async callers share the same cache and
+the same in-flight refresh.
+"""
+
+import asyncio
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+
+from data.change_log import ChangeLog
+
+DEFAULT_PAGE_SIZE = 500
+
+
+@dataclass
+class InventoryPage:
+    instances: List[dict]
+    next_page_token: Optional[str] = None
+
+
+@dataclass
+class InventoryChanges:
+    """
+    Net changes since a change token, and the token to use next time.
+    """
+    upserted: List[dict] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    token: str = ""
+
+
+class InventoryProvider(ABC):
+    """
+    Base interface for inventory backends.
+
+    Instances are dicts with at least name, machine_type, vcpus,
+    memory_gb, region, zone and status.
+    """
+
+    # Zones listed at the same time by list_all()
+    max_concurrency = 8
+
+    @abstractmethod
+    async def zones(self) -> List[str]:
+        """
+        Zones that hold instances.
+        """
+
+    @abstractmethod
+    async def list_page(
+        self, zone: str, page_token: Optional[str] = None, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> InventoryPage:
+        """
+        One page of a zone's instances.
+        """
+
+    @abstractmethod
+    async def change_token(self) -> str:
+        """
+        Token marking the current state, for changes_since().
+        """
+
+    @abstractmethod
+    async def changes_since(self, token: str) -> Optional[InventoryChanges]:
+        """
+        Changes after `token`, or None when the token has expired.
+        """
+
+    async def list_zone(self, zone: str, page_size: int = DEFAULT_PAGE_SIZE) -> List[dict]:
+        instances: List[dict] = []
+        page_token = None
+        while True:
+            page = await self.list_page(zone, page_token, page_size)
+            instances.extend(page.instances)
+            page_token = page.next_page_token
+            if not page_token:
+                return instances
+
+    async def list_all(self, page_size: int = DEFAULT_PAGE_SIZE) -> List[dict]:
+        """
+        All instances, listing up to max_concurrency zones at a time.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(zone):
+            async with semaphore:
+                return await self.list_zone(zone, page_size)
+
+        per_zone = await asyncio.gather(*(bounded(zone) for zone in await self.zones()))
+        return [instance for instances in per_zone for instance in instances]
+
+
+class MockInventoryProvider(InventoryProvider):
+    """
+    In-memory backend (mock VMs, optionally scaled up with a synthetic fleet).
+    """
+
+    def __init__(
+        self,
+        instances: Iterable[dict] = (),
+        synthetic: int = 0,
+        seed: int = 0,
+        latency: float = 0.0,
+        change_capacity: int = 10_000,
+    ):
+        """
+        :param instances: Instances to serve (zone defaults to <region>-a)
+        :param synthetic: Number of synthetic instances to add
+        :param seed: Seed for the synthetic instances
+        :param latency: Simulated seconds per API call
+        :param change_capacity: Changes retained for change tokens
+        """
+        self.latency = latency
+        self.calls = 0
+        self._log = ChangeLog(capacity=change_capacity)
+        self._zones: Dict[str, Dict[str, dict]] = {}
+
+        for instance in instances:
+            self.upsert(instance)
+        if synthetic:
+            for instance in synthetic_instances(synthetic, seed):
+                self.upsert(instance)
+
+    # --------------------------------
+    # Mutations (stand-ins for activity in the cloud project)
+    # --------------------------------
+    def upsert(self, instance: dict):
+        instance = {**instance}
+        instance.setdefault("zone", f"{instance['region']}-a")
+        self.remove(instance["name"], record=False)
+        self._zones.setdefault(instance["zone"], {})[instance["name"]] = instance
+        self._log.put(instance["name"], instance)
+
+    def remove(self, name: str, record: bool = True):
+        for instances in self._zones.values():
+            if instances.pop(name, None) is not None:
+                break
+        if record:
+            self._log.delete(name)
+
+    # --------------------------------
+    # Provider interface
+    # --------------------------------
+    async def _call(self):
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    async def zones(self) -> List[str]:
+        await self._call()
+        return sorted(zone for zone, instances in self._zones.items() if instances)
+
+    async def list_page(
+        self, zone: str, page_token: Optional[str] = None, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> InventoryPage:
+        await self._call()
+        names = sorted(self._zones.get(zone, {}))
+        start = int(page_token or 0)
+        end = start + page_size
+        return InventoryPage(
+            instances=[self._zones[zone][name] for name in names[start:end]],
+            next_page_token=str(end) if end < len(names) else None,
+        )
+
+    async def change_token(self) -> str:
+        await self._call()
+        return str(self._log.version)
+
+    async def changes_since(self, token: str) -> Optional[InventoryChanges]:
+        await self._call()
+        delta = self._log.changes_since(int(token))
+        if delta is None:
+            return None
+        return InventoryChanges(
+            upserted=delta["added"] + delta["changed"],
+            removed=delta["removed"],
+            token=str(self._log.version),
+        )
+
+
+def synthetic_instances(count: int, seed: int = 0) -> List[dict]:
+    """
+    Instances for a synthetic fleet (machine types and regions from the
+    pricing catalog, so cost estimates resolve).
+    """
+    # NumPy is only needed for large mock inventories
+    from data.synthetic_fleet import generate_fleet
+
+    fleet = generate_fleet(count, seed=seed)
+    width = max(len(str(count)), 3)
+    zones = "abc"
+
+    out = []
+    for i, (machine, region) in enumerate(zip(fleet.machine_type.tolist(), fleet.region.tolist())):
+        out.append({
+            "name": f"synthetic-vm-{i:0{width}d}",
+            "machine_type": fleet.machine_types[machine],
+            "vcpus": fleet.vcpus[machine],
+            "memory_gb": fleet.memory_gb[machine],
+            "region": fleet.regions[region],
+            "zone": f"{fleet.regions[region]}-{zones[i % len(zones)]}",
+            "status": "RUNNING" if i % 4 else "STOPPED",
+        })
+    return out
+
+
+class InventoryMirror:
+    """
+    Local copy of a provider's inventory with a TTL.
+    """
+
+    def __init__(
+        self,
+        provider: InventoryProvider,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param provider: Backend to mirror
+        :param ttl: Seconds a refreshed copy is served without checking for changes
+        :param clock: Time source (monotonic seconds)
+        """
+        self.provider = provider
+        self.ttl = ttl
+        self.clock = clock
+        self.full_refreshes = 0
+        self.incremental_refreshes = 0
+
+        self._instances: Dict[str, dict] = {}
+        self._token: Optional[str] = None
+        self._refreshed_at: Optional[float] = None
+        self._refreshing: Optional[asyncio.Future] = None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+
+    # --------------------------------
+    # Lookups
+    # --------------------------------
+    def is_fresh(self) -> bool:
+        return self._refreshed_at is not None and self.clock() - self._refreshed_at < self.ttl
+
+    def get_sync(self, name: str) -> Optional[dict]:
+        """
+        Blocking lookup for sync callers.
+        """
+        if self.is_fresh():
+            return self._instances.get(name)
+        return self._submit(self._get(name)).result()
+
+    async def get(self, name: str) -> Optional[dict]:
+        if self.is_fresh():
+            return self._instances.get(name)
+        return await asyncio.wrap_future(self._submit(self._get(name)))
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    # --------------------------------
+    # Refresh (runs on the mirror's loop)
+    # --------------------------------
+    async def _get(self, name: str) -> Optional[dict]:
+        if not self.is_fresh():
+            await self._refresh()
+        return self._instances.get(name)
+
+    async def _refresh(self):
+        # Every caller that finds the copy stale awaits the same refresh
+        if self._refreshing is None:
+            self._refreshing = asyncio.ensure_future(self._sync())
+            self._refreshing.add_done_callback(self._refresh_done)
+        try:
+            await asyncio.shield(self._refreshing)
+        except Exception as exc:
+            if self._refreshed_at is None:
+                raise
+            # Serve the stale copy; the next lookup retries
+            print(f"⚠️ Inventory refresh failed, serving cached copy: {exc}")
+
+    def _refresh_done(self, _future):
+        self._refreshing = None
+
+    async def _sync(self):
+        changes = None
+        if self._token is not None:
+            changes = await self.provider.changes_since(self._token)
+
+        if changes is None:
+            # Token taken before listing: changes made during it replay next time
+            token = await self.provider.change_token()
+            instances = await self.provider.list_all()
+            self._instances = {instance["name"]: instance for instance in instances}
+            self._token = token
+            self.full_refreshes += 1
+        else:
+            for instance in changes.upserted:
+                self._instances[instance["name"]] = instance
+            for name in changes.removed:
+                self._instances.pop(name, None)
+            self._token = changes.token
+            self.incremental_refreshes += 1
+
+        self._refreshed_at = self.clock()
+
+    def _submit(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._ensure_loop())
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="inventory-mirror", daemon=True).start()
+                self._loop = loop
+            return self._loop
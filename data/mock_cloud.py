@@ -1,8 +1,18 @@
 """
 Mock cloud layer
 Simulates VM configurations as if fetched from a real cloud provider
+
+Lookups go through an InventoryMirror over MockInventoryProvider. Set
+MOCK_INVENTORY_SIZE to add that many synthetic instances, and
+INVENTORY_TTL_SECONDS to change how long the mirror serves its copy.
 """
 
+import os
+import threading
+from typing import Optional
+
+from data.inventory import InventoryMirror, MockInventoryProvider
+
 MOCK_VM_DATABASE = {
     "vm-1": {
         "name": "vm-1",
@@ -23,8 +33,27 @@ MOCK_VM_DATABASE = {
 }
 
 
+_mirror: Optional[InventoryMirror] = None
+_mirror_lock = threading.Lock()
+
+
+def get_inventory_mirror() -> InventoryMirror:
+    """
+    Process-wide mirror, built on first use.
+    """
+    global _mirror
+    with _mirror_lock:
+        if _mirror is None:
+            provider = MockInventoryProvider(
+                MOCK_VM_DATABASE.values(),
+                synthetic=int(os.getenv("MOCK_INVENTORY_SIZE", "0")),
+            )
+            _mirror = InventoryMirror(provider, ttl=float(os.getenv("INVENTORY_TTL_SECONDS", "60")))
+        return _mirror
+
+
 def get_vm_configuration(vm_name: str):
     """
     Simulates fetching VM configuration from cloud metadata / API
     """
-    return MOCK_VM_DATABASE.get(vm_name)
+    return get_inventory_mirror().get_sync(vm_name)
@@ -0,0 +1,320 @@
+"""
+Synthetic fleet
+Seeded generator for large, realistic VM fleets (NumPy)
+
+Fleets are stored column-wise (categorical codes and float32 arrays), so
+millions of VMs fit in a few tens of MB. Every VM gets a utilization
+profile:
+
+- always-on:       steady load around the clock (most of prod)
+- business-hours:  busy on weekday working hours in its region's timezone
+- batch:           a short nightly job, idle otherwise
+- abandoned:       forgotten instances that never do real work
+
+Hourly CPU is produced on demand by `utilization_stream`, which is what
+drives the time-stepped simulator in experiments/fleet_simulator.py.
+
+Usage:
+    python -m data.synthetic_fleet --count 50 --out data/sample_vms.json
+"""
+
+import argparse
+import json
+from dataclasses import dataclass
+from typing import Collection, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from cost.pricing_catalog import get_catalog
+
+ENVIRONMENTS = ("dev", "staging", "prod")
+ENVIRONMENT_WEIGHTS = (0.45, 0.20, 0.35)
+
+# Independent probability of each tag being present
+TAG_PROBABILITIES = {
+    "web": 0.25,
+    "batch": 0.15,
+    "ml": 0.10,
+    "experiment": 0.12,
+    "critical": 0.05,
+    "do-not-stop": 0.04,
+}
+TAGS = tuple(TAG_PROBABILITIES)
+
+OWNERS = ("platform", "data", "ml", "web", "mobile", "payments", "search", "growth")
+
+PROFILES = ("always-on", "business-hours", "batch", "abandoned")
+
+# Profile mix per environment (rows follow ENVIRONMENTS)
+PROFILE_WEIGHTS = np.array([
+    [0.10, 0.55, 0.15, 0.20],   # dev
+    [0.25, 0.50, 0.15, 0.10],   # staging
+    [0.85, 0.05, 0.10, 0.00],   # prod
+])
+
+# Rough UTC offsets by region prefix, for working hours
+UTC_OFFSETS = {"us": -6, "europe": 1, "asia": 5}
+
+# CPU % below which an hour counts as idle
+IDLE_CPU = 5.0
+
+HOURS_PER_WEEK = 24 * 7
+
+
+@dataclass
+class SyntheticFleet:
+    """
+    Column-wise synthetic fleet. Row i of every array describes VM i.
+    """
+    environment: np.ndarray      # int8 codes into ENVIRONMENTS
+    tags: np.ndarray             # uint8 bitmask over TAGS
+    owner: np.ndarray            # int8 codes into OWNERS
+    machine_type: np.ndarray     # int16 codes into machine_types
+    region: np.ndarray           # int8 codes into regions
+    hourly_cost: np.ndarray      # float64, INR per hour
+    profile: np.ndarray          # int8 codes into PROFILES
+    base_cpu: np.ndarray         # float32, idle-time CPU %
+    peak_cpu: np.ndarray         # float32, busy-time CPU %
+    start_hour: np.ndarray       # int8, local hour work (or the batch job) starts
+    busy_hours: np.ndarray       # int8, length of the busy window
+    utc_offset: np.ndarray       # int8
+    weekend_active: np.ndarray   # bool
+    machine_types: Tuple[str, ...]
+    vcpus: Tuple[int, ...]
+    memory_gb: Tuple[float, ...]
+    regions: Tuple[str, ...]
+    provider: str
+    seed: Optional[int]
+
+    def __len__(self) -> int:
+        return len(self.hourly_cost)
+
+    # --------------------------------
+    # Column queries (used by the vectorized policy engine)
+    # --------------------------------
+    def environment_in(self, environments: Collection[str]) -> np.ndarray:
+        codes = [ENVIRONMENTS.index(e) for e in environments if e in ENVIRONMENTS]
+        return np.isin(self.environment, codes)
+
+    def has_any_tag(self, tags: Collection[str]) -> np.ndarray:
+        bits = 0
+        for tag in tags:
+            if tag in TAGS:
+                bits |= 1 << TAGS.index(tag)
+        return (self.tags & bits) != 0
+
+    def tag_lists(self, start: int = 0, stop: Optional[int] = None) -> List[List[str]]:
+        return [
+            [tag for bit, tag in enumerate(TAGS) if mask >> bit & 1]
+            for mask in self.tags[start:stop].tolist()
+        ]
+
+    # --------------------------------
+    # Utilization
+    # --------------------------------
+    def utilization_stream(
+        self, hours: int, seed: Optional[int] = None, start_hour: int = 0
+    ) -> Iterator[np.ndarray]:
+        """
+        Yields a float32 CPU % array for every simulated hour.
+
+        Hour 0 is Monday 00:00 UTC. Each VM-day may be skipped entirely
+        (leave, holidays) which produces the long idle streaks that
+        trigger hibernation.
+        """
+        rng = np.random.default_rng(seed)
+        n = len(self)
+        business = self.profile == PROFILES.index("business-hours")
+        batch = self.profile == PROFILES.index("batch")
+        always_on = self.profile == PROFILES.index("always-on")
+        swing = self.peak_cpu - self.base_cpu
+
+        # Busy window as a 24-bit mask over UTC hours, so each step is a shift
+        window = np.zeros(n, dtype=np.uint32)
+        for utc_hour in range(24):
+            local_hour = (utc_hour + self.utc_offset.astype(np.int32)) % 24
+            inside = (local_hour - self.start_hour) % 24 < self.busy_hours
+            window |= inside.astype(np.uint32) << utc_hour
+
+        offsets, offset_code = np.unique(self.utc_offset, return_inverse=True)
+        offsets = offsets.astype(np.int64)
+
+        present = np.ones(n, dtype=bool)
+        for hour in range(start_hour, start_hour + hours):
+            if hour % 24 == 0 or hour == start_hour:
+                present = rng.random(n, dtype=np.float32) >= 0.1
+
+            workday = np.take((hour + offsets) // 24 % 7 < 5, offset_code)
+
+            in_window = ((window >> np.uint32(hour % 24)) & 1).astype(bool)
+            busy = (
+                always_on
+                | (business & in_window & present & (workday | self.weekend_active))
+                | (batch & in_window)
+            )
+
+            noise = rng.random(n, dtype=np.float32)
+            noise *= 0.5
+            noise += 0.75
+            cpu = np.where(busy, self.peak_cpu, self.base_cpu)
+            cpu *= noise
+            yield np.minimum(cpu, 100.0, out=cpu)
+
+    def snapshot(self, hours: int = HOURS_PER_WEEK, seed: Optional[int] = None):
+        """
+        (cpu_utilization, idle_hours) after `hours` simulated hours, the
+        point-in-time view that PolicyEngine evaluates.
+        """
+        idle = np.zeros(len(self), dtype=np.float32)
+        cpu = np.zeros(len(self), dtype=np.float32)
+        for cpu in self.utilization_stream(hours, seed=self.seed if seed is None else seed):
+            idle = np.where(cpu < IDLE_CPU, idle + 1, 0).astype(np.float32)
+        return cpu, idle
+
+    # --------------------------------
+    # Records
+    # --------------------------------
+    def records(self, start: int = 0, stop: Optional[int] = None, snapshot=None) -> List[dict]:
+        """
+        VM dicts in the sample_vms.json schema for rows [start, stop).
+        """
+        cpu, idle = self.snapshot() if snapshot is None else snapshot
+        stop = len(self) if stop is None else min(stop, len(self))
+        width = max(len(str(len(self))), 3)
+        tags = self.tag_lists(start, stop)
+
+        out = []
+        for offset, i in enumerate(range(start, stop)):
+            machine = int(self.machine_type[i])
+            out.append({
+                "name": f"vm-{i:0{width}d}",
+                "environment": ENVIRONMENTS[self.environment[i]],
+                "tags": tags[offset],
+                "owner": OWNERS[self.owner[i]],
+                "machine_type": self.machine_types[machine],
+                "vcpus": self.vcpus[machine],
+                "memory_gb": self.memory_gb[machine],
+                "region": self.regions[self.region[i]],
+                "hourly_cost": round(float(self.hourly_cost[i]), 2),
+                "cpu_utilization": round(float(cpu[i]), 1),
+                "peak_cpu_utilization": round(float(self.peak_cpu[i]), 1),
+                "idle_hours": int(idle[i]),
+                "state": "running",
+            })
+        return out
+
+
+def generate_fleet(count: int, seed: Optional[int] = 0, provider: str = "gcp") -> SyntheticFleet:
+    """
+    Generate `count` VMs. The same seed always produces the same fleet.
+    """
+    rng = np.random.default_rng(seed)
+
+    skus = sorted(get_catalog().skus(provider), key=lambda s: (s.region, s.machine_type))
+    if not skus:
+        raise ValueError(f"No pricing data for provider '{provider}'")
+
+    regions = tuple(sorted({s.region for s in skus}))
+    machine_types = tuple(sorted({s.machine_type for s in skus}))
+    shapes: Dict[str, Tuple[int, float]] = {s.machine_type: (s.vcpus, s.memory_gb) for s in skus}
+
+    # Price table [region, machine_type]; SKUs missing in a region are never drawn
+    prices = np.full((len(regions), len(machine_types)), np.nan)
+    for s in skus:
+        prices[regions.index(s.region), machine_types.index(s.machine_type)] = s.hourly_cost
+
+    environment = rng.choice(len(ENVIRONMENTS), size=count, p=ENVIRONMENT_WEIGHTS).astype(np.int8)
+
+    tags = np.zeros(count, dtype=np.uint8)
+    for bit, probability in enumerate(TAG_PROBABILITIES.values()):
+        tags |= (rng.random(count) < probability).astype(np.uint8) << bit
+
+    # A handful of teams own most of the fleet
+    owner_weights = 1.0 / np.arange(1, len(OWNERS) + 1)
+    owner = rng.choice(len(OWNERS), size=count, p=owner_weights / owner_weights.sum()).astype(np.int8)
+
+    region = rng.integers(0, len(regions), size=count).astype(np.int8)
+
+    # Small machines dominate; prod skews larger
+    vcpus = np.array([shapes[m][0] for m in machine_types], dtype=np.float64)
+    small = 1.0 / vcpus
+    large = 1.0 / np.sqrt(vcpus)
+    is_prod = environment == ENVIRONMENTS.index("prod")
+    machine_type = np.empty(count, dtype=np.int16)
+    for mask, weights in ((~is_prod, small), (is_prod, large)):
+        machine_type[mask] = rng.choice(len(machine_types), size=int(mask.sum()), p=weights / weights.sum())
+
+    hourly_cost = prices[region, machine_type]
+    missing = np.isnan(hourly_cost)
+    if missing.any():
+        # Fall back to the cheapest SKU offered in that region
+        cheapest = np.nanargmin(prices, axis=1)
+        machine_type[missing] = cheapest[region[missing]]
+        hourly_cost = prices[region, machine_type]
+
+    cumulative = PROFILE_WEIGHTS.cumsum(axis=1)
+    draw = rng.random(count)[:, None]
+    profile = (draw > cumulative[environment]).sum(axis=1).astype(np.int8)
+
+    def tagged(tag):
+        return (tags & (1 << TAGS.index(tag))) != 0
+
+    profile[tagged("web")] = PROFILES.index("always-on")
+    profile[tagged("batch") & (profile != PROFILES.index("always-on"))] = PROFILES.index("batch")
+
+    always_on = profile == PROFILES.index("always-on")
+    batch = profile == PROFILES.index("batch")
+
+    base_cpu = rng.gamma(2.0, 0.8, size=count).astype(np.float32)
+    base_cpu[always_on] = rng.uniform(15, 45, size=int(always_on.sum()))
+    peak_cpu = rng.uniform(25, 90, size=count).astype(np.float32)
+    peak_cpu = np.maximum(peak_cpu, base_cpu)
+    peak_cpu[profile == PROFILES.index("abandoned")] = base_cpu[profile == PROFILES.index("abandoned")]
+
+    start_hour = rng.integers(8, 11, size=count).astype(np.int8)
+    busy_hours = rng.integers(8, 11, size=count).astype(np.int8)
+    start_hour[batch] = rng.integers(0, 5, size=int(batch.sum()))
+    busy_hours[batch] = rng.integers(1, 5, size=int(batch.sum()))
+
+    offsets = np.array([UTC_OFFSETS.get(r.split("-")[0], 0) for r in regions], dtype=np.int8)
+
+    return SyntheticFleet(
+        environment=environment,
+        tags=tags,
+        owner=owner,
+        machine_type=machine_type,
+        region=region,
+        hourly_cost=hourly_cost,
+        profile=profile,
+        base_cpu=base_cpu,
+        peak_cpu=peak_cpu,
+        start_hour=start_hour,
+        busy_hours=busy_hours,
+        utc_offset=offsets[region],
+        weekend_active=rng.random(count) < 0.1,
+        machine_types=machine_types,
+        vcpus=tuple(shapes[m][0] for m in machine_types),
+        memory_gb=tuple(shapes[m][1] for m in machine_types),
+        regions=regions,
+        provider=provider,
+        seed=seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic VM fleet")
+    parser.add_argument("--count", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--provider", default="gcp")
+    parser.add_argument("--out", default="data/sample_vms.json")
+    args = parser.parse_args()
+
+    fleet = generate_fleet(args.count, seed=args.seed, provider=args.provider)
+    with open(args.out, "w") as f:
+        json.dump(fleet.records(), f, indent=2)
+
+    print(f"Wrote {len(fleet)} VMs to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,5 @@
 from .policy_engine import PolicyEngine, Decision
+from .prewarm import PrewarmScheduler
+from .rightsizing import RightsizingRecommender, PriceFrontier
+from .vectorized import VectorizedPolicyEngine, RecordColumns
+from .metrics import MetricsRegistry, Counter, Histogram, REGISTRY
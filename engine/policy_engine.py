@@ -1,12 +1,25 @@
+import time
 from enum import Enum
 from typing import List, Optional
 
-from policies.base_policy import BasePolicy, PolicyResult
+from engine.metrics import POLICY_BUCKETS, MetricsRegistry
+from policies.base_policy import (
+    BasePolicy,
+    PolicyResult,
+    NEVER_STOP,
+    REQUIRE_APPROVAL,
+    WARN,
+)
 
 
 class Decision(Enum):
     AUTO_STOP = "AUTO-STOP"
     SKIP = "SKIP"
+    RESUME = "RESUME"
+    RIGHTSIZE = "RIGHTSIZE"
+    WARN = "WARN"
+    APPROVAL_REQUIRED = "APPROVAL-REQUIRED"
+    NEVER_STOP = "NEVER-STOP"
 
 
 class PolicyEngine:
@@ -14,15 +27,48 @@ class PolicyEngine:
     Evaluates resources against policies and produces a final decision.
     Policy precedence:
     1. Any policy that returns allowed=False -> SKIP immediately
+       (NEVER-STOP if its action is NEVER_STOP)
     2. If at least one policy returns allowed=True -> AUTO-STOP
-    3. Otherwise -> SKIP
+       (APPROVAL-REQUIRED if a REQUIRE_APPROVAL policy also applies)
+    3. Otherwise, if a WARN policy applies -> WARN
+    4. Otherwise -> SKIP
     """
 
-    def __init__(self, policies: List[BasePolicy]):
+    def __init__(self, policies: List[BasePolicy], metrics: Optional[MetricsRegistry] = None):
+        """
+        :param policies: Policies in evaluation order
+        :param metrics: Registry for per-policy counts and latencies
+                        (None = no instrumentation, no overhead)
+        """
         self.policies = policies
+        self.metrics = metrics
+
+        if metrics is not None:
+            self._policy_results = metrics.counter(
+                "policy_evaluations_total",
+                "Policy evaluations by outcome (allow, deny, none, warn, require-approval)",
+                ("policy", "outcome"),
+            )
+            self._policy_latency = metrics.histogram(
+                "policy_evaluation_seconds",
+                "Time spent in a single policy's evaluate()",
+                ("policy",),
+                buckets=POLICY_BUCKETS,
+            )
+            self._decisions = metrics.counter(
+                "policy_decisions_total",
+                "Final engine decisions",
+                ("decision",),
+            )
+            # policy class -> (latency, counter per outcome) children
+            self._children = {}
 
     def evaluate(self, resource: dict) -> dict:
+        if self.metrics is not None:
+            return self._evaluate_instrumented(resource)
+
         allow_reasons = []
+        tiered = None
 
         for policy in self.policies:
             result: Optional[PolicyResult] = policy.evaluate(resource)
@@ -32,25 +78,109 @@ class PolicyEngine:
 
             # Absolute deny → stop immediately
             if result.allowed is False:
-                return {
-                    "resource_name": resource.get("name"),
-                    "decision": Decision.SKIP,
-                    "reason": result.reason,
-                }
+                return self._decide(resource, result, allow_reasons, tiered)
 
             # Conditional allow → record
-            if result.allowed is True:
+            if result.action is None:
                 allow_reasons.append(result.reason)
+            else:
+                # Warnings and approval gates are rare; collect them lazily
+                if tiered is None:
+                    tiered = []
+                tiered.append(result)
+
+        return self._decide(resource, None, allow_reasons, tiered)
+
+    @staticmethod
+    def _decide(
+        resource: dict,
+        denial: Optional[PolicyResult],
+        allow_reasons: List[str],
+        tiered: Optional[List[PolicyResult]],
+    ) -> dict:
+        name = resource.get("name")
+
+        if denial is not None:
+            decision = Decision.NEVER_STOP if denial.action == NEVER_STOP else Decision.SKIP
+            return {"resource_name": name, "decision": decision, "reason": denial.reason}
+
+        tiered = tiered or []
 
         if allow_reasons:
+            approvals = [r.reason for r in tiered if r.action == REQUIRE_APPROVAL]
+            if approvals:
+                return {
+                    "resource_name": name,
+                    "decision": Decision.APPROVAL_REQUIRED,
+                    "reason": " | ".join(allow_reasons + approvals),
+                }
             return {
-                "resource_name": resource.get("name"),
+                "resource_name": name,
                 "decision": Decision.AUTO_STOP,
                 "reason": " | ".join(allow_reasons),
             }
 
+        warnings = [r.reason for r in tiered if r.action == WARN]
+        if warnings:
+            return {
+                "resource_name": name,
+                "decision": Decision.WARN,
+                "reason": " | ".join(warnings),
+            }
+
         return {
-            "resource_name": resource.get("name"),
+            "resource_name": name,
             "decision": Decision.SKIP,
             "reason": "No policy conditions met for stopping",
         }
+
+    # --------------------------------
+    # Instrumented path
+    # --------------------------------
+    def _policy_children(self, policy: BasePolicy):
+        children = self._children.get(type(policy))
+        if children is None:
+            name = type(policy).__name__
+            children = self._children[type(policy)] = (
+                self._policy_latency.labels(name),
+                {
+                    outcome: self._policy_results.labels(name, outcome)
+                    for outcome in ("allow", "deny", "none", WARN, REQUIRE_APPROVAL)
+                },
+            )
+        return children
+
+    def _evaluate_instrumented(self, resource: dict) -> dict:
+        allow_reasons = []
+        tiered = []
+        denial = None
+
+        for policy in self.policies:
+            latency, outcomes = self._policy_children(policy)
+
+            started = time.perf_counter()
+            result: Optional[PolicyResult] = policy.evaluate(resource)
+            latency.observe(time.perf_counter() - started)
+
+            if result is None:
+                outcomes["none"].inc()
+                continue
+
+            if result.allowed is False:
+                outcomes["deny"].inc()
+                denial = result
+                break
+
+            if result.action is None:
+                outcomes["allow"].inc()
+                allow_reasons.append(result.reason)
+            else:
+                counter = outcomes.get(result.action)
+                if counter is None:
+                    counter = self._policy_results.labels(type(policy).__name__, result.action)
+                counter.inc()
+                tiered.append(result)
+
+        decision = self._decide(resource, denial, allow_reasons, tiered)
+        self._decisions.labels(decision["decision"].value).inc()
+        return decision
@@ -0,0 +1,232 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Union
+
+from engine.policy_engine import Decision
+
+HOURS_PER_WEEK = 24 * 7
+
+
+def _parse_timestamp(value: Union[str, datetime]) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def _week_slot(ts: datetime) -> int:
+    """
+    Hour-of-week bucket (0 = Monday 00:00, 167 = Sunday 23:00).
+    """
+    return ts.weekday() * 24 + ts.hour
+
+
+def _week_key(ts: datetime):
+    return (ts - timedelta(days=ts.weekday())).date()
+
+
+class _UsagePattern:
+    """
+    Per-VM weekly usage histogram.
+    Each hour-of-week slot counts how many distinct weeks it was observed
+    and in how many of those the VM was actually in use.
+
+    Samples are expected in time order: only the last week counted per slot
+    is kept, so memory stays fixed however long the VM is tracked.
+    """
+
+    def __init__(self):
+        self.observed = [0] * HOURS_PER_WEEK
+        self.active = [0] * HOURS_PER_WEEK
+        self._last_week = [None] * HOURS_PER_WEEK
+        self._last_active_week = [None] * HOURS_PER_WEEK
+
+    def add(self, ts: datetime, in_use: bool):
+        week, slot = _week_key(ts), _week_slot(ts)
+
+        last = self._last_week[slot]
+        if last is None or week > last:
+            self._last_week[slot] = week
+            self.observed[slot] += 1
+
+        last = self._last_active_week[slot]
+        if in_use and (last is None or week > last):
+            self._last_active_week[slot] = week
+            self.active[slot] += 1
+
+    def probability(self, slot: int) -> float:
+        if self.observed[slot] == 0:
+            return 0.0
+        return self.active[slot] / self.observed[slot]
+
+
+class PrewarmScheduler:
+    """
+    Predictive pre-warm for hibernated VMs.
+
+    Learns each VM's weekly usage pattern from its utilization history and
+    resumes a stopped VM a configurable lead time before its next predicted
+    use, so owners do not hit a cold start when they come back.
+
+    Decisions use the same output shape as PolicyEngine.
+    """
+
+    def __init__(
+        self,
+        lead_time_minutes: int = 30,
+        cpu_threshold: float = 5.0,
+        min_probability: float = 0.5,
+    ):
+        """
+        :param lead_time_minutes: How long before predicted use a VM is resumed
+        :param cpu_threshold: CPU % at or above which a sample counts as "in use"
+        :param min_probability: Share of observed weeks a slot must be in use
+                                to be predicted as active
+        """
+        self.lead_time = timedelta(minutes=lead_time_minutes)
+        self.cpu_threshold = cpu_threshold
+        self.min_probability = min_probability
+
+        self._patterns: Dict[str, _UsagePattern] = {}
+
+        # vm_name -> start of the predicted usage hour we resumed for
+        self._pending: Dict[str, datetime] = {}
+        self.hits = 0
+        self.misses = 0
+
+    # --------------------------------
+    # Learning
+    # --------------------------------
+    def learn(self, vm_name: str, history: List[dict]):
+        """
+        Learn a VM's weekly pattern from utilization history.
+
+        history example:
+        [
+            {"timestamp": "2024-01-01T09:00:00", "cpu_utilization": 42.0},
+            ...
+        ]
+        """
+        pattern = self._patterns.setdefault(vm_name, _UsagePattern())
+
+        for sample in history:
+            ts = _parse_timestamp(sample["timestamp"])
+            pattern.add(ts, sample["cpu_utilization"] >= self.cpu_threshold)
+
+    def usage_probability(self, vm_name: str, when: datetime) -> float:
+        pattern = self._patterns.get(vm_name)
+        if pattern is None:
+            return 0.0
+        return pattern.probability(_week_slot(when))
+
+    def next_predicted_use(self, vm_name: str, now: datetime) -> Optional[datetime]:
+        """
+        Start of the next hour (including the current one) in which the VM
+        is predicted to be in use, looking at most one week ahead.
+        """
+        pattern = self._patterns.get(vm_name)
+        if pattern is None:
+            return None
+
+        hour_start = now.replace(minute=0, second=0, microsecond=0)
+
+        for offset in range(HOURS_PER_WEEK):
+            candidate = hour_start + timedelta(hours=offset)
+            if pattern.probability(_week_slot(candidate)) >= self.min_probability:
+                return candidate
+
+        return None
+
+    # --------------------------------
+    # Decisions
+    # --------------------------------
+    def evaluate(self, resource: dict, now: datetime) -> dict:
+        """
+        Decide whether a hibernated VM should be resumed now.
+        Only resources with state == "stopped" are considered.
+        """
+        vm_name = resource.get("name")
+
+        if resource.get("state") != "stopped":
+            return {
+                "resource_name": vm_name,
+                "decision": Decision.SKIP,
+                "reason": "VM is not hibernated",
+            }
+
+        predicted = self.next_predicted_use(vm_name, now)
+
+        if predicted is None:
+            return {
+                "resource_name": vm_name,
+                "decision": Decision.SKIP,
+                "reason": "No recurring usage pattern learned",
+            }
+
+        if now < predicted - self.lead_time:
+            return {
+                "resource_name": vm_name,
+                "decision": Decision.SKIP,
+                "reason": f"Next predicted use at {predicted.isoformat()}",
+            }
+
+        # A different prediction replaces one that was never confirmed
+        previous = self._pending.get(vm_name)
+        if previous is not None and previous != predicted:
+            self.misses += 1
+        self._pending[vm_name] = predicted
+
+        return {
+            "resource_name": vm_name,
+            "decision": Decision.RESUME,
+            "reason": (
+                f"Predicted use at {predicted.isoformat()} "
+                f"(p={self.usage_probability(vm_name, predicted):.2f}, "
+                f"lead time {int(self.lead_time.total_seconds() // 60)}m)"
+            ),
+        }
+
+    # --------------------------------
+    # Feedback / hit rate
+    # --------------------------------
+    def record_usage(self, vm_name: str, timestamp: Union[str, datetime], cpu_utilization: float):
+        """
+        Feed an observed utilization sample back into the scheduler.
+
+        Updates the learned pattern and resolves any outstanding prediction:
+        - in use during the predicted hour -> hit
+        - predicted hour passed without use -> miss
+        """
+        ts = _parse_timestamp(timestamp)
+        in_use = cpu_utilization >= self.cpu_threshold
+
+        self._patterns.setdefault(vm_name, _UsagePattern()).add(ts, in_use)
+
+        predicted = self._pending.get(vm_name)
+        if predicted is None:
+            return
+
+        window_end = predicted + timedelta(hours=1)
+
+        if predicted <= ts < window_end and in_use:
+            self.hits += 1
+            del self._pending[vm_name]
+        elif ts >= window_end:
+            self.misses += 1
+            del self._pending[vm_name]
+
+    def hit_rate(self) -> float:
+        """
+        Share of resolved predictions where the VM was actually used.
+        """
+        resolved = self.hits + self.misses
+        if resolved == 0:
+            return 0.0
+        return self.hits / resolved
+
+    def stats(self) -> dict:
+        return {
+            "predictions": self.hits + self.misses + len(self._pending),
+            "hits": self.hits,
+            "misses": self.misses,
+            "pending": len(self._pending),
+            "hit_rate": round(self.hit_rate(), 4),
+        }
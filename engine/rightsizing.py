@@ -0,0 +1,187 @@
+"""
+Rightsizing recommender
+Finds the cheapest machine type that fits each VM's observed peak usage
+
+For every (provider, region) the catalog is reduced once to a sorted
+price/vCPU/memory frontier and a cheapest-fit lookup table over the
+distinct vCPU and memory sizes. Recommending for a fleet is then two
+binary searches and a table read per VM, vectorized with NumPy.
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from cost.cost_model import CostModel
+from cost.pricing_catalog import default_region, PricingCatalog, SkuPrice, get_catalog
+from engine.policy_engine import Decision
+
+
+class PriceFrontier:
+    """
+    Price/performance frontier for one provider and region.
+
+    Only SKUs that are not dominated (no cheaper SKU with at least as many
+    vCPUs and as much memory) are kept, sorted by price.
+    """
+
+    def __init__(self, skus: List[SkuPrice]):
+        frontier: List[SkuPrice] = []
+
+        for sku in sorted(skus, key=lambda s: (s.hourly_cost, -s.vcpus, -s.memory_gb)):
+            dominated = any(
+                kept.vcpus >= sku.vcpus and kept.memory_gb >= sku.memory_gb
+                for kept in frontier
+            )
+            if not dominated:
+                frontier.append(sku)
+
+        self.skus = frontier
+        self.vcpu_levels = np.array(sorted({s.vcpus for s in frontier}), dtype=np.float64)
+        self.memory_levels = np.array(sorted({s.memory_gb for s in frontier}), dtype=np.float64)
+
+        # table[i, j] -> cheapest SKU with vcpus >= vcpu_levels[i]
+        # and memory >= memory_levels[j] (-1 if none)
+        self.table = np.full((len(self.vcpu_levels), len(self.memory_levels)), -1, dtype=np.int64)
+
+        # Fill most expensive first so cheaper SKUs overwrite
+        for idx in range(len(frontier) - 1, -1, -1):
+            sku = frontier[idx]
+            i = np.searchsorted(self.vcpu_levels, sku.vcpus, side="right")
+            j = np.searchsorted(self.memory_levels, sku.memory_gb, side="right")
+            self.table[:i, :j] = idx
+
+    def cheapest_fit(self, vcpus: np.ndarray, memory_gb: np.ndarray) -> np.ndarray:
+        """
+        Index into self.skus of the cheapest fitting SKU per requirement (-1 if none).
+        """
+        if len(self.skus) == 0:
+            return np.full(len(vcpus), -1, dtype=np.int64)
+
+        i = np.searchsorted(self.vcpu_levels, vcpus, side="left")
+        j = np.searchsorted(self.memory_levels, memory_gb, side="left")
+        fits = (i < len(self.vcpu_levels)) & (j < len(self.memory_levels))
+
+        result = np.full(len(vcpus), -1, dtype=np.int64)
+        result[fits] = self.table[i[fits], j[fits]]
+        return result
+
+
+class RightsizingRecommender:
+    """
+    Recommends cheaper machine types for over-provisioned VMs.
+    Output uses the same resource_name / decision / reason shape as PolicyEngine.
+    """
+
+    def __init__(
+        self,
+        catalog: Optional[PricingCatalog] = None,
+        target_utilization: float = 0.8,
+        min_monthly_savings: float = 0.0,
+    ):
+        """
+        :param catalog: Pricing catalog (defaults to the shared one)
+        :param target_utilization: Peak utilization the new type should run at
+        :param min_monthly_savings: Ignore recommendations saving less than this
+        """
+        self.catalog = catalog or get_catalog()
+        self.target_utilization = target_utilization
+        self.min_monthly_savings = min_monthly_savings
+        self._frontiers: Dict[Tuple[str, str], PriceFrontier] = {}
+
+    def frontier(self, provider: str, region: str) -> PriceFrontier:
+        key = (provider.lower(), region.lower())
+        if key not in self._frontiers:
+            self._frontiers[key] = PriceFrontier(list(self.catalog.skus(provider, region)))
+        return self._frontiers[key]
+
+    def evaluate(self, resource: dict) -> dict:
+        return self.recommend([resource])[0]
+
+    def recommend(self, resources: List[dict]) -> List[dict]:
+        results: List[Optional[dict]] = [None] * len(resources)
+        groups = defaultdict(list)
+
+        for pos, resource in enumerate(resources):
+            provider = resource.get("provider", "gcp")
+            region = resource.get("region") or default_region(provider)
+            current = self.catalog.lookup(provider, region, resource.get("machine_type", ""))
+
+            if current is None:
+                results[pos] = self._skip(
+                    resource,
+                    f"Unknown SKU {provider}/{region}/{resource.get('machine_type')}",
+                )
+                continue
+
+            groups[(provider, region)].append((pos, current))
+
+        for (provider, region), members in groups.items():
+            frontier = self.frontier(provider, region)
+            positions = [pos for pos, _ in members]
+            required_vcpus, required_memory = self._requirements(
+                [resources[pos] for pos in positions], [current for _, current in members]
+            )
+            fits = frontier.cheapest_fit(required_vcpus, required_memory)
+
+            for k, (pos, current) in enumerate(members):
+                results[pos] = self._result(
+                    resources[pos], current,
+                    frontier.skus[fits[k]] if fits[k] >= 0 else None,
+                    required_vcpus[k], required_memory[k],
+                )
+
+        return results
+
+    # --------------------------------
+    # Helpers
+    # --------------------------------
+    def _requirements(self, resources: List[dict], current: List[SkuPrice]):
+        vcpus = np.array([c.vcpus for c in current], dtype=np.float64)
+        memory = np.array([c.memory_gb for c in current], dtype=np.float64)
+        # Without peak telemetry assume the VM needs all of its vCPUs and
+        # memory; a single current reading is no basis for downsizing
+        peak_cpu = np.array(
+            [r.get("peak_cpu_utilization", 100 * self.target_utilization) for r in resources],
+            dtype=np.float64,
+        )
+        peak_memory = np.array(
+            [r.get("peak_memory_utilization", 100 * self.target_utilization) for r in resources],
+            dtype=np.float64,
+        )
+
+        required_vcpus = vcpus * peak_cpu / 100 / self.target_utilization
+        required_memory = memory * peak_memory / 100 / self.target_utilization
+        return required_vcpus, required_memory
+
+    def _result(self, resource, current: SkuPrice, best: Optional[SkuPrice], vcpus, memory) -> dict:
+        if best is None:
+            return self._skip(resource, "No catalog machine type fits observed peak usage")
+
+        savings = CostModel(current.hourly_cost).monthly() - CostModel(best.hourly_cost).monthly()
+
+        if best.machine_type == current.machine_type or savings <= self.min_monthly_savings:
+            return self._skip(resource, f"{current.machine_type} is already the cheapest fit")
+
+        return {
+            "resource_name": resource.get("name"),
+            "decision": Decision.RIGHTSIZE,
+            "reason": (
+                f"Peak usage needs {vcpus:.1f} vCPU / {memory:.1f} GB; "
+                f"{best.machine_type} ({best.vcpus} vCPU, {best.memory_gb:g} GB) "
+                f"fits for ₹{savings:.0f}/month less than {current.machine_type}"
+            ),
+            "recommended_machine_type": best.machine_type,
+            "monthly_savings": round(savings, 2),
+        }
+
+    @staticmethod
+    def _skip(resource: dict, reason: str) -> dict:
+        return {
+            "resource_name": resource.get("name"),
+            "decision": Decision.SKIP,
+            "reason": reason,
+            "recommended_machine_type": None,
+            "monthly_savings": 0.0,
+        }
@@ -0,0 +1,197 @@
+"""
+Vectorized policy evaluation
+Whole-fleet counterpart of PolicyEngine (NumPy)
+
+The built-in policies are compiled into boolean masks over fleet columns,
+following PolicyEngine's precedence: the first veto in policy order wins
+(SKIP or NEVER-STOP), then idle rules stop a VM (APPROVAL-REQUIRED when an
+approval tag applies), then idle warnings. Columns come from any object
+exposing
+
+- environment_in(environments) -> bool array
+- has_any_tag(tags) -> bool array
+
+such as SyntheticFleet, or RecordColumns for plain VM dicts.
+"""
+
+from typing import Collection, List, Sequence, Tuple
+
+import numpy as np
+
+from engine.policy_engine import Decision
+from policies.base_policy import NEVER_STOP
+from policies.vm_policies import (
+    ApprovalRequiredPolicy,
+    IdleWarningPolicy,
+    NeverStopProdPolicy,
+    NeverStopTaggedPolicy,
+    StopIdleVMPolicy,
+)
+
+# Decision codes used by decide(); DECISIONS[code] is the Decision
+DECISIONS = (
+    Decision.SKIP,
+    Decision.AUTO_STOP,
+    Decision.APPROVAL_REQUIRED,
+    Decision.WARN,
+    Decision.NEVER_STOP,
+)
+SKIP, AUTO_STOP, APPROVAL_REQUIRED, WARN, NEVER_STOP_CODE = range(len(DECISIONS))
+
+
+class RecordColumns:
+    """
+    Column view over VM dicts (environment, tags, cpu_utilization, idle_hours).
+    """
+
+    def __init__(self, vms: List[dict]):
+        self.environment = np.array([vm.get("environment") for vm in vms], dtype=object)
+        self.tags = [vm.get("tags", []) for vm in vms]
+        self.cpu_utilization = np.fromiter(
+            (vm.get("cpu_utilization", 100) for vm in vms), dtype=np.float64, count=len(vms)
+        )
+        self.idle_hours = np.fromiter(
+            (vm.get("idle_hours", 0) for vm in vms), dtype=np.float64, count=len(vms)
+        )
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def environment_in(self, environments: Collection[str]) -> np.ndarray:
+        return np.isin(self.environment, list(environments))
+
+    def has_any_tag(self, tags: Collection[str]) -> np.ndarray:
+        wanted = set(tags)
+        return np.fromiter(
+            (not wanted.isdisjoint(vm_tags) for vm_tags in self.tags),
+            dtype=bool,
+            count=len(self.tags),
+        )
+
+
+class VectorizedPolicyEngine:
+    """
+    Evaluates a policy list for a whole fleet at once.
+    """
+
+    def __init__(self, policies: list):
+        """
+        :param policies: Built-in policy instances (NeverStopProdPolicy,
+                         NeverStopTaggedPolicy, ApprovalRequiredPolicy,
+                         StopIdleVMPolicy, IdleWarningPolicy)
+        """
+        # (decision code, "environment" | "tags", values) in policy order
+        self.vetoes: List[Tuple[int, str, Tuple[str, ...]]] = []
+        self.approval_tags = set()
+        # (cpu_threshold, idle_hours) per StopIdleVMPolicy / IdleWarningPolicy
+        self.idle_rules: List[Tuple[float, float]] = []
+        self.warn_rules: List[Tuple[float, float]] = []
+
+        for policy in policies:
+            if isinstance(policy, NeverStopProdPolicy):
+                self.vetoes.append((SKIP, "environment", tuple(policy.ENVIRONMENTS)))
+            elif isinstance(policy, NeverStopTaggedPolicy):
+                code = NEVER_STOP_CODE if policy.action == NEVER_STOP else SKIP
+                self.vetoes.append((code, "tags", policy.tags))
+            elif isinstance(policy, ApprovalRequiredPolicy):
+                self.approval_tags.update(policy.tags)
+            elif isinstance(policy, StopIdleVMPolicy):
+                self.idle_rules.append((policy.cpu_threshold, policy.idle_hours))
+            elif isinstance(policy, IdleWarningPolicy):
+                self.warn_rules.append((policy.cpu_threshold, policy.idle_hours))
+            else:
+                raise TypeError(
+                    f"{type(policy).__name__} has no vectorized form; "
+                    f"evaluate it with PolicyEngine"
+                )
+
+    # --------------------------------
+    # Static masks (depend only on environment / tags)
+    # --------------------------------
+    @staticmethod
+    def _veto_mask(columns, kind: str, values) -> np.ndarray:
+        if kind == "environment":
+            return columns.environment_in(values)
+        return columns.has_any_tag(values)
+
+    def veto_codes(self, columns) -> np.ndarray:
+        """
+        Decision code of the first veto per VM (-1 where nothing vetoes).
+        Static per VM, so callers stepping through time compute it once.
+        """
+        codes = np.full(len(columns), -1, dtype=np.int8)
+        # Reverse order so the first policy in the list wins
+        for code, kind, values in reversed(self.vetoes):
+            codes[self._veto_mask(columns, kind, values)] = code
+        return codes
+
+    def protected(self, columns) -> np.ndarray:
+        """
+        VMs that some policy vetoes stopping.
+        """
+        mask = np.zeros(len(columns), dtype=bool)
+        for _, kind, values in self.vetoes:
+            mask |= self._veto_mask(columns, kind, values)
+        return mask
+
+    def gated(self, columns) -> np.ndarray:
+        """
+        VMs whose stop needs approval.
+        """
+        if not self.approval_tags:
+            return np.zeros(len(columns), dtype=bool)
+        return columns.has_any_tag(self.approval_tags)
+
+    # --------------------------------
+    # Dynamic masks (depend on utilization)
+    # --------------------------------
+    @staticmethod
+    def _rules_mask(rules, cpu, idle_hours) -> np.ndarray:
+        cpu = np.asarray(cpu)
+        idle_hours = np.asarray(idle_hours)
+
+        mask = np.zeros(cpu.shape, dtype=bool)
+        for cpu_threshold, hours in rules:
+            mask |= (cpu < cpu_threshold) & (idle_hours >= hours)
+        return mask
+
+    def idle(self, cpu: Sequence[float], idle_hours: Sequence[float]) -> np.ndarray:
+        return self._rules_mask(self.idle_rules, cpu, idle_hours)
+
+    def warned(self, cpu: Sequence[float], idle_hours: Sequence[float]) -> np.ndarray:
+        return self._rules_mask(self.warn_rules, cpu, idle_hours)
+
+    def stop_mask(self, cpu, idle_hours, protected: np.ndarray, gated=None) -> np.ndarray:
+        """
+        True where PolicyEngine would return AUTO-STOP.
+        """
+        mask = self.idle(cpu, idle_hours) & ~protected
+        if gated is not None:
+            mask &= ~gated
+        return mask
+
+    def decide(self, columns, cpu, idle_hours) -> np.ndarray:
+        """
+        Decision codes (indexes into DECISIONS), matching PolicyEngine.
+        """
+        vetoes = self.veto_codes(columns)
+        stop = self.idle(cpu, idle_hours)
+
+        codes = np.where(
+            stop,
+            np.where(self.gated(columns), APPROVAL_REQUIRED, AUTO_STOP),
+            np.where(self.warned(cpu, idle_hours), WARN, SKIP),
+        ).astype(np.int8)
+        return np.where(vetoes >= 0, vetoes, codes)
+
+    def evaluate(self, vms: List[dict]) -> np.ndarray:
+        """
+        Stop (AUTO-STOP) mask for plain VM dicts.
+        """
+        columns = RecordColumns(vms)
+        return self.decide(columns, columns.cpu_utilization, columns.idle_hours) == AUTO_STOP
+
+    def decisions(self, vms: List[dict]) -> List[Decision]:
+        columns = RecordColumns(vms)
+        codes = self.decide(columns, columns.cpu_utilization, columns.idle_hours)
+        return [DECISIONS[code] for code in codes.tolist()]
@@ -1,21 +1,29 @@
 import os
-from typing import Dict
+from typing import Dict, Optional
 
+from engine.metrics import MetricsRegistry
 from engine.policy_engine import Decision
+from utils.optional_deps import is_available
 
-try:
+
+# The compute client is imported only when a VM is really stopped or started
+GCP_AVAILABLE = is_available("google.cloud.compute_v1")
+
+
+def _instances_client():
     from google.cloud import compute_v1
-    GCP_AVAILABLE = True
-except ImportError:
-    GCP_AVAILABLE = False
+    return compute_v1.InstancesClient()
 
 
 class GCPExecutor:
     """
-    Executes VM stop actions on GCP in a strictly gated manner.
+    Executes VM stop and resume actions on GCP in a strictly gated manner.
     """
 
-    def __init__(self):
+    def __init__(self, metrics: Optional[MetricsRegistry] = None):
+        """
+        :param metrics: Registry for per-outcome execution counts
+        """
         self.execution_enabled = os.getenv("EXECUTION_ENABLED", "false").lower() == "true"
         self.dry_run = os.getenv("DRY_RUN", "true").lower() == "true"
 
@@ -26,52 +34,78 @@ class GCPExecutor:
         self.project_id = os.getenv("GCP_PROJECT_ID")
         self.zone = os.getenv("GCP_ZONE")
 
-    def execute(self, decision_result: Dict):
+        self._outcomes = None
+        if metrics is not None:
+            self._outcomes = metrics.counter(
+                "executor_actions_total",
+                "Executor results by action and outcome",
+                ("action", "outcome"),
+            )
+
+    def execute(self, decision_result: Dict) -> str:
         """
         Executes action based on decision result.
+        Returns the outcome (e.g. "dry-run", "not-allowlisted", "success").
         """
         vm_name = decision_result["resource_name"]
         decision = decision_result["decision"]
 
         print(f"\n[EXECUTION] Evaluating VM: {vm_name}")
 
+        action = {Decision.AUTO_STOP: "stop", Decision.RESUME: "start"}.get(decision, "none")
+
         # Gate 1: decision check
-        if decision != Decision.AUTO_STOP:
-            print("[SKIP] Decision is not AUTO-STOP")
-            return
+        if action == "none":
+            print("[SKIP] Decision is not AUTO-STOP or RESUME")
+            return self._record(action, "not-actionable")
 
         # Gate 2: execution flag
         if not self.execution_enabled:
             print("[SKIP] EXECUTION_ENABLED=false")
-            return
+            return self._record(action, "disabled")
 
         # Gate 3: allowlist
         if vm_name not in self.allowlist:
             print("[SKIP] VM not in allowlist")
-            return
+            return self._record(action, "not-allowlisted")
 
         # Gate 4: dry run
         if self.dry_run:
-            print(f"[DRY-RUN] Would stop VM '{vm_name}'")
-            return
+            print(f"[DRY-RUN] Would {action} VM '{vm_name}'")
+            return self._record(action, "dry-run")
 
         # Gate 5: GCP availability
         if not GCP_AVAILABLE:
             print("[ERROR] google-cloud-compute not installed")
-            return
-
-        print(f"[ACTION] Stopping VM '{vm_name}' on GCP")
-        self._stop_vm(vm_name)
-
-    def _stop_vm(self, vm_name: str):
+            return self._record(action, "unavailable")
+
+        try:
+            if decision == Decision.RESUME:
+                print(f"[ACTION] Starting VM '{vm_name}' on GCP")
+                outcome = self._start_vm(vm_name)
+            else:
+                print(f"[ACTION] Stopping VM '{vm_name}' on GCP")
+                outcome = self._stop_vm(vm_name)
+        except Exception as exc:
+            print(f"[ERROR] {action} failed for {vm_name}: {exc}")
+            outcome = "error"
+
+        return self._record(action, outcome)
+
+    def _record(self, action: str, outcome: str) -> str:
+        if self._outcomes is not None:
+            self._outcomes.labels(action, outcome).inc()
+        return outcome
+
+    def _stop_vm(self, vm_name: str) -> str:
         """
         Stops a VM on GCP.
         """
         if not self.project_id or not self.zone:
             print("[ERROR] GCP_PROJECT_ID or GCP_ZONE not set")
-            return
+            return "misconfigured"
 
-        client = compute_v1.InstancesClient()
+        client = _instances_client()
 
         operation = client.stop(
             project=self.project_id,
@@ -80,3 +114,23 @@ class GCPExecutor:
         )
 
         print(f"[SUCCESS] Stop operation initiated for {vm_name}")
+        return "success"
+
+    def _start_vm(self, vm_name: str) -> str:
+        """
+        Starts (resumes) a hibernated VM on GCP.
+        """
+        if not self.project_id or not self.zone:
+            print("[ERROR] GCP_PROJECT_ID or GCP_ZONE not set")
+            return "misconfigured"
+
+        client = _instances_client()
+
+        operation = client.start(
+            project=self.project_id,
+            zone=self.zone,
+            instance=vm_name,
+        )
+
+        print(f"[SUCCESS] Start operation initiated for {vm_name}")
+        return "success"
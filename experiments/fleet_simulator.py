@@ -0,0 +1,216 @@
+"""
+Fleet simulator
+Time-stepped simulation of auto-hibernation over weeks (NumPy)
+
+Every simulated hour:
+
+1. the synthetic fleet produces CPU demand for every VM,
+2. stopped VMs with demand are resumed (counted as a cold start),
+3. the hour is billed for every running VM,
+4. on evaluation hours the policies stop idle, unprotected VMs.
+
+Spend is accumulated through FleetCostModel (same arithmetic as
+CostModel) and compared with an always-on baseline.
+
+Usage:
+    python -m experiments.fleet_simulator --vms 100000 --weeks 2
+"""
+
+import argparse
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from cost.fleet_cost import FleetCostModel
+from data.synthetic_fleet import ENVIRONMENTS, SyntheticFleet, generate_fleet
+from engine.vectorized import VectorizedPolicyEngine
+from policies.vm_policies import (
+    NeverStopProdPolicy,
+    NeverStopTaggedPolicy,
+    StopIdleVMPolicy,
+)
+
+
+@dataclass
+class SimulationResult:
+    """
+    Totals in INR over the simulated period.
+    """
+    vm_count: int
+    hours: int
+    baseline_cost: float
+    actual_cost: float
+    savings: float
+    idle_leakage: float
+    stops: int
+    resumes: int
+    # One entry per simulated day
+    timeline: List[dict] = field(default_factory=list)
+    by_environment: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+
+class HibernationSimulator:
+    """
+    Steps a synthetic fleet through time under a policy set.
+    """
+
+    def __init__(
+        self,
+        fleet: SyntheticFleet,
+        policies: list,
+        activity_threshold: float = 5.0,
+        evaluation_interval: int = 1,
+        seed: Optional[int] = None,
+    ):
+        """
+        :param fleet: Fleet to simulate
+        :param policies: Policies compiled with VectorizedPolicyEngine
+        :param activity_threshold: CPU % at which a VM is in use (resumes if stopped)
+        :param evaluation_interval: Hours between policy evaluations
+        :param seed: Seed for the utilization stream
+        """
+        self.fleet = fleet
+        self.engine = VectorizedPolicyEngine(policies)
+        self.activity_threshold = activity_threshold
+        self.evaluation_interval = evaluation_interval
+        self.seed = seed
+
+    def run(self, hours: int) -> SimulationResult:
+        n = len(self.fleet)
+        cost_model = FleetCostModel(self.fleet.hourly_cost)
+        hourly = cost_model.hourly()
+        protected = self.engine.protected(self.fleet)
+        # Approval-gated VMs are never stopped automatically
+        gated = self.engine.gated(self.fleet)
+
+        running = np.ones(n, dtype=bool)
+        idle_hours = np.zeros(n, dtype=np.float32)
+        running_hours = np.zeros(n, dtype=np.int32)
+        idle_running_hours = np.zeros(n, dtype=np.int32)
+        observed = np.zeros(n, dtype=np.float32)
+
+        stops = resumes = 0
+        timeline = []
+        day = {"stops": 0, "resumes": 0, "cost": 0.0, "running": 0}
+
+        stream = self.fleet.utilization_stream(hours, seed=self.seed)
+        for hour, cpu in enumerate(stream):
+            active = cpu >= self.activity_threshold
+
+            resumed = active & ~running
+            running |= resumed
+
+            idle_hours += 1
+            idle_hours *= ~active
+
+            running_hours += running
+            idle_running_hours += running & ~active
+            day["cost"] += float(hourly @ running)
+            day["running"] += int(running.sum())
+
+            if (hour + 1) % self.evaluation_interval == 0:
+                # Stopped VMs report no CPU; idle streaks keep counting
+                np.multiply(cpu, running, out=observed)
+                stop = running & self.engine.stop_mask(observed, idle_hours, protected, gated)
+                running &= ~stop
+                day["stops"] += int(stop.sum())
+
+            day["resumes"] += int(resumed.sum())
+
+            if (hour + 1) % 24 == 0 or hour + 1 == hours:
+                steps = hour % 24 + 1
+                timeline.append({
+                    "day": hour // 24 + 1,
+                    "avg_running": round(day["running"] / steps, 1),
+                    "stops": day["stops"],
+                    "resumes": day["resumes"],
+                    "cost": round(day["cost"], 2),
+                })
+                stops += day["stops"]
+                resumes += day["resumes"]
+                day = {"stops": 0, "resumes": 0, "cost": 0.0, "running": 0}
+
+        baseline = cost_model.cost_for_hours(np.full(n, hours))
+        actual = cost_model.cost_for_hours(running_hours)
+        leakage = cost_model.cost_leakage(idle_running_hours)
+
+        by_environment = {}
+        for code, label in enumerate(ENVIRONMENTS):
+            rows = self.fleet.environment == code
+            by_environment[label] = {
+                "vm_count": int(rows.sum()),
+                "baseline_cost": round(float(baseline[rows].sum()), 2),
+                "actual_cost": round(float(actual[rows].sum()), 2),
+                "savings": round(float(baseline[rows].sum() - actual[rows].sum()), 2),
+            }
+
+        return SimulationResult(
+            vm_count=n,
+            hours=hours,
+            baseline_cost=round(float(baseline.sum()), 2),
+            actual_cost=round(float(actual.sum()), 2),
+            savings=round(float(baseline.sum() - actual.sum()), 2),
+            idle_leakage=round(float(leakage.sum()), 2),
+            stops=stops,
+            resumes=resumes,
+            timeline=timeline,
+            by_environment=by_environment,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time-stepped auto-hibernation simulation")
+    parser.add_argument("--vms", type=int, default=10_000)
+    parser.add_argument("--weeks", type=float, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cpu-threshold", type=float, default=5.0)
+    parser.add_argument("--idle-hours", type=int, default=24)
+    parser.add_argument("--interval", type=int, default=1, help="Hours between evaluations")
+    args = parser.parse_args()
+
+    print("\n=== Cloud Auto-Hibernation Simulation ===\n")
+
+    started = time.perf_counter()
+    fleet = generate_fleet(args.vms, seed=args.seed)
+    generated = time.perf_counter()
+
+    policies = [
+        NeverStopProdPolicy(),
+        NeverStopTaggedPolicy(),
+        StopIdleVMPolicy(cpu_threshold=args.cpu_threshold, idle_hours=args.idle_hours),
+    ]
+    simulator = HibernationSimulator(
+        fleet, policies, evaluation_interval=args.interval, seed=args.seed
+    )
+    result = simulator.run(int(args.weeks * 24 * 7))
+    finished = time.perf_counter()
+
+    for day in result.timeline:
+        print(
+            f"Day {day['day']:>3}: running {day['avg_running']:>12,.1f}  "
+            f"stops {day['stops']:>9,}  resumes {day['resumes']:>9,}  "
+            f"cost ₹{day['cost']:,.2f}"
+        )
+
+    print("-" * 50)
+    for env, totals in result.by_environment.items():
+        print(f"{env:<8} {totals['vm_count']:>9,} VMs  savings ₹{totals['savings']:,.2f}")
+
+    print("-" * 50)
+    print(f"VMs            : {result.vm_count:,}")
+    print(f"Simulated hours: {result.hours}")
+    print(f"Always-on cost : ₹{result.baseline_cost:,.2f}")
+    print(f"Actual cost    : ₹{result.actual_cost:,.2f}")
+    print(f"Savings        : ₹{result.savings:,.2f}")
+    print(f"Idle leakage   : ₹{result.idle_leakage:,.2f}")
+    print(f"Stops / resumes: {result.stops:,} / {result.resumes:,}")
+    print(
+        f"\nGenerated in {generated - started:.2f}s, "
+        f"simulated in {finished - generated:.2f}s\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,6 @@ from policies.vm_policies import (
     StopIdleVMPolicy,
 )
 from engine.policy_engine import PolicyEngine, Decision
-from cost.cost_model import CostModel
 
 
 def load_vms(path: str):
@@ -15,6 +14,9 @@ def load_vms(path: str):
 
 
 def main():
+    # NumPy (via fleet_cost) is only loaded when the dry run actually runs
+    from cost.fleet_cost import fleet_cost
+
     print("\n=== Cloud Auto-Hibernation Dry Run ===\n")
 
     # Load mock VM data
@@ -30,28 +32,27 @@ def main():
     # Initialize engine
     engine = PolicyEngine(policies)
 
-    total_prevented_savings = 0.0
+    evaluations = [engine.evaluate(vm) for vm in vms]
+
+    # Cost calculation (whole fleet in one pass)
+    fleet = fleet_cost(vms, [e["decision"] for e in evaluations])
+    total_prevented_savings = fleet.totals["savings"]
 
-    for vm in vms:
+    for i, (vm, decision_result) in enumerate(zip(vms, evaluations)):
         print(f"VM: {vm['name']}")
 
         # Decision
-        decision_result = engine.evaluate(vm)
         decision = decision_result["decision"]
         reason = decision_result["reason"]
 
         print(f"  Decision : {decision.value}")
         print(f"  Reason   : {reason}")
 
-        # Cost calculation
-        cost_model = CostModel(hourly_cost=vm["hourly_cost"])
-
         if decision == Decision.AUTO_STOP:
-            savings = cost_model.monthly()
-            total_prevented_savings += savings
+            savings = fleet.savings[i]
             print(f"  💰 Prevented monthly cost leakage: ₹{savings:.2f}")
         else:
-            leakage = cost_model.cost_leakage(vm["idle_hours"])
+            leakage = fleet.leakage[i]
             print(f"  ℹ️  Potential cost leakage if idle: ₹{leakage:.2f}")
 
         print("-" * 50)
@@ -0,0 +1,377 @@
+"""
+Threshold sweep
+What-if replay of idle thresholds over recorded fleet snapshots (NumPy)
+
+Every combination of
+
+- cpu_idle_threshold   (CPU % below which a VM counts as idle)
+- idle_stop_minutes    (idle time before AUTO-STOP / APPROVAL-REQUIRED)
+- idle_warn_minutes    (idle time before WARN)
+
+is evaluated against every snapshot in one pass. Instead of running the
+engine once per combination, each snapshot is binned once against the
+threshold grid and cumulative sums over the bins give, for all
+thresholds at once, how many VMs satisfy `cpu < threshold` and
+`idle >= hours` (the StopIdleVMPolicy / IdleWarningPolicy conditions).
+
+The replay assumes recorded utilization: stopping a VM does not change
+what later snapshots show. For each combination it reports
+
+- stops        new AUTO-STOP decisions (not already stopped at the previous snapshot)
+- approvals    new APPROVAL-REQUIRED decisions
+- warnings     WARN decisions summed over snapshots
+- false_stops  AUTO-STOP decisions for VMs that are active at the next snapshot
+- savings      INR saved by AUTO-STOP decisions that were not false stops
+
+Usage:
+    python -m experiments.threshold_sweep --vms 100000 --days 7
+"""
+
+import argparse
+import time
+from dataclasses import dataclass
+from itertools import product
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from data.synthetic_fleet import IDLE_CPU, SyntheticFleet, generate_fleet
+from engine.vectorized import VectorizedPolicyEngine
+from policies.vm_policies import (
+    ApprovalRequiredPolicy,
+    NeverStopProdPolicy,
+    NeverStopTaggedPolicy,
+)
+
+# Snapshots binned per chunk; bounds the temporary index arrays
+CHUNK = 16
+
+
+@dataclass
+class FleetHistory:
+    """
+    Point-in-time fleet snapshots, oldest first. Row t of each array is
+    the view PolicyEngine would have evaluated at snapshot t.
+    """
+    cpu: np.ndarray              # float32 [snapshots, vms], CPU %
+    idle_hours: np.ndarray       # float32 [snapshots, vms]
+    interval_hours: float = 1.0  # time between snapshots
+    activity_threshold: float = IDLE_CPU
+    fleet_seed: Optional[int] = None  # generate_fleet() seed, to rebuild the fleet
+
+    def __len__(self) -> int:
+        return len(self.cpu)
+
+    @property
+    def vm_count(self) -> int:
+        return self.cpu.shape[1]
+
+    def save(self, path: str):
+        np.savez_compressed(
+            path,
+            cpu=self.cpu,
+            idle_hours=self.idle_hours,
+            interval_hours=self.interval_hours,
+            activity_threshold=self.activity_threshold,
+            # -1: no seed recorded
+            fleet_seed=-1 if self.fleet_seed is None else self.fleet_seed,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "FleetHistory":
+        with np.load(path) as data:
+            fleet_seed = int(data["fleet_seed"]) if "fleet_seed" in data else -1
+            return cls(
+                cpu=data["cpu"],
+                idle_hours=data["idle_hours"],
+                interval_hours=float(data["interval_hours"]),
+                activity_threshold=float(data["activity_threshold"]),
+                fleet_seed=None if fleet_seed < 0 else fleet_seed,
+            )
+
+
+def record_history(
+    fleet: SyntheticFleet,
+    hours: int,
+    interval: int = 1,
+    seed: Optional[int] = None,
+    activity_threshold: float = IDLE_CPU,
+) -> FleetHistory:
+    """
+    Snapshot the fleet every `interval` hours while it runs always-on.
+    """
+    n = len(fleet)
+    idle = np.zeros(n, dtype=np.float32)
+    cpu_rows, idle_rows = [], []
+
+    for hour, cpu in enumerate(fleet.utilization_stream(hours, seed=seed)):
+        idle += 1
+        idle *= cpu < activity_threshold
+        if (hour + 1) % interval == 0:
+            cpu_rows.append(cpu.copy())
+            idle_rows.append(idle.copy())
+
+    return FleetHistory(
+        cpu=np.stack(cpu_rows) if cpu_rows else np.zeros((0, n), dtype=np.float32),
+        idle_hours=np.stack(idle_rows) if idle_rows else np.zeros((0, n), dtype=np.float32),
+        interval_hours=float(interval),
+        activity_threshold=activity_threshold,
+        fleet_seed=fleet.seed,
+    )
+
+
+@dataclass
+class SweepResult:
+    """
+    Metrics indexed [cpu threshold, stop minutes, warn minutes].
+    A warn value of inf stands for "no warning tier".
+    """
+    cpu_thresholds: np.ndarray
+    stop_minutes: np.ndarray
+    warn_minutes: np.ndarray
+    stops: np.ndarray
+    approvals: np.ndarray
+    warnings: np.ndarray
+    false_stops: np.ndarray
+    savings: np.ndarray
+    snapshots: int
+    vm_count: int
+
+    def __len__(self) -> int:
+        return self.stops.size
+
+    def rows(self) -> List[dict]:
+        """
+        One dict per combination, keyed like the API policy config.
+        """
+        out = []
+        for i, j, k in product(
+            range(len(self.cpu_thresholds)),
+            range(len(self.stop_minutes)),
+            range(len(self.warn_minutes)),
+        ):
+            stops = int(self.stops[i, j, k])
+            false_stops = int(self.false_stops[i, j, k])
+            out.append({
+                "cpu_idle_threshold": float(self.cpu_thresholds[i]),
+                "idle_stop_minutes": float(self.stop_minutes[j]),
+                "idle_warn_minutes": (
+                    None if np.isinf(self.warn_minutes[k]) else float(self.warn_minutes[k])
+                ),
+                "stops": stops,
+                "approvals": int(self.approvals[i, j, k]),
+                "warnings": int(self.warnings[i, j, k]),
+                "false_stops": false_stops,
+                "false_stop_rate": round(false_stops / stops, 4) if stops else 0.0,
+                "savings": round(float(self.savings[i, j, k]), 2),
+            })
+        return out
+
+    def best(self, max_false_stop_rate: float = 0.05, top: int = 10) -> List[dict]:
+        """
+        Highest-savings combinations within a false-stop budget.
+        """
+        rows = [r for r in self.rows() if r["false_stop_rate"] <= max_false_stop_rate]
+        return sorted(rows, key=lambda r: r["savings"], reverse=True)[:top]
+
+
+class ThresholdSweep:
+    """
+    Replays a FleetHistory under a grid of idle thresholds.
+    """
+
+    def __init__(self, fleet, hourly_cost: Sequence[float], policies: list):
+        """
+        :param fleet: Column view of the VMs (SyntheticFleet or RecordColumns)
+        :param hourly_cost: INR per hour for every VM
+        :param policies: Fixed tiers (vetoes and approval gates) compiled with
+                         VectorizedPolicyEngine; idle rules come from the grid
+        """
+        engine = VectorizedPolicyEngine(policies)
+        self.eligible = ~engine.protected(fleet)
+        self.gated = engine.gated(fleet)
+        self.hourly_cost = np.asarray(hourly_cost, dtype=np.float64)
+
+    def run(
+        self,
+        history: FleetHistory,
+        cpu_thresholds: Sequence[float],
+        stop_minutes: Sequence[float],
+        warn_minutes: Sequence[float] = (),
+    ) -> SweepResult:
+        """
+        Without warn_minutes, every combination runs without a warning tier.
+        """
+        if history.vm_count != len(self.eligible):
+            raise ValueError(
+                f"History has {history.vm_count} VMs but the sweep was built "
+                f"for {len(self.eligible)}"
+            )
+
+        cpu_grid = np.unique(np.asarray(cpu_thresholds, dtype=np.float64))
+        stop_grid = np.unique(np.asarray(stop_minutes, dtype=np.float64))
+        # inf never passes `idle >= hours`, so that column has no warnings
+        warn_grid = np.unique(np.asarray(list(warn_minutes) or [np.inf], dtype=np.float64))
+
+        # One idle axis for both tiers; columns map back via searchsorted
+        hours_grid = np.unique(np.concatenate([stop_grid, warn_grid])) / 60
+        stop_at = np.searchsorted(hours_grid, stop_grid / 60)
+        warn_at = np.searchsorted(hours_grid, warn_grid / 60)
+
+        tables = self._tables(history, cpu_grid, hours_grid)
+
+        # [cpu, stop] tables broadcast against the warn axis
+        def at_stop(table):
+            return np.repeat(table[:, stop_at, None], len(warn_grid), axis=2)
+
+        idle_all = tables["idle"][0] + tables["idle"][1]
+        at_warn = idle_all[:, None, warn_at]
+        at_stop_all = idle_all[:, stop_at, None]
+        warns = np.where(
+            warn_grid[None, None, :] < stop_grid[None, :, None],
+            at_warn - at_stop_all,
+            0,
+        )
+
+        return SweepResult(
+            cpu_thresholds=cpu_grid,
+            stop_minutes=stop_grid,
+            warn_minutes=warn_grid,
+            stops=at_stop(tables["idle"][0] - tables["held"][0]),
+            approvals=at_stop(tables["idle"][1] - tables["held"][1]),
+            warnings=warns,
+            false_stops=at_stop(tables["false"][0]),
+            savings=at_stop(tables["savings"][0]),
+            snapshots=max(len(history) - 1, 0),
+            vm_count=history.vm_count,
+        )
+
+    def _tables(self, history: FleetHistory, cpu_grid: np.ndarray, hours_grid: np.ndarray) -> dict:
+        """
+        Per (gated, cpu threshold, idle hours) totals over all snapshots.
+
+        idle     VMs with cpu < threshold and idle >= hours
+        held     ... that also met the same condition at the previous snapshot
+        false    idle VMs that are active at the next snapshot
+        savings  hourly cost x interval of idle VMs that stay idle
+        """
+        nc, nh = len(cpu_grid) + 1, len(hours_grid) + 1
+        size = 2 * nc * nh
+        totals = {name: np.zeros(size) for name in ("idle", "held", "false", "savings")}
+
+        cols = np.flatnonzero(self.eligible)
+        cost = self.hourly_cost[cols] * history.interval_hours
+        group = self.gated[cols].astype(np.int64) * nc
+
+        def cells(cpu, idle):
+            # Bin b on each axis: the condition holds for thresholds past b
+            c = np.searchsorted(cpu_grid, cpu, side="right")
+            h = np.searchsorted(hours_grid, idle, side="right")
+            return ((group + c) * nh + h).ravel()
+
+        # The last snapshot has no successor, so it is not evaluated
+        evaluated = len(history) - 1
+        for start in range(0, evaluated, CHUNK):
+            stop = min(start + CHUNK, evaluated)
+            cpu = history.cpu[start:stop, cols]
+            idle = history.idle_hours[start:stop, cols]
+            active_next = history.cpu[start + 1:stop + 1, cols] >= history.activity_threshold
+
+            index = cells(cpu, idle)
+            totals["idle"] += np.bincount(index, minlength=size)
+            totals["false"] += np.bincount(index, weights=active_next.ravel(), minlength=size)
+            totals["savings"] += np.bincount(
+                index, weights=(~active_next * cost).ravel(), minlength=size
+            )
+
+            # Met at t and t-1 <=> max(cpu) < threshold and min(idle) >= hours
+            first = max(start, 1)
+            if first < stop:
+                previous = slice(first - 1, stop - 1)
+                current = slice(first - start, stop - start)
+                held = cells(
+                    np.maximum(cpu[current], history.cpu[previous, cols]),
+                    np.minimum(idle[current], history.idle_hours[previous, cols]),
+                )
+                totals["held"] += np.bincount(held, minlength=size)
+
+        out = {}
+        for name, flat in totals.items():
+            table = flat.reshape(2, nc, nh)
+            # cpu < grid[i] covers cpu bins 0..i; idle >= grid[k] covers bins k+1..
+            table = np.cumsum(table, axis=1)[:, :-1, :]
+            table = np.cumsum(table[:, :, ::-1], axis=2)[:, :, ::-1][:, :, 1:]
+            out[name] = table
+        return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="What-if sweep of idle thresholds")
+    parser.add_argument("--vms", type=int, default=100_000,
+                        help="Fleet size (a loaded --history keeps its own)")
+    parser.add_argument("--days", type=float, default=7)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--interval", type=int, default=1, help="Hours between snapshots")
+    parser.add_argument("--history", help="Load snapshots from (or save them to) this .npz")
+    parser.add_argument("--cpu", type=float, nargs="+",
+                        default=[1, 2, 3, 4, 5, 6, 8, 10, 12, 15])
+    parser.add_argument("--stop-minutes", type=float, nargs="+",
+                        default=[60, 120, 240, 360, 480, 720, 960, 1440, 2160, 2880])
+    parser.add_argument("--warn-minutes", type=float, nargs="*",
+                        help="Omit the values to sweep without a warning tier",
+                        default=[30, 45, 60, 120, 180, 240, 360, 480, 720, 1440])
+    parser.add_argument("--max-false-stop-rate", type=float, default=0.05)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    print("\n=== Idle Threshold Sweep ===\n")
+
+    started = time.perf_counter()
+    try:
+        history = FleetHistory.load(args.history) if args.history else None
+    except FileNotFoundError:
+        history = None
+
+    if history is None:
+        fleet = generate_fleet(args.vms, seed=args.seed)
+        history = record_history(fleet, int(args.days * 24), args.interval, seed=args.seed)
+        if args.history:
+            history.save(args.history)
+    else:
+        # Rebuild the fleet the snapshots were recorded from
+        seed = args.seed if history.fleet_seed is None else history.fleet_seed
+        fleet = generate_fleet(history.vm_count, seed=seed)
+    recorded = time.perf_counter()
+
+    sweep = ThresholdSweep(
+        fleet,
+        fleet.hourly_cost,
+        [NeverStopProdPolicy(), NeverStopTaggedPolicy(), ApprovalRequiredPolicy(tags=["ml"])],
+    )
+    result = sweep.run(history, args.cpu, args.stop_minutes, args.warn_minutes)
+    finished = time.perf_counter()
+
+    print(
+        f"{'cpu %':>6} {'stop min':>9} {'warn min':>9} {'stops':>9} {'approvals':>10} "
+        f"{'warnings':>11} {'false':>8} {'savings':>16}"
+    )
+    for r in result.best(args.max_false_stop_rate, args.top):
+        warn = "-" if r["idle_warn_minutes"] is None else f"{r['idle_warn_minutes']:g}"
+        print(
+            f"{r['cpu_idle_threshold']:>6g} {r['idle_stop_minutes']:>9g} "
+            f"{warn:>9} {r['stops']:>9,} {r['approvals']:>10,} "
+            f"{r['warnings']:>11,} {r['false_stops']:>8,} ₹{r['savings']:>15,.2f}"
+        )
+
+    print("-" * 50)
+    print(f"VMs          : {result.vm_count:,}")
+    print(f"Snapshots    : {result.snapshots}")
+    print(f"Combinations : {len(result):,}")
+    print(
+        f"\nRecorded in {recorded - started:.2f}s, "
+        f"swept in {finished - recorded:.2f}s\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,17 +4,70 @@
  */
 const BASE_URL = 'http://192.168.1.49:8000';
 
+type ResourceList = {
+    policy: any;
+    version: number;
+    timestamp: string;
+    resources: any[];
+};
+
+/**
+ * Last full view, kept so refreshes only download what changed
+ */
+let cache: ResourceList | null = null;
+
 /**
  * Fetch all compute resources
+ *
+ * After the first call this asks for `/resources?since=<version>` and
+ * merges the returned delta (added / changed / removed) into the cached
+ * list. The server answers with `full_resync` and the whole list when
+ * the client is too far behind.
  */
-export async function fetchResources() {
-    const res = await fetch(`${BASE_URL}/resources`);
+export async function fetchResources(): Promise<ResourceList> {
+    const url = cache
+        ? `${BASE_URL}/resources?since=${cache.version}`
+        : `${BASE_URL}/resources`;
+    const res = await fetch(url);
 
     if (!res.ok) {
         throw new Error('Failed to fetch resources');
     }
 
-    return res.json();
+    const data = await res.json();
+
+    if (!cache || data.resources) {
+        cache = {
+            policy: data.policy,
+            version: data.version,
+            timestamp: data.timestamp,
+            resources: data.resources,
+        };
+        return cache;
+    }
+
+    const updates = new Map<string, any>();
+    for (const r of [...data.added, ...data.changed]) {
+        updates.set(r.id, r);
+    }
+    const removed = new Set<string>(data.removed);
+
+    const resources = cache.resources
+        .filter((r) => !removed.has(r.id))
+        .map((r) => {
+            const updated = updates.get(r.id);
+            updates.delete(r.id);
+            return updated ?? r;
+        });
+    resources.push(...updates.values());
+
+    cache = {
+        ...cache,
+        version: data.version,
+        timestamp: data.timestamp,
+        resources,
+    };
+    return cache;
 }
 
 /**
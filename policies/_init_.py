@@ -1,6 +1,9 @@
-from .base_policy import BasePolicy, PolicyResult
+from .base_policy import BasePolicy, PolicyResult, WARN, REQUIRE_APPROVAL, NEVER_STOP
 from .vm_policies import (
     NeverStopProdPolicy,
     NeverStopTaggedPolicy,
-    StopIdleVMPolicy
+    StopIdleVMPolicy,
+    ApprovalRequiredPolicy,
+    IdleWarningPolicy,
 )
+from .config import policies_from_config
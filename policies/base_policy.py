@@ -3,10 +3,17 @@ from dataclasses import dataclass
 from typing import Optional
 
 
+# Tiered actions a policy can attach to its result
+WARN = "warn"                          # advisory only, never stops
+REQUIRE_APPROVAL = "require-approval"  # stopping needs a human
+NEVER_STOP = "never-stop"              # absolute veto, reported as such
+
+
 @dataclass
 class PolicyResult:
     allowed: bool
     reason: str
+    action: Optional[str] = None
 
 
 class BasePolicy(ABC):
@@ -21,5 +28,9 @@ class BasePolicy(ABC):
         Returns:
         - PolicyResult if the policy applies
         - None if the policy does not apply
+
+        allowed=False vetoes stopping (action=NEVER_STOP marks it absolute);
+        allowed=True votes to stop, unless action is WARN (advisory) or
+        REQUIRE_APPROVAL (stopping needs approval).
         """
         pass
@@ -0,0 +1,51 @@
+"""
+Policy configuration
+Builds the tiered policy set from a flat config (as served by the API)
+
+config example:
+{
+    "idle_warn_minutes": 45,
+    "idle_stop_minutes": 60,
+    "cpu_idle_threshold": 10,
+    "require_approval_for": ["finance"],
+    "never_stop_tags": ["never-stop"]
+}
+"""
+
+from typing import List
+
+from .base_policy import BasePolicy, NEVER_STOP
+from .vm_policies import (
+    ApprovalRequiredPolicy,
+    IdleWarningPolicy,
+    NeverStopTaggedPolicy,
+    StopIdleVMPolicy,
+)
+
+
+def policies_from_config(config: dict) -> List[BasePolicy]:
+    """
+    Policies in evaluation order; missing keys disable that tier.
+    """
+    policies: List[BasePolicy] = []
+    cpu_threshold = config.get("cpu_idle_threshold", 5.0)
+
+    if config.get("never_stop_tags"):
+        policies.append(NeverStopTaggedPolicy(tags=config["never_stop_tags"], action=NEVER_STOP))
+
+    if config.get("require_approval_for"):
+        policies.append(ApprovalRequiredPolicy(tags=config["require_approval_for"]))
+
+    if "idle_stop_minutes" in config:
+        policies.append(StopIdleVMPolicy(
+            cpu_threshold=cpu_threshold,
+            idle_hours=config["idle_stop_minutes"] / 60,
+        ))
+
+    if "idle_warn_minutes" in config:
+        policies.append(IdleWarningPolicy(
+            cpu_threshold=cpu_threshold,
+            idle_hours=config["idle_warn_minutes"] / 60,
+        ))
+
+    return policies
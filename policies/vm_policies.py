@@ -1,4 +1,11 @@
-from .base_policy import BasePolicy, PolicyResult
+from typing import Iterable, Optional
+
+from .base_policy import BasePolicy, PolicyResult, REQUIRE_APPROVAL, WARN
+
+
+def _hours(value) -> str:
+    # 48 -> "48", 1.4166 -> "1.4" (API idle times arrive as minutes / 60)
+    return f"{round(value, 1):g}"
 
 
 class NeverStopProdPolicy(BasePolicy):
@@ -7,8 +14,10 @@ class NeverStopProdPolicy(BasePolicy):
     Never stop production VMs.
     """
 
+    ENVIRONMENTS = ("prod",)
+
     def evaluate(self, resource: dict):
-        if resource.get("environment") == "prod":
+        if resource.get("environment") in self.ENVIRONMENTS:
             return PolicyResult(
                 allowed=False,
                 reason="Production VM must never be stopped"
@@ -22,12 +31,44 @@ class NeverStopTaggedPolicy(BasePolicy):
     Never stop VMs with protection tags.
     """
 
+    PROTECTED_TAGS = ("do-not-stop", "critical")
+
+    def __init__(self, tags: Optional[Iterable[str]] = None, action: Optional[str] = None):
+        """
+        :param tags: Protection tags (default: PROTECTED_TAGS)
+        :param action: Result action, e.g. NEVER_STOP to report an absolute veto
+        """
+        self.tags = tuple(tags) if tags is not None else self.PROTECTED_TAGS
+        self.action = action
+
     def evaluate(self, resource: dict):
         tags = resource.get("tags", [])
-        if "do-not-stop" in tags or "critical" in tags:
+        if any(tag in tags for tag in self.tags):
             return PolicyResult(
                 allowed=False,
-                reason="VM is protected by do-not-stop or critical tag"
+                reason=f"VM is protected by {' or '.join(self.tags)} tag",
+                action=self.action,
+            )
+        return None
+
+
+class ApprovalRequiredPolicy(BasePolicy):
+    """
+    Gate policy:
+    Stopping VMs with these tags needs human approval.
+    """
+
+    def __init__(self, tags: Iterable[str] = ("finance",)):
+        self.tags = tuple(tags)
+
+    def evaluate(self, resource: dict):
+        tags = resource.get("tags", [])
+        matched = [tag for tag in self.tags if tag in tags]
+        if matched:
+            return PolicyResult(
+                allowed=True,
+                reason=f"Stopping VMs tagged {', '.join(matched)} requires approval",
+                action=REQUIRE_APPROVAL,
             )
         return None
 
@@ -50,8 +91,34 @@ class StopIdleVMPolicy(BasePolicy):
             return PolicyResult(
                 allowed=True,
                 reason=(
-                    f"VM idle for {idle_time}h "
+                    f"VM idle for {_hours(idle_time)}h "
                     f"with CPU {cpu}% (below {self.cpu_threshold}%)"
                 )
             )
         return None
+
+
+class IdleWarningPolicy(BasePolicy):
+    """
+    Advisory policy:
+    Warn when a VM has been idle long enough to approach the stop threshold.
+    """
+
+    def __init__(self, cpu_threshold: float = 5.0, idle_hours: float = 12):
+        self.cpu_threshold = cpu_threshold
+        self.idle_hours = idle_hours
+
+    def evaluate(self, resource: dict):
+        cpu = resource.get("cpu_utilization", 100)
+        idle_time = resource.get("idle_hours", 0)
+
+        if cpu < self.cpu_threshold and idle_time >= self.idle_hours:
+            return PolicyResult(
+                allowed=True,
+                reason=(
+                    f"VM idle for {_hours(idle_time)}h "
+                    f"(warning after {_hours(self.idle_hours)}h)"
+                ),
+                action=WARN,
+            )
+        return None
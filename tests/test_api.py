@@ -0,0 +1,110 @@
+from fastapi.testclient import TestClient
+
+import api
+
+
+def test_resource_statuses_come_from_policy_engine():
+    client = TestClient(api.app)
+
+    statuses = {
+        r["id"]: r["policy_status"]
+        for r in client.get("/resources").json()["resources"]
+    }
+
+    assert statuses == {
+        "prod-api-gateway-vm-01": "healthy",
+        "staging-ml-inference-vm-02": "warning",
+        "batch-reporting-worker-vm-07": "auto-stopped",
+        "finance-payroll-vm-09": "approval-required",
+        "auth-identity-core-vm-99": "never-stop",
+    }
+
+
+def test_never_stop_resource_cannot_be_approved():
+    client = TestClient(api.app)
+
+    response = client.post("/resources/auth-identity-core-vm-99/approve-stop")
+
+    assert response.status_code == 403
+
+
+def test_resources_since_version_returns_only_changes():
+    client = TestClient(api.app)
+    full = client.get("/resources").json()
+
+    delta = client.get("/resources", params={"since": full["version"]}).json()
+    assert (delta["added"], delta["changed"], delta["removed"]) == ([], [], [])
+    assert "resources" not in delta
+
+    resource = api.COMPUTE_RESOURCES[0]
+    resource["cpu"] += 1
+    try:
+        delta = client.get("/resources", params={"since": full["version"]}).json()
+    finally:
+        resource["cpu"] -= 1
+
+    assert [r["id"] for r in delta["changed"]] == [resource["id"]]
+    assert delta["version"] > full["version"]
+
+    stale = client.get("/resources", params={"since": 0}).json()
+    assert stale["full_resync"] is True
+    assert len(stale["resources"]) == len(api.COMPUTE_RESOURCES)
+
+
+def test_approve_stop_keeps_state_when_execution_is_disabled(monkeypatch):
+    client = TestClient(api.app)
+    resource = next(r for r in api.COMPUTE_RESOURCES if r["id"] == "finance-payroll-vm-09")
+    monkeypatch.setattr(api.EXECUTOR, "execution_enabled", False)
+
+    response = client.post(f"/resources/{resource['id']}/approve-stop")
+
+    assert response.status_code == 200
+    assert response.json()["execution"] == "disabled"
+    assert response.json()["state"] == resource["state"] == "running"
+
+
+def test_approve_stop_follows_executor_outcome(monkeypatch):
+    client = TestClient(api.app)
+    resource = next(r for r in api.COMPUTE_RESOURCES if r["id"] == "finance-payroll-vm-09")
+    monkeypatch.setattr(api.EXECUTOR, "execution_enabled", True)
+    monkeypatch.setattr(api.EXECUTOR, "dry_run", True)
+    monkeypatch.setattr(api.EXECUTOR, "allowlist", [resource["id"]])
+
+    try:
+        response = client.post(f"/resources/{resource['id']}/approve-stop")
+        assert response.status_code == 200
+        assert response.json() == {
+            "message": "VM stopped after user approval",
+            "id": resource["id"],
+            "state": "stopped",
+            "execution": "dry-run",
+        }
+    finally:
+        resource["state"] = "running"
+
+    metrics = client.get("/metrics").text
+    assert 'executor_actions_total{action="stop",outcome="dry-run"}' in metrics
+
+
+def test_chat_counts_every_decision_tier():
+    client = TestClient(api.app)
+
+    def ask(q):
+        return client.get("/chat/stream", params={"q": q}).text
+
+    assert ask("How many VMs were not stopped?") == "4 of 5 VMs were not stopped."
+    assert ask("How many VMs are marked for stopping?") == "1 of 5 VMs are marked for stopping."
+    assert ask("How many VMs need approval?") == "1 of 5 VMs need approval before stopping."
+    assert ask("How many VMs have a warning?") == "1 of 5 VMs have an idle warning."
+    assert ask("How many never-stop VMs are there?") == (
+        "1 of 5 VMs are protected from ever being stopped."
+    )
+
+
+def test_chat_context_has_no_made_up_environments():
+    index = api.current_decision_index()
+
+    context = index.build_context("why was batch-reporting-worker-vm-07 stopped")
+
+    assert all("environment" not in r for r in index.search("vm", k=10))
+    assert "batch-reporting-worker-vm-07 AUTO-STOP" in context["reason"]
@@ -0,0 +1,63 @@
+from benchmarks.harness import Benchmark, compare, median_results, run_benchmark
+
+BASELINE = {
+    "engine": {"throughput": 1000.0, "p99_ms": 2.0, "peak_memory_mb": 10.0},
+}
+
+
+def test_compare_flags_throughput_and_memory_regressions():
+    results = {
+        "engine": {"throughput": 700.0, "p99_ms": 2.1, "peak_memory_mb": 14.0},
+    }
+
+    regressions = compare(results, BASELINE, threshold=0.25)
+
+    assert {(r["benchmark"], r["metric"]) for r in regressions} == {
+        ("engine", "throughput"),
+        ("engine", "peak_memory_mb"),
+    }
+
+
+def test_compare_allows_drift_within_threshold_and_new_benchmarks():
+    results = {
+        "engine": {"throughput": 800.0, "p99_ms": 2.9, "peak_memory_mb": 10.5},
+        "brand_new": {"throughput": 1.0, "p99_ms": 999.0, "peak_memory_mb": 999.0},
+    }
+
+    # p99 gets twice the threshold: +45% is still within 50%
+    assert compare(results, BASELINE, threshold=0.25) == []
+    assert compare(results, BASELINE, threshold=0.1)[0]["metric"] == "throughput"
+
+
+def test_run_benchmark_reports_metrics():
+    benchmark = Benchmark(
+        name="sum",
+        setup=lambda: list(range(1000)),
+        op=lambda values, i: sum(values),
+        ops=20,
+        items_per_op=1000,
+    )
+
+    result = run_benchmark(benchmark, rounds=2)
+
+    assert result["ops"] == 20
+    assert result["items"] == 20_000
+    assert result["throughput"] > 0
+    assert result["p99_ms"] >= result["p50_ms"] > 0
+    assert result["peak_memory_mb"] >= 0
+
+
+def test_median_results_takes_each_metric_median():
+    runs = [
+        {"ops": 10, "throughput": 900.0, "p99_ms": 2.0, "peak_memory_mb": 10.0},
+        {"ops": 10, "throughput": 500.0, "p99_ms": 9.0, "peak_memory_mb": 10.0},
+        {"ops": 10, "throughput": 850.0, "p99_ms": 2.4, "peak_memory_mb": 10.0},
+    ]
+
+    merged = median_results(runs)
+
+    assert merged["ops"] == 10 and isinstance(merged["ops"], int)
+    assert merged["throughput"] == 850.0
+    assert merged["p99_ms"] == 2.4
+    # One slow pass does not fail the gate
+    assert compare({"engine": merged}, BASELINE, threshold=0.25) == []
@@ -0,0 +1,36 @@
+from data.change_log import ChangeLog
+
+
+def test_changes_since_reports_net_changes():
+    log = ChangeLog()
+    v0 = log.update({"a": {"cpu": 1}, "b": {"cpu": 2}})
+
+    log.update({"a": {"cpu": 5}, "c": {"cpu": 3}})
+    assert log.changes_since(v0) == {
+        "added": [{"cpu": 3}],
+        "changed": [{"cpu": 5}],
+        "removed": ["b"],
+    }
+
+    # Unchanged snapshots do not move the version
+    v1 = log.version
+    assert log.update({"a": {"cpu": 5}, "c": {"cpu": 3}}) == v1
+    assert log.changes_since(v1) == {"added": [], "changed": [], "removed": []}
+
+    # Added and removed in between: invisible to a client at v1
+    log.update({"a": {"cpu": 5}, "c": {"cpu": 3}, "d": {"cpu": 0}})
+    log.update({"a": {"cpu": 5}, "c": {"cpu": 3}})
+    assert log.changes_since(v1) == {"added": [], "changed": [], "removed": []}
+
+
+def test_client_too_far_behind_must_resync():
+    log = ChangeLog(capacity=3, start=100)
+    v0 = log.update({"a": {"cpu": 1}})
+
+    assert log.changes_since(99) is None
+    for cpu in range(2, 6):
+        log.update({"a": {"cpu": cpu}})
+
+    assert log.changes_since(v0) is None
+    assert log.changes_since(log.version - 3) == {"added": [], "changed": [{"cpu": 5}], "removed": []}
+    assert log.changes_since(log.version + 1) is None
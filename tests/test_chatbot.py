@@ -0,0 +1,111 @@
+from ai.answer_cache import AnswerCache
+from ai.chatbot import GeminiChatbot
+from ai.retrieval import DecisionIndex
+
+
+class _Response:
+    def __init__(self, text):
+        self.text = text
+
+
+class StubModel:
+    """
+    Local stand-in for the Gemini model.
+    """
+
+    def __init__(self):
+        self.prompts = []
+
+    def generate_content(self, prompt):
+        self.prompts.append(prompt)
+        return _Response(f"answer #{len(self.prompts)}")
+
+
+def _index():
+    return DecisionIndex([
+        {
+            "name": "vm-1",
+            "environment": "dev",
+            "decision": "AUTO-STOP",
+            "reason": "VM idle for 48h with CPU 1% (below 5.0%)",
+            "savings": 3600.0,
+        },
+        {
+            "name": "vm-3",
+            "environment": "prod",
+            "decision": "SKIP",
+            "reason": "Production VM must never be stopped",
+            "savings": 0.0,
+        },
+    ])
+
+
+def test_structured_questions_skip_the_llm():
+    model = StubModel()
+    chatbot = GeminiChatbot(model=model)
+    chatbot.set_decisions(_index())
+
+    savings = chatbot.answer("How much did we save?")
+    why = chatbot.answer("why was vm-3 skipped")
+    count = chatbot.answer("How many VMs were stopped?")
+
+    assert "3600.00" in savings
+    assert "Production VM must never be stopped" in why
+    assert count.startswith("1 of 2")
+    assert model.prompts == []
+    assert chatbot.stats()["intent_answers"] == 3
+
+
+def test_open_questions_about_vms_and_counts_reach_the_llm():
+    model = StubModel()
+    chatbot = GeminiChatbot(model=model)
+    chatbot.set_decisions(_index())
+
+    assert chatbot.answer("should I rightsize vm-3?") == "answer #1"
+    assert chatbot.answer("how many VMs cost more than ₹1000?") == "answer #2"
+    assert chatbot.stats()["intent_answers"] == 0
+
+
+def test_open_questions_are_cached_until_decisions_change():
+    model = StubModel()
+    chatbot = GeminiChatbot(model=model)
+    chatbot.set_decisions(_index())
+
+    first = chatbot.answer("What does the idle policy protect against?")
+    second = chatbot.answer("what does the idle policy protect against")
+
+    assert first == second
+    assert len(model.prompts) == 1
+    assert chatbot.stats()["cache_hits"] == 1
+
+    chatbot.set_decisions(_index())
+    chatbot.answer("What does the idle policy protect against?")
+
+    assert len(model.prompts) == 2
+
+
+def test_cached_answers_are_per_context():
+    model = StubModel()
+    chatbot = GeminiChatbot(model=model)
+    question = "Explain this decision"
+
+    def context(vm_name):
+        return {"vm_name": vm_name, "decision": "AUTO-STOP", "reason": "idle", "monthly_savings": 10.0}
+
+    assert chatbot.answer(question, context("vm-1")) == "answer #1"
+    assert chatbot.answer(question, context("vm-2")) == "answer #2"
+    assert chatbot.answer(question, context("vm-1")) == "answer #1"
+    assert len(model.prompts) == 2
+
+
+def test_cache_entries_expire():
+    now = [0.0]
+    cache = AnswerCache(ttl_seconds=10, clock=lambda: now[0])
+
+    cache.put("Why?", "because")
+    assert cache.get("why") == "because"
+
+    now[0] = 11.0
+    assert cache.get("why") is None
+    assert cache.hits == 1
+    assert cache.misses == 1
@@ -42,3 +42,37 @@ def test_engine_auto_stops_idle_vm():
     result = engine.evaluate(vm)
 
     assert result["decision"] == Decision.AUTO_STOP
+
+
+def _tiered_engine():
+    from policies.config import policies_from_config
+
+    return PolicyEngine(policies_from_config({
+        "idle_warn_minutes": 45,
+        "idle_stop_minutes": 60,
+        "cpu_idle_threshold": 10,
+        "require_approval_for": ["finance"],
+        "never_stop_tags": ["never-stop"],
+    }))
+
+
+def _vm(tags, cpu, idle_minutes):
+    return {"name": "vm", "tags": tags, "cpu_utilization": cpu, "idle_hours": idle_minutes / 60}
+
+
+def test_tiered_decisions():
+    engine = _tiered_engine()
+
+    assert engine.evaluate(_vm([], 40, 10))["decision"] == Decision.SKIP
+    assert engine.evaluate(_vm([], 5, 50))["decision"] == Decision.WARN
+    assert engine.evaluate(_vm([], 2, 90))["decision"] == Decision.AUTO_STOP
+    assert engine.evaluate(_vm(["finance"], 3, 85))["decision"] == Decision.APPROVAL_REQUIRED
+    assert engine.evaluate(_vm(["never-stop"], 2, 120))["decision"] == Decision.NEVER_STOP
+
+
+def test_approval_gate_does_not_stop_active_vm():
+    engine = _tiered_engine()
+
+    # The approval policy only gates a stop; on its own it decides nothing
+    assert engine.evaluate(_vm(["finance"], 50, 0))["decision"] == Decision.SKIP
+    assert engine.evaluate(_vm(["finance"], 5, 50))["decision"] == Decision.WARN
@@ -0,0 +1,67 @@
+import random
+
+from cost.cost_model import CostModel
+from cost.fleet_cost import FleetCostModel, fleet_cost
+from engine.policy_engine import Decision
+
+
+def _random_fleet(n: int = 500):
+    rng = random.Random(7)
+    vms = []
+    for i in range(n):
+        vms.append({
+            "name": f"vm-{i}",
+            "environment": rng.choice(["dev", "staging", "prod"]),
+            "tags": rng.sample(["batch", "ml", "web", "critical"], rng.randint(0, 2)),
+            "hourly_cost": round(rng.uniform(0.5, 40.0), 2),
+            "idle_hours": rng.randint(0, 200),
+        })
+    decisions = [rng.choice([Decision.AUTO_STOP, Decision.SKIP]) for _ in vms]
+    return vms, decisions
+
+
+def test_fleet_matches_scalar_cost_model():
+    vms, decisions = _random_fleet()
+
+    fleet = fleet_cost(vms, decisions)
+
+    expected_monthly = 0.0
+    expected_leakage = 0.0
+    expected_savings = 0.0
+    for i, (vm, decision) in enumerate(zip(vms, decisions)):
+        model = CostModel(hourly_cost=vm["hourly_cost"])
+        assert fleet.monthly[i] == model.monthly()
+        assert fleet.leakage[i] == model.cost_leakage(vm["idle_hours"])
+        assert fleet.savings[i] == model.prevented_savings(decision.value)
+        expected_monthly += model.monthly()
+        expected_leakage += model.cost_leakage(vm["idle_hours"])
+        expected_savings += model.prevented_savings(decision.value)
+
+    assert fleet.totals["monthly_cost"] == round(expected_monthly, 2)
+    assert fleet.totals["leakage"] == round(expected_leakage, 2)
+    assert fleet.totals["savings"] == round(expected_savings, 2)
+
+
+def test_group_breakdowns():
+    model = FleetCostModel([1.0, 2.0, 4.0])
+
+    fleet = model.evaluate(
+        [10, 0, 5],
+        ["AUTO-STOP", "SKIP", "AUTO-STOP"],
+        environments=["dev", "prod", "dev"],
+        tags=[["ml"], [], ["ml", "batch"]],
+    )
+
+    assert fleet.by_environment["dev"]["savings"] == 3600.0
+    assert fleet.by_environment["prod"]["savings"] == 0.0
+    assert fleet.by_tag["ml"]["leakage"] == 30.0
+    assert fleet.by_tag["batch"]["monthly_cost"] == 2880.0
+
+
+def test_repeated_tag_counts_vm_once():
+    model = FleetCostModel([1.0, 2.0])
+
+    fleet = model.evaluate([10, 5], ["AUTO-STOP", "SKIP"], tags=[["ml", "ml"], ["ml"]])
+
+    assert fleet.by_tag["ml"]["monthly_cost"] == 3 * 24 * 30
+    assert fleet.by_tag["ml"]["leakage"] == 20.0
@@ -0,0 +1,84 @@
+import numpy as np
+
+from cost.forecast import SavingsForecaster
+from policies.vm_policies import (
+    NeverStopProdPolicy,
+    NeverStopTaggedPolicy,
+    StopIdleVMPolicy,
+)
+
+
+def _fleet():
+    return [
+        {
+            "name": "idle-dev",
+            "environment": "dev",
+            "tags": [],
+            "cpu_utilization": 1,
+            "idle_hours": 48,
+            "hourly_cost": 10.0,
+        },
+        {
+            "name": "idle-prod",
+            "environment": "prod",
+            "tags": [],
+            "cpu_utilization": 1,
+            "idle_hours": 48,
+            "hourly_cost": 10.0,
+        },
+        {
+            "name": "busy-dev",
+            "environment": "dev",
+            "tags": [],
+            "cpu_utilization": 60,
+            "idle_hours": 0,
+            "hourly_cost": 10.0,
+            "utilization_history": [60] * 200,
+        },
+    ]
+
+
+def test_forecast_respects_policy_guards():
+    forecaster = SavingsForecaster.from_policies(
+        [NeverStopProdPolicy(), NeverStopTaggedPolicy(), StopIdleVMPolicy()],
+        paths=500,
+        seed=3,
+    )
+
+    result = forecaster.forecast(_fleet())
+
+    assert result.p50[0] > 0
+    assert result.p50[1] == 0.0
+    assert result.p90[2] == 0.0
+    assert result.p10[0] <= result.p50[0] <= result.p90[0]
+
+
+def test_forecast_is_bounded_by_horizon_cost():
+    forecaster = SavingsForecaster(horizon_hours=168, paths=500, seed=1)
+
+    result = forecaster.forecast(_fleet())
+
+    assert np.all(result.p90 <= 168 * 10.0)
+    assert result.fleet["p10"] <= result.fleet["p50"] <= result.fleet["p90"]
+
+
+def test_forecast_is_reproducible_across_workers():
+    vms = _fleet() * 50
+    serial = SavingsForecaster(paths=200, seed=11, chunk_elements=2000).forecast(vms)
+    parallel = SavingsForecaster(paths=200, seed=11, chunk_elements=2000, workers=4).forecast(vms)
+
+    assert np.array_equal(serial.p50, parallel.p50)
+    assert serial.fleet == parallel.fleet
+
+
+def test_cumulative_forecast_never_decreases():
+    forecaster = SavingsForecaster(horizon_hours=168 * 4, paths=500, seed=5)
+    vm = {**_fleet()[0], "utilization_history": ([1] * 30 + [60] * 10) * 5}
+
+    weeks = forecaster.cumulative(vm, [168 * week for week in range(1, 5)])
+
+    for key in ("p10", "p50", "p90"):
+        series = [week[key] for week in weeks]
+        assert series == sorted(series)
+    assert weeks[-1]["p50"] > 0
+    assert all(week["p90"] <= 168 * (i + 1) * 10.0 for i, week in enumerate(weeks))
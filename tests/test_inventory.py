@@ -0,0 +1,80 @@
+import asyncio
+import threading
+
+from data.inventory import InventoryMirror, MockInventoryProvider
+from data.mock_cloud import get_vm_configuration
+
+
+def _mirror(provider, ttl=60.0):
+    now = [0.0]
+    mirror = InventoryMirror(provider, ttl=ttl, clock=lambda: now[0])
+    return mirror, now
+
+
+def test_list_all_pages_through_every_zone():
+    provider = MockInventoryProvider(synthetic=1200, seed=3)
+
+    instances = asyncio.run(provider.list_all(page_size=100))
+
+    assert len(instances) == 1200
+    assert len({i["name"] for i in instances}) == 1200
+
+    # One zones() call, then one call per page of every zone
+    per_zone = {}
+    for i in instances:
+        per_zone[i["zone"]] = per_zone.get(i["zone"], 0) + 1
+    assert provider.calls == 1 + sum(-(-n // 100) for n in per_zone.values())
+
+
+def test_mirror_coalesces_lookups_and_refreshes_incrementally():
+    provider = MockInventoryProvider(synthetic=500, seed=1, latency=0.01)
+    mirror, now = _mirror(provider)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(mirror.get_sync("synthetic-vm-007")))
+        for _ in range(20)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert mirror.full_refreshes == 1
+    assert len(results) == 20 and all(r == results[0] for r in results)
+
+    # Fresh copy: changes in the cloud are not seen until the TTL expires
+    provider.upsert({**results[0], "status": "STOPPED"})
+    provider.remove("synthetic-vm-008")
+    calls = provider.calls
+    assert mirror.get_sync("synthetic-vm-007")["status"] == results[0]["status"]
+    assert provider.calls == calls
+
+    now[0] = 61
+    assert asyncio.run(mirror.get("synthetic-vm-007"))["status"] == "STOPPED"
+    assert mirror.get_sync("synthetic-vm-008") is None
+    assert (mirror.full_refreshes, mirror.incremental_refreshes) == (1, 1)
+    assert provider.calls == calls + 1
+
+
+def test_expired_change_token_falls_back_to_full_listing():
+    provider = MockInventoryProvider(synthetic=50, change_capacity=5)
+    mirror, now = _mirror(provider, ttl=1)
+    assert mirror.get_sync("synthetic-vm-010") is not None
+
+    for i in range(10):
+        provider.upsert({"name": f"new-vm-{i}", "machine_type": "e2-small", "vcpus": 2,
+                         "memory_gb": 4, "region": "us-central1", "status": "RUNNING"})
+
+    now[0] = 2
+    assert mirror.get_sync("new-vm-0")["zone"] == "us-central1-a"
+    assert mirror.full_refreshes == 2
+    assert len(mirror) == 60
+
+
+def test_vm_configuration_is_served_by_the_mirror():
+    vm = get_vm_configuration("vm-1")
+
+    assert vm["machine_type"] == "e2-medium"
+    assert vm["zone"] == "asia-south1-a"
+    assert get_vm_configuration("missing-vm") is None
@@ -0,0 +1,74 @@
+from engine.metrics import MetricsRegistry
+from engine.policy_engine import PolicyEngine, Decision
+from execution.gcp_executor import GCPExecutor
+from policies.vm_policies import (
+    NeverStopProdPolicy,
+    NeverStopTaggedPolicy,
+    StopIdleVMPolicy,
+)
+
+VMS = [
+    {"name": "prod-1", "environment": "prod", "tags": [], "cpu_utilization": 1, "idle_hours": 48},
+    {"name": "dev-1", "environment": "dev", "tags": [], "cpu_utilization": 1, "idle_hours": 48},
+    {"name": "dev-2", "environment": "dev", "tags": [], "cpu_utilization": 50, "idle_hours": 0},
+]
+
+
+def _engine(metrics=None):
+    return PolicyEngine(
+        [NeverStopProdPolicy(), NeverStopTaggedPolicy(), StopIdleVMPolicy()],
+        metrics=metrics,
+    )
+
+
+def test_instrumented_engine_counts_policy_outcomes():
+    registry = MetricsRegistry()
+    engine = _engine(registry)
+
+    decisions = [engine.evaluate(vm)["decision"] for vm in VMS]
+    assert decisions == [Decision.SKIP, Decision.AUTO_STOP, Decision.SKIP]
+
+    results = registry.get("policy_evaluations_total")
+    assert results.value("NeverStopProdPolicy", "deny") == 1
+    assert results.value("NeverStopProdPolicy", "none") == 2
+    # The prod VM never reaches the remaining policies
+    assert results.value("StopIdleVMPolicy", "allow") == 1
+    assert results.value("StopIdleVMPolicy", "none") == 1
+
+    decisions_total = registry.get("policy_decisions_total")
+    assert decisions_total.value("AUTO-STOP") == 1
+    assert decisions_total.value("SKIP") == 2
+
+
+def test_instrumented_engine_matches_plain_engine():
+    plain, instrumented = _engine(), _engine(MetricsRegistry())
+    for vm in VMS:
+        assert plain.evaluate(vm) == instrumented.evaluate(vm)
+
+
+def test_render_prometheus_text():
+    registry = MetricsRegistry()
+    engine = _engine(registry)
+    for vm in VMS:
+        engine.evaluate(vm)
+
+    text = registry.render()
+
+    assert "# TYPE policy_evaluation_seconds histogram" in text
+    assert 'policy_evaluation_seconds_count{policy="NeverStopProdPolicy"} 3' in text
+    assert 'policy_evaluation_seconds_bucket{policy="StopIdleVMPolicy",le="+Inf"} 2' in text
+    assert 'policy_decisions_total{decision="AUTO-STOP"} 1.0' in text
+
+
+def test_executor_records_outcomes(monkeypatch):
+    monkeypatch.setenv("EXECUTION_ENABLED", "true")
+    monkeypatch.setenv("VM_ALLOWLIST", "dev-1")
+    registry = MetricsRegistry()
+    executor = GCPExecutor(metrics=registry)
+
+    assert executor.execute({"resource_name": "dev-1", "decision": Decision.AUTO_STOP}) == "dry-run"
+    assert executor.execute({"resource_name": "dev-2", "decision": Decision.AUTO_STOP}) == "not-allowlisted"
+
+    outcomes = registry.get("executor_actions_total")
+    assert outcomes.value("stop", "dry-run") == 1
+    assert outcomes.value("stop", "not-allowlisted") == 1
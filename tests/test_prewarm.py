@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+
+from engine.policy_engine import Decision
+from engine.prewarm import PrewarmScheduler
+
+
+def _weekday_morning_history(weeks: int = 4):
+    """
+    VM used Monday 09:00-11:00 every week, idle otherwise.
+    """
+    start = datetime(2024, 1, 1)  # Monday
+    history = []
+    for hour in range(weeks * 7 * 24):
+        ts = start + timedelta(hours=hour)
+        in_use = ts.weekday() == 0 and 9 <= ts.hour < 11
+        history.append({
+            "timestamp": ts.isoformat(),
+            "cpu_utilization": 40.0 if in_use else 1.0,
+        })
+    return history
+
+
+def test_resumes_vm_within_lead_time():
+    scheduler = PrewarmScheduler(lead_time_minutes=30)
+    scheduler.learn("dev-vm", _weekday_morning_history())
+
+    vm = {"name": "dev-vm", "state": "stopped"}
+
+    result = scheduler.evaluate(vm, datetime(2024, 2, 5, 8, 40))
+
+    assert result["decision"] == Decision.RESUME
+
+
+def test_skips_vm_outside_lead_time():
+    scheduler = PrewarmScheduler(lead_time_minutes=30)
+    scheduler.learn("dev-vm", _weekday_morning_history())
+
+    vm = {"name": "dev-vm", "state": "stopped"}
+
+    result = scheduler.evaluate(vm, datetime(2024, 2, 5, 7, 0))
+
+    assert result["decision"] == Decision.SKIP
+
+
+def test_skips_running_vm():
+    scheduler = PrewarmScheduler()
+    scheduler.learn("dev-vm", _weekday_morning_history())
+
+    vm = {"name": "dev-vm", "state": "running"}
+
+    result = scheduler.evaluate(vm, datetime(2024, 2, 5, 8, 40))
+
+    assert result["decision"] == Decision.SKIP
+
+
+def test_hit_rate_tracks_prediction_outcomes():
+    scheduler = PrewarmScheduler(lead_time_minutes=30)
+    scheduler.learn("dev-vm", _weekday_morning_history())
+    vm = {"name": "dev-vm", "state": "stopped"}
+
+    # Week 1: owner shows up -> hit
+    scheduler.evaluate(vm, datetime(2024, 2, 5, 8, 40))
+    scheduler.record_usage("dev-vm", datetime(2024, 2, 5, 9, 15), 35.0)
+
+    # Week 2: owner never shows up -> miss
+    scheduler.evaluate(vm, datetime(2024, 2, 12, 8, 40))
+    scheduler.record_usage("dev-vm", datetime(2024, 2, 12, 10, 5), 1.0)
+
+    assert scheduler.hits == 1
+    assert scheduler.misses == 1
+    assert scheduler.hit_rate() == 0.5
+
+
+def test_unresolved_prediction_counts_as_miss_when_replaced():
+    scheduler = PrewarmScheduler(lead_time_minutes=30)
+    scheduler.learn("dev-vm", _weekday_morning_history())
+    vm = {"name": "dev-vm", "state": "stopped"}
+
+    scheduler.evaluate(vm, datetime(2024, 2, 5, 8, 40))
+    scheduler.evaluate(vm, datetime(2024, 2, 5, 8, 50))  # same prediction
+    scheduler.evaluate(vm, datetime(2024, 2, 12, 8, 40))
+
+    assert scheduler.misses == 1
+    assert scheduler.stats()["pending"] == 1
+
+
+def test_usage_pattern_counts_each_week_once():
+    scheduler = PrewarmScheduler()
+    history = _weekday_morning_history(weeks=3)
+    # Several samples within the same hour
+    history += [{"timestamp": "2024-01-15T09:30:00", "cpu_utilization": 40.0}]
+
+    scheduler.learn("dev-vm", history)
+
+    pattern = scheduler._patterns["dev-vm"]
+    assert pattern.observed[9] == 3
+    assert pattern.active[9] == 3
+    assert scheduler.usage_probability("dev-vm", datetime(2024, 2, 5, 9)) == 1.0
@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from cost.pricing_catalog import PricingCatalog, UnknownSKUError
+from cost.pricing_engine import estimate_monthly_cost
+
+
+def _write_tables(directory):
+    with open(os.path.join(directory, "gcp.csv"), "w") as f:
+        f.write("region,machine_type,vcpus,memory_gb,hourly_cost\n")
+        f.write("us-central1,e2-small,2,2,2.5\n")
+        f.write("us-central1,e2-medium,2,4,5.0\n")
+    with open(os.path.join(directory, "azure.csv"), "w") as f:
+        f.write("region,machine_type,vcpus,memory_gb,hourly_cost\n")
+        f.write("eastus,Standard_D2s_v5,2,8,2.9\n")
+
+
+def test_lookup_known_sku(tmp_path):
+    _write_tables(tmp_path)
+    catalog = PricingCatalog(source_dir=str(tmp_path))
+
+    sku = catalog.lookup("azure", "eastus", "standard_d2s_v5")
+
+    assert sku is not None
+    assert sku.machine_type == "Standard_D2s_v5"
+    assert sku.hourly_cost == 2.9
+    assert len(catalog) == 3
+    assert os.path.exists(catalog.index_path)
+
+
+def test_unknown_sku_is_explicit(tmp_path):
+    _write_tables(tmp_path)
+    catalog = PricingCatalog(source_dir=str(tmp_path))
+
+    assert catalog.lookup("gcp", "us-central1", "e2-huge") is None
+    with pytest.raises(UnknownSKUError):
+        catalog.price("gcp", "asia-south1", "e2-small")
+
+
+def test_index_rebuilds_when_source_changes(tmp_path):
+    _write_tables(tmp_path)
+    PricingCatalog(source_dir=str(tmp_path)).price("gcp", "us-central1", "e2-small")
+
+    with open(os.path.join(tmp_path, "gcp.csv"), "a") as f:
+        f.write("us-central1,e2-large,2,8,10.0\n")
+    os.utime(os.path.join(tmp_path, "gcp.csv"), ns=(1, 1))
+
+    catalog = PricingCatalog(source_dir=str(tmp_path))
+
+    assert catalog.price("gcp", "us-central1", "e2-large").hourly_cost == 10.0
+
+
+def test_truncated_index_is_rebuilt(tmp_path):
+    _write_tables(tmp_path)
+    index_path = PricingCatalog(source_dir=str(tmp_path)).index_path
+    PricingCatalog(source_dir=str(tmp_path)).price("gcp", "us-central1", "e2-small")
+
+    with open(index_path, "r+b") as f:
+        f.truncate(10)
+
+    catalog = PricingCatalog(source_dir=str(tmp_path))
+
+    assert catalog.price("gcp", "us-central1", "e2-small").hourly_cost == 2.5
+    assert os.path.getsize(index_path) > 10
+
+
+def test_estimate_monthly_cost_uses_catalog():
+    assert estimate_monthly_cost("e2-medium", 8) == 5.0 * 8 * 30
+
+    with pytest.raises(UnknownSKUError):
+        estimate_monthly_cost("not-a-machine", 8)
@@ -0,0 +1,46 @@
+from ai.chatbot import GeminiChatbot
+from ai.retrieval import DecisionIndex, estimate_tokens
+
+
+def _records(n: int):
+    records = []
+    for i in range(n):
+        stopped = i % 3 == 0
+        records.append({
+            "name": f"vm-{i}",
+            "environment": "prod" if i % 5 == 0 else "dev",
+            "tags": ["ml"] if i % 7 == 0 else [],
+            "owner": "search" if i % 2 else "payments",
+            "decision": "AUTO-STOP" if stopped else "SKIP",
+            "reason": "VM idle for 48h with CPU 1% (below 5.0%)" if stopped
+            else "No policy conditions met for stopping",
+            "savings": 3600.0 if stopped else 0.0,
+        })
+    return records
+
+
+def test_search_ranks_exact_vm_name_first():
+    index = DecisionIndex(_records(500))
+
+    results = index.search("why was vm-42 skipped?", k=3)
+
+    assert results[0]["name"] == "vm-42"
+
+
+def test_context_respects_token_budget():
+    index = DecisionIndex(_records(500))
+
+    context = index.build_context("show idle ml VMs", k=50, token_budget=200)
+
+    assert estimate_tokens(context["reason"]) <= 200
+    assert "Fleet: 500 VMs" in context["reason"]
+
+
+def test_prompt_size_is_flat_as_fleet_grows():
+    chatbot = GeminiChatbot()
+    question = "which dev VMs owned by search were stopped?"
+
+    small = chatbot._build_prompt(question, DecisionIndex(_records(100)).build_context(question))
+    large = chatbot._build_prompt(question, DecisionIndex(_records(20000)).build_context(question))
+
+    assert len(large) < len(small) * 1.2
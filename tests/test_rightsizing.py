@@ -0,0 +1,83 @@
+import random
+
+import numpy as np
+import pytest
+
+from cost.pricing_catalog import SkuPrice
+from engine.policy_engine import Decision
+from engine.rightsizing import PriceFrontier, RightsizingRecommender
+
+
+def test_frontier_matches_full_catalog_scan():
+    rng = random.Random(5)
+    skus = [
+        SkuPrice("gcp", "r", f"t-{i}", rng.choice([1, 2, 4, 8, 16]),
+                 rng.choice([2, 4, 8, 16, 32, 64]), round(rng.uniform(1, 40), 2))
+        for i in range(60)
+    ]
+    frontier = PriceFrontier(skus)
+
+    vcpus = np.array([rng.uniform(0, 18) for _ in range(300)])
+    memory = np.array([rng.uniform(0, 70) for _ in range(300)])
+    fits = frontier.cheapest_fit(vcpus, memory)
+
+    for k in range(300):
+        candidates = [s for s in skus if s.vcpus >= vcpus[k] and s.memory_gb >= memory[k]]
+        if not candidates:
+            assert fits[k] == -1
+        else:
+            cheapest = min(s.hourly_cost for s in candidates)
+            assert frontier.skus[fits[k]].hourly_cost == cheapest
+
+
+def test_recommends_smaller_type_for_oversized_vm():
+    recommender = RightsizingRecommender()
+
+    result = recommender.evaluate({
+        "name": "oversized-vm",
+        "machine_type": "c2-standard-16",
+        "region": "us-central1",
+        "peak_cpu_utilization": 20,
+        "peak_memory_utilization": 20,
+    })
+
+    assert result["decision"] == Decision.RIGHTSIZE
+    assert result["recommended_machine_type"] != "c2-standard-16"
+    assert result["monthly_savings"] > 0
+
+
+def test_skips_busy_and_unknown_vms():
+    recommender = RightsizingRecommender()
+
+    busy, unknown = recommender.recommend([
+        {
+            "name": "busy-vm",
+            "machine_type": "e2-micro",
+            "region": "us-central1",
+            "peak_cpu_utilization": 95,
+        },
+        {"name": "mystery-vm", "machine_type": "z9-enormous"},
+    ])
+
+    assert busy["decision"] == Decision.SKIP
+    assert unknown["decision"] == Decision.SKIP
+    assert "Unknown SKU" in unknown["reason"]
+
+
+def test_current_reading_alone_does_not_downsize():
+    recommender = RightsizingRecommender()
+    vm = {"name": "quiet-now-vm", "machine_type": "c2-standard-16", "region": "us-central1"}
+
+    without_peak = recommender.evaluate({**vm, "cpu_utilization": 1})
+    with_peak = recommender.evaluate({**vm, "cpu_utilization": 1, "peak_cpu_utilization": 5,
+                                      "peak_memory_utilization": 5})
+
+    # Without peak data the VM keeps its size (only a cheaper same-size type)
+    assert without_peak["reason"].startswith("Peak usage needs 16.0 vCPU / 64.0 GB")
+    assert with_peak["decision"] == Decision.RIGHTSIZE
+    assert with_peak["monthly_savings"] > without_peak["monthly_savings"]
+
+
+def test_unknown_provider_without_region_is_a_clear_error():
+    with pytest.raises(ValueError, match="Unknown provider 'oracle'"):
+        RightsizingRecommender().evaluate({"name": "vm", "provider": "oracle", "machine_type": "x"})
@@ -0,0 +1,92 @@
+import random
+
+from cost.fleet_cost import fleet_cost
+from cost.rollups import CostRollup
+
+
+def _vm(i, rng):
+    return {
+        "name": f"vm-{i}",
+        "environment": rng.choice(["dev", "staging", "prod"]),
+        "tags": rng.sample(["ml", "web", "batch"], rng.randint(0, 2)),
+        "owner": rng.choice(["payments", "search", "data", None]),
+        "hourly_cost": round(rng.uniform(0.5, 30.0), 2),
+        "idle_hours": rng.randint(0, 120),
+    }
+
+
+def test_incremental_updates_match_full_recompute():
+    rng = random.Random(11)
+    vms = {i: _vm(i, rng) for i in range(200)}
+    decisions = {i: rng.choice(["AUTO-STOP", "SKIP"]) for i in vms}
+
+    rollup = CostRollup()
+    for i, vm in vms.items():
+        rollup.upsert(vm, decisions[i])
+
+    for _ in range(500):
+        i = rng.randrange(200)
+        action = rng.random()
+        if action < 0.4:
+            decisions[i] = rng.choice(["AUTO-STOP", "SKIP"])
+            rollup.update_decision(vms[i]["name"], decisions[i])
+        elif action < 0.8:
+            vms[i]["hourly_cost"] = round(rng.uniform(0.5, 30.0), 2)
+            rollup.update_price(vms[i]["name"], vms[i]["hourly_cost"])
+        else:
+            vms[i] = _vm(i, rng)
+            rollup.upsert(vms[i], decisions[i])
+
+    ordered = list(vms)
+    expected = fleet_cost([vms[i] for i in ordered], [decisions[i] for i in ordered])
+
+    assert rollup.totals() == expected.totals
+    assert rollup.group("environment", "dev")["savings"] == expected.by_environment["dev"]["savings"]
+    assert rollup.group("tag", "ml")["leakage"] == expected.by_tag["ml"]["leakage"]
+
+
+def test_top_wasteful_owners():
+    rollup = CostRollup()
+    rollup.upsert({"name": "a", "owner": "search", "hourly_cost": 10.0, "idle_hours": 5}, "SKIP")
+    rollup.upsert({"name": "b", "owner": "data", "hourly_cost": 10.0, "idle_hours": 50}, "SKIP")
+    rollup.upsert({"name": "c", "owner": "search", "hourly_cost": 1.0, "idle_hours": 10}, "SKIP")
+
+    assert rollup.top_wasteful(2) == [("data", 500.0), ("search", 60.0)]
+
+    rollup.update_idle_hours("a", 100)
+    assert rollup.top_wasteful(1) == [("search", 1010.0)]
+
+    rollup.remove("b")
+    assert rollup.group("owner", "data") is None
+    assert rollup.top_wasteful() == [("search", 1010.0)]
+
+
+def test_sync_applies_only_changed_vms():
+    rng = random.Random(3)
+    vms = [_vm(i, rng) for i in range(100)]
+    decisions = [rng.choice(["AUTO-STOP", "SKIP"]) for _ in vms]
+
+    rollup = CostRollup()
+    assert rollup.sync(vms, decisions) == 100
+    assert rollup.sync(vms, decisions) == 0
+
+    vms[5] = {**vms[5], "hourly_cost": vms[5]["hourly_cost"] + 1}
+    decisions[7] = "SKIP" if decisions[7] == "AUTO-STOP" else "AUTO-STOP"
+    del vms[9], decisions[9]
+
+    assert rollup.sync(vms, decisions) == 3
+    assert len(rollup) == 99
+    assert rollup.totals() == fleet_cost(vms, decisions).totals
+
+
+def test_missing_environment_is_unassigned_in_both_models():
+    vms = [
+        {"name": "a", "environment": None, "hourly_cost": 1.0, "idle_hours": 10},
+        {"name": "b", "environment": "dev", "hourly_cost": 1.0, "idle_hours": 10},
+        {"name": "c", "hourly_cost": 1.0, "idle_hours": 20},
+    ]
+    rollup = CostRollup()
+    rollup.sync(vms, ["SKIP"] * 3)
+
+    assert rollup.top_wasteful(dimension="environment") == [("unassigned", 30.0), ("dev", 10.0)]
+    assert fleet_cost(vms, ["SKIP"] * 3).by_environment["unassigned"]["leakage"] == 30.0
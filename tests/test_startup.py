@@ -0,0 +1,59 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Optional or heavy packages that must not load at import time
+HEAVY_MODULES = (
+    "google.generativeai",
+    "google.cloud.compute_v1",
+    "numpy",
+    "pandas",
+    "altair",
+)
+
+# Generous wall-clock budgets (seconds) for a cold import in a fresh interpreter
+BUDGET_SCALE = float(os.getenv("STARTUP_BUDGET_SCALE", "1.0"))
+
+
+def _cold_import(module: str) -> dict:
+    code = (
+        "import json, sys, time\n"
+        "started = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - started\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'elapsed': elapsed, 'heavy': heavy}))\n"
+    )
+    env = {**os.environ, "GEMINI_API_KEY": "test-key", "PYTHONPATH": ROOT}
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_api_import_is_lazy_and_fast():
+    result = _cold_import("api")
+
+    assert result["heavy"] == []
+    assert result["elapsed"] < 3.0 * BUDGET_SCALE
+
+
+def test_simulation_cli_import_is_lazy_and_fast():
+    result = _cold_import("experiments.run_simulation")
+
+    assert result["heavy"] == []
+    assert result["elapsed"] < 0.5 * BUDGET_SCALE
+
+
+def test_chatbot_and_executor_defer_sdk_imports():
+    result = _cold_import("ai.chatbot, execution.gcp_executor")
+
+    assert result["heavy"] == []
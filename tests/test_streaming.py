@@ -0,0 +1,115 @@
+import asyncio
+import time
+
+from ai.chatbot import GeminiChatbot
+from ai.retrieval import DecisionIndex
+
+
+class _Chunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeStreamingModel:
+    """
+    Local stand-in for Gemini's generate_content(prompt, stream=True).
+    """
+
+    def __init__(self, chunks, delay=0.0):
+        self.chunks = chunks
+        self.delay = delay
+        self.calls = 0
+
+    def generate_content(self, prompt, stream=False):
+        self.calls += 1
+        for text in self.chunks:
+            time.sleep(self.delay)
+            yield _Chunk(text)
+
+
+CONTEXT = {
+    "vm_name": "vm-1",
+    "decision": "AUTO-STOP",
+    "reason": "VM idle for 48h with CPU 1% (below 5.0%)",
+    "monthly_savings": 3600.0,
+}
+
+
+def test_stream_yields_chunks_and_caches_answer():
+    model = FakeStreamingModel(["Idle ", "VMs ", "cost money."])
+    chatbot = GeminiChatbot(model=model)
+
+    chunks = list(chatbot.stream_answer("Explain the policy", CONTEXT))
+
+    assert chunks == ["Idle ", "VMs ", "cost money."]
+    assert chatbot.answer("explain the policy", CONTEXT) == "Idle VMs cost money."
+    assert model.calls == 1
+
+
+def test_stream_falls_back_to_rules_on_timeout():
+    model = FakeStreamingModel(["too ", "slow"], delay=0.5)
+    chatbot = GeminiChatbot(model=model)
+
+    stream = chatbot.stream_answer("Explain the policy", CONTEXT, timeout=0.1)
+    text = "".join(stream)
+
+    assert stream.timed_out
+    assert "was marked for stopping" in text
+
+
+def test_new_question_cancels_previous_stream():
+    model = FakeStreamingModel(["a", "b", "c"], delay=0.05)
+    chatbot = GeminiChatbot(model=model)
+
+    first = chatbot.stream_answer("first question", CONTEXT, session="user-1")
+    second = chatbot.stream_answer("second question", CONTEXT, session="user-1")
+    other = chatbot.stream_answer("third question", CONTEXT, session="user-2")
+
+    assert first.cancelled
+    assert list(first) == []
+    assert "".join(second) == "abc"
+    assert not other.cancelled
+
+
+def test_async_iteration():
+    model = FakeStreamingModel(["async ", "tokens"])
+    chatbot = GeminiChatbot(model=model)
+
+    async def collect():
+        return [chunk async for chunk in chatbot.stream_answer("q", CONTEXT)]
+
+    assert asyncio.run(collect()) == ["async ", "tokens"]
+
+
+def test_intent_questions_stream_immediately():
+    model = FakeStreamingModel(["unused"])
+    chatbot = GeminiChatbot(model=model)
+    chatbot.set_decisions(DecisionIndex([{
+        "name": "vm-1", "decision": "AUTO-STOP", "reason": "idle", "savings": 10.0,
+    }]))
+
+    text = "".join(chatbot.stream_answer("How much did we save?"))
+
+    assert "₹10.00" in text
+    assert model.calls == 0
+
+
+def test_finished_streams_are_released():
+    model = FakeStreamingModel(["a", "b"], delay=0.05)
+    chatbot = GeminiChatbot(model=model)
+
+    for session in range(20):
+        assert "".join(chatbot.stream_answer("q", CONTEXT, session=session)) == "ab"
+    assert chatbot.active_streams == 0
+
+    slow = FakeStreamingModel(["late"], delay=0.5)
+    chatbot.model = slow
+    timed_out = chatbot.stream_answer("slow question", CONTEXT, timeout=0.05, session="x")
+    "".join(timed_out)
+    assert timed_out.timed_out
+
+    first = chatbot.stream_answer("first", CONTEXT, session="y")
+    second = chatbot.stream_answer("second", CONTEXT, session="y")
+    assert chatbot.active_streams == 1
+    second.cancel()
+    assert first.cancelled and chatbot.active_streams == 0
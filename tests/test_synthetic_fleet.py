@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from data.synthetic_fleet import generate_fleet
+from engine.policy_engine import PolicyEngine, Decision
+from engine.vectorized import VectorizedPolicyEngine
+from experiments.fleet_simulator import HibernationSimulator
+from policies.base_policy import NEVER_STOP
+from policies.vm_policies import (
+    ApprovalRequiredPolicy,
+    IdleWarningPolicy,
+    NeverStopProdPolicy,
+    NeverStopTaggedPolicy,
+    StopIdleVMPolicy,
+)
+
+POLICIES = [
+    NeverStopProdPolicy(),
+    NeverStopTaggedPolicy(),
+    StopIdleVMPolicy(),
+]
+
+
+def test_same_seed_same_fleet():
+    a = generate_fleet(500, seed=3)
+    b = generate_fleet(500, seed=3)
+
+    assert a.records() == b.records()
+    assert a.records() != generate_fleet(500, seed=4).records()
+
+
+def test_vectorized_engine_matches_policy_engine():
+    vms = generate_fleet(2000, seed=1).records()
+
+    engine = PolicyEngine(POLICIES)
+    expected = np.array([engine.evaluate(vm)["decision"] == Decision.AUTO_STOP for vm in vms])
+
+    stop = VectorizedPolicyEngine(POLICIES).evaluate(vms)
+
+    assert expected.any() and not expected.all()
+    assert np.array_equal(stop, expected)
+
+
+def test_vectorized_engine_matches_tiered_decisions():
+    vms = generate_fleet(2000, seed=5).records()
+    policies = [
+        NeverStopTaggedPolicy(tags=["critical"], action=NEVER_STOP),
+        NeverStopProdPolicy(),
+        ApprovalRequiredPolicy(tags=["ml"]),
+        StopIdleVMPolicy(),
+        IdleWarningPolicy(idle_hours=6),
+    ]
+
+    engine = PolicyEngine(policies)
+    expected = [engine.evaluate(vm)["decision"] for vm in vms]
+
+    assert VectorizedPolicyEngine(policies).decisions(vms) == expected
+    assert {
+        Decision.SKIP, Decision.AUTO_STOP, Decision.APPROVAL_REQUIRED,
+        Decision.WARN, Decision.NEVER_STOP,
+    } <= set(expected)
+
+
+def test_simulation_never_stops_protected_vms():
+    fleet = generate_fleet(3000, seed=2)
+    result = HibernationSimulator(fleet, POLICIES, seed=2).run(24 * 7)
+
+    assert result.stops > 0
+    assert result.resumes > 0
+    assert 0 < result.savings < result.baseline_cost
+    assert result.by_environment["prod"]["savings"] == 0
+    assert len(result.timeline) == 7
+    assert sum(day["cost"] for day in result.timeline) == pytest.approx(result.actual_cost)
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from data.synthetic_fleet import generate_fleet
+from engine.vectorized import APPROVAL_REQUIRED, AUTO_STOP, WARN, VectorizedPolicyEngine
+from experiments.threshold_sweep import FleetHistory, ThresholdSweep, record_history
+from policies.vm_policies import (
+    ApprovalRequiredPolicy,
+    IdleWarningPolicy,
+    NeverStopProdPolicy,
+    NeverStopTaggedPolicy,
+    StopIdleVMPolicy,
+)
+
+FIXED = [NeverStopProdPolicy(), NeverStopTaggedPolicy(), ApprovalRequiredPolicy(tags=["ml"])]
+
+
+def _replay(fleet, history, cpu_threshold, stop_minutes, warn_minutes):
+    engine = VectorizedPolicyEngine(FIXED + [
+        StopIdleVMPolicy(cpu_threshold, stop_minutes / 60),
+        IdleWarningPolicy(cpu_threshold, warn_minutes / 60),
+    ])
+
+    totals = dict(stops=0, approvals=0, warnings=0, false_stops=0, savings=0.0)
+    previous = np.full(len(fleet), -1)
+    for t in range(len(history) - 1):
+        codes = engine.decide(fleet, history.cpu[t], history.idle_hours[t])
+        stop = codes == AUTO_STOP
+        active_next = history.cpu[t + 1] >= history.activity_threshold
+
+        totals["stops"] += int((stop & (previous != AUTO_STOP)).sum())
+        totals["approvals"] += int(((codes == APPROVAL_REQUIRED) & (previous != APPROVAL_REQUIRED)).sum())
+        totals["warnings"] += int((codes == WARN).sum())
+        totals["false_stops"] += int((stop & active_next).sum())
+        totals["savings"] += float(fleet.hourly_cost[stop & ~active_next].sum())
+        previous = codes
+    return totals
+
+
+def test_sweep_matches_replaying_each_combination():
+    fleet = generate_fleet(2000, seed=2)
+    history = record_history(fleet, 72, seed=2)
+
+    result = ThresholdSweep(fleet, fleet.hourly_cost, FIXED).run(
+        history, [2, 5, 10], [120, 480], [60, 600]
+    )
+
+    assert len(result) == 12
+    for row in result.rows():
+        expected = _replay(
+            fleet, history,
+            row["cpu_idle_threshold"], row["idle_stop_minutes"], row["idle_warn_minutes"],
+        )
+        assert row["stops"] == expected["stops"]
+        assert row["approvals"] == expected["approvals"]
+        assert row["warnings"] == expected["warnings"]
+        assert row["false_stops"] == expected["false_stops"]
+        assert row["savings"] == round(expected["savings"], 2)
+
+    assert any(row["false_stops"] for row in result.rows())
+
+
+def test_history_round_trip(tmp_path):
+    fleet = generate_fleet(100, seed=1)
+    history = record_history(fleet, 12, interval=3, seed=1)
+    path = str(tmp_path / "history.npz")
+
+    history.save(path)
+    loaded = FleetHistory.load(path)
+
+    assert len(loaded) == 4
+    assert loaded.interval_hours == 3.0
+    assert loaded.fleet_seed == 1
+    np.testing.assert_array_equal(loaded.cpu, history.cpu)
+    np.testing.assert_array_equal(loaded.idle_hours, history.idle_hours)
+
+
+def test_sweep_without_warn_minutes_has_no_warning_tier():
+    fleet = generate_fleet(300, seed=4)
+    history = record_history(fleet, 48, seed=4)
+    sweep = ThresholdSweep(fleet, fleet.hourly_cost, FIXED)
+
+    result = sweep.run(history, [2, 5], [120, 480])
+
+    assert len(result) == 4
+    assert all(row["idle_warn_minutes"] is None for row in result.rows())
+    assert not result.warnings.any()
+    assert result.stops.sum() > 0
+
+    other = record_history(generate_fleet(200, seed=4), 12, seed=4)
+    with pytest.raises(ValueError):
+        sweep.run(other, [5], [120])
@@ -1,7 +1,9 @@
 import json
+import os
+import threading
+import uuid
+
 import streamlit as st
-import pandas as pd
-import altair as alt
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -12,9 +14,13 @@ from policies.vm_policies import (
     StopIdleVMPolicy,
 )
 from engine.policy_engine import PolicyEngine, Decision
-from cost.cost_model import CostModel
+from engine.metrics import REGISTRY
+from cost.fleet_cost import fleet_cost
+from cost.forecast import SavingsForecaster
+from cost.rollups import CostRollup
 from execution.gcp_executor import GCPExecutor
 from ai.chatbot import GeminiChatbot
+from ai.retrieval import DecisionIndex
 
 # --------------------------------------------------
 # Page config
@@ -127,60 +133,205 @@ st.markdown(
 )
 
 # --------------------------------------------------
-# Load mock VM data
+# Data & decisions (cached, invalidated on file change or reload)
 # --------------------------------------------------
-with open("data/sample_vms.json") as f:
-    vms = json.load(f)
+DATA_PATH = os.getenv("VM_DATA_PATH", "data/sample_vms.json")
+PAGE_SIZES = [25, 50, 100, 250]
 
-# --------------------------------------------------
-# Core components
-# --------------------------------------------------
-policies = [
+POLICIES = [
     NeverStopProdPolicy(),
     NeverStopTaggedPolicy(),
     StopIdleVMPolicy(),
 ]
 
-engine = PolicyEngine(policies)
-executor = GCPExecutor()
-chatbot = GeminiChatbot()
+
+def data_version(path: str) -> float:
+    """
+    Cache key for the VM data; changes whenever the file is rewritten.
+    """
+    return os.path.getmtime(path)
+
+
+@st.cache_resource
+def get_engine():
+    return PolicyEngine(POLICIES)
+
+
+@st.cache_resource
+def get_executor():
+    return GCPExecutor(metrics=REGISTRY)
+
+
+@st.cache_resource
+def get_chatbot():
+    return GeminiChatbot()
+
+
+@st.cache_data(show_spinner="Loading VM inventory...")
+def load_vms(path: str, version: float):
+    with open(path) as f:
+        return json.load(f)
+
+
+@st.cache_data(show_spinner="Evaluating policies...")
+def evaluate_fleet(path: str, version: float):
+    """
+    Policy decisions and costs for the whole fleet, as a DataFrame.
+    """
+    import pandas as pd
+
+    vms = load_vms(path, version)
+    engine = get_engine()
+
+    evaluations = [engine.evaluate(vm) for vm in vms]
+    fleet = fleet_cost(vms, [e["decision"] for e in evaluations])
+
+    return pd.DataFrame({
+        "name": [vm["name"] for vm in vms],
+        "environment": [vm["environment"] for vm in vms],
+        "owner": [vm.get("owner") or "unassigned" for vm in vms],
+        "decision": [e["decision"].value for e in evaluations],
+        "reason": [e["reason"] for e in evaluations],
+        "monthly_cost": fleet.monthly,
+        "savings": fleet.savings,
+        "optimized_cost": fleet.monthly - fleet.savings,
+    })
+
+
+@st.cache_resource
+def _rollup_state(path: str):
+    return {"rollup": CostRollup(), "version": None, "lock": threading.Lock()}
+
+
+def get_rollup(path: str, version: float) -> CostRollup:
+    """
+    Rollup shared across reruns and data versions. A new version of the
+    data is applied as per-VM updates instead of rebuilding the rollup.
+    """
+    state = _rollup_state(path)
+    with state["lock"]:
+        if state["version"] != version:
+            vms = load_vms(path, version)
+            results = evaluate_fleet(path, version)
+            state["rollup"].sync(vms, results["decision"])
+            state["version"] = version
+    return state["rollup"]
+
+
+@st.cache_resource(max_entries=1)
+def get_decision_index(path: str, version: float):
+    """
+    Retrieval index the chatbot uses to pick relevant VMs per question.
+    """
+    vms = load_vms(path, version)
+    records = evaluate_fleet(path, version).to_dict("records")
+    for vm, record in zip(vms, records):
+        record["tags"] = vm.get("tags", [])
+
+    totals = get_rollup(path, version).totals()
+    return DecisionIndex(records, totals={
+        "monthly_cost": totals["monthly_cost"],
+        "leakage": totals["leakage"],
+    })
+
+
+@st.cache_data(max_entries=1000)
+def forecast_vm(path: str, version: float, vm_index: int):
+    """
+    Weekly cumulative savings percentiles for one VM (computed on demand).
+    """
+    vm = load_vms(path, version)[vm_index]
+    forecaster = SavingsForecaster.from_policies(POLICIES, seed=0)
+    return forecaster.cumulative(vm, [168 * week for week in range(1, 5)])
+
+
+def reload_data():
+    load_vms.clear()
+    evaluate_fleet.clear()
+    get_decision_index.clear()
+    forecast_vm.clear()
+
+
+version = data_version(DATA_PATH)
+results = evaluate_fleet(DATA_PATH, version)
+rollup = get_rollup(DATA_PATH, version)
+executor = get_executor()
+chatbot = get_chatbot()
+
+st.sidebar.button("🔄 Reload data", on_click=reload_data)
+
+chat_stats = chatbot.stats()
+st.sidebar.caption(
+    f"Assistant: {chat_stats['intent_answers']} answered locally, "
+    f"{chat_stats['llm_calls']} LLM calls, "
+    f"cache hit rate {chat_stats['cache_hit_rate']:.0%}"
+)
 
 # --------------------------------------------------
-# Pre-compute decisions & costs
+# Fleet summary
 # --------------------------------------------------
-vm_results = []
-total_savings = 0.0
-
-for vm in vms:
-    evaluation = engine.evaluate(vm)
-    decision = evaluation["decision"]
-    reason = evaluation["reason"]
-
-    cost_model = CostModel(hourly_cost=vm["hourly_cost"])
-    monthly_cost = cost_model.monthly()
-
-    if decision == Decision.AUTO_STOP:
-        optimized_cost = 0.0
-        savings = monthly_cost
-        total_savings += savings
-    else:
-        optimized_cost = monthly_cost
-        savings = 0.0
-
-    vm_results.append({
-        "name": vm["name"],
-        "environment": vm["environment"],
-        "decision": decision,
-        "reason": reason,
-        "monthly_cost": monthly_cost,
-        "optimized_cost": optimized_cost,
-        "savings": savings,
-    })
+summary = rollup.totals()
+
+col1, col2, col3 = st.columns(3)
+col1.metric("Monthly fleet cost", f"₹{summary['monthly_cost']:,.0f}")
+col2.metric("Cost leakage", f"₹{summary['leakage']:,.0f}")
+col3.metric("Preventable waste", f"₹{summary['savings']:,.0f}")
+
+top_teams = rollup.top_wasteful(5)
+if top_teams:
+    st.markdown("#### 🏷️ Most wasteful teams")
+    for owner, leakage in top_teams:
+        st.write(f"**{owner}** — ₹{leakage:,.0f} leaked while idle")
 
 # --------------------------------------------------
-# Main VM view
+# VM table (filtered & paginated)
 # --------------------------------------------------
-for vm in vm_results:
+st.markdown(f"### 🖥️ Virtual Machines ({len(results):,})")
+
+col1, col2, col3 = st.columns([2, 2, 3])
+with col1:
+    env_filter = st.multiselect("Environment", sorted(results["environment"].unique()))
+with col2:
+    decision_filter = st.multiselect("Decision", sorted(results["decision"].unique()))
+with col3:
+    name_filter = st.text_input("Search VM name")
+
+view = results
+if env_filter:
+    view = view[view["environment"].isin(env_filter)]
+if decision_filter:
+    view = view[view["decision"].isin(decision_filter)]
+if name_filter:
+    view = view[view["name"].str.contains(name_filter, case=False, regex=False)]
+
+col1, col2 = st.columns([1, 3])
+with col1:
+    page_size = st.selectbox("Rows per page", PAGE_SIZES, index=1)
+page_count = max(1, -(-len(view) // page_size))
+with col2:
+    page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, value=1)
+
+page_view = view.iloc[(page - 1) * page_size: page * page_size]
+
+st.dataframe(
+    page_view[["name", "environment", "owner", "decision", "monthly_cost", "savings", "reason"]],
+    width="stretch",
+    hide_index=True,
+    column_config={
+        "monthly_cost": st.column_config.NumberColumn("Monthly cost (₹)", format="%.0f"),
+        "savings": st.column_config.NumberColumn("Preventable waste (₹)", format="%.0f"),
+    },
+)
+
+# --------------------------------------------------
+# VM detail (rendered only for the selected VM)
+# --------------------------------------------------
+selected = st.selectbox("Inspect VM", page_view["name"].tolist(), index=None)
+
+if selected is not None:
+    vm_index = int(page_view.index[page_view["name"] == selected][0])
+    vm = results.loc[vm_index]
+
     st.markdown('<div class="vm-card">', unsafe_allow_html=True)
 
     st.markdown(f"### 🔹 `{vm['name']}`")
@@ -191,7 +342,7 @@ for vm in vm_results:
     with col1:
         st.markdown("#### 🛡️ Policy Evaluation")
         st.write(vm["reason"])
-        st.write(f"**Decision:** `{vm['decision'].value}`")
+        st.write(f"**Decision:** `{vm['decision']}`")
 
     with col2:
         st.markdown("#### 💰 Cost Impact")
@@ -199,34 +350,33 @@ for vm in vm_results:
         st.write(f"Preventable waste: ₹{vm['savings']:.0f}")
 
     # -------- Cost trend graph --------
-    with st.expander("📊 Cost Accumulation Over Time"):
-        weeks = ["Week 1", "Week 2", "Week 3", "Week 4"]
+    with st.expander("📊 Cost Accumulation Over Time", expanded=True):
+        # Charting libraries load only once a VM detail is shown
+        import altair as alt
+        import pandas as pd
 
-        no_auto = [
-            vm["monthly_cost"] * 0.25,
-            vm["monthly_cost"] * 0.5,
-            vm["monthly_cost"] * 0.75,
-            vm["monthly_cost"],
-        ]
+        weeks = ["Week 1", "Week 2", "Week 3", "Week 4"]
 
-        with_auto = [
-            vm["optimized_cost"] * 0.25,
-            vm["optimized_cost"] * 0.5,
-            vm["optimized_cost"] * 0.75,
-            vm["optimized_cost"],
-        ]
+        # Same 168 h weeks as the forecast (monthly_cost is 24 x 30 hours)
+        no_auto = [vm["monthly_cost"] / (24 * 30) * 168 * w for w in range(1, 5)]
+        forecasts = forecast_vm(DATA_PATH, version, vm_index)
 
-        savings_trend = [
-            no_auto[i] - with_auto[i] for i in range(4)
-        ]
+        with_auto = [no_auto[i] - forecasts[i]["p50"] for i in range(4)]
 
         chart_df = pd.DataFrame({
-            "Week": weeks * 3,
-            "Cost": no_auto + with_auto + savings_trend,
+            "Week": weeks * 5,
+            "Cost": (
+                no_auto + with_auto +
+                [f["p10"] for f in forecasts] +
+                [f["p50"] for f in forecasts] +
+                [f["p90"] for f in forecasts]
+            ),
             "Metric": (
                 ["Cost without Auto-Stop"] * 4 +
-                ["Cost with Auto-Stop"] * 4 +
-                ["Savings"] * 4
+                ["Cost with Auto-Stop (P50)"] * 4 +
+                ["Savings P10"] * 4 +
+                ["Savings P50"] * 4 +
+                ["Savings P90"] * 4
             )
         })
 
@@ -237,10 +387,10 @@ for vm in vm_results:
             tooltip=["Metric", "Cost"]
         ).properties(height=300)
 
-        st.altair_chart(chart, use_container_width=True)
+        st.altair_chart(chart, width="stretch")
 
     # -------- Action (still gated) --------
-    if vm["decision"] == Decision.AUTO_STOP:
+    if vm["decision"] == Decision.AUTO_STOP.value:
         if st.button("Approve & Generate Execution Plan", key=f"stop-{vm['name']}"):
             explanation = (
                 f"Execution plan generated.\n\n"
@@ -263,6 +413,22 @@ for vm in vm_results:
 if "chat_history" not in st.session_state:
     st.session_state.chat_history = []
 
+
+def ask_chatbot():
+    """
+    Queues the question; the answer is streamed below in the main script run.
+    """
+    user_q = st.session_state.floating_chat
+    if not user_q:
+        return
+
+    st.session_state.chat_history.append(
+        {"role": "user", "content": user_q}
+    )
+    st.session_state.pending_question = user_q
+    st.session_state.floating_chat = ""
+
+
 chat_html = """
 <div class="chatbot-box">
     <div class="chatbot-header">🤖 Cloud Governance Assistant</div>
@@ -276,25 +442,25 @@ for msg in st.session_state.chat_history[-6:]:
 chat_html += "</div></div>"
 st.markdown(chat_html, unsafe_allow_html=True)
 
-user_q = st.text_input("Ask about policies, costs, or decisions", key="floating_chat")
+st.text_input(
+    "Ask about policies, costs, or decisions",
+    key="floating_chat",
+    on_change=ask_chatbot,
+)
 
-if user_q:
-    st.session_state.chat_history.append(
-        {"role": "user", "content": user_q}
-    )
+if "chat_session" not in st.session_state:
+    st.session_state.chat_session = uuid.uuid4().hex
 
-    answer = chatbot.answer(
-        user_q,
-        {
-            "vm_name": "multiple",
-            "decision": "mixed",
-            "reason": str(vm_results),
-            "monthly_savings": total_savings
-        }
-    )
+pending = st.session_state.pop("pending_question", None)
+if pending:
+    # Intent fast path / answer cache first; the LLM only sees the
+    # relevant VMs and fleet totals, within a fixed token budget.
+    # Asking again mid-answer reruns the script, which cancels this stream.
+    chatbot.set_decisions(get_decision_index(DATA_PATH, version))
+    stream = chatbot.stream_answer(pending, session=st.session_state.chat_session)
+
+    st.write_stream(stream)
 
     st.session_state.chat_history.append(
-        {"role": "assistant", "content": answer}
+        {"role": "assistant", "content": stream.text}
     )
-
-    st.rerun()
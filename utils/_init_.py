@@ -0,0 +1 @@
+from .optional_deps import is_available
@@ -0,0 +1,16 @@
+"""
+Optional dependencies
+Checks for packages that are only imported on first use
+"""
+
+import importlib.util
+
+
+def is_available(module: str) -> bool:
+    """
+    Whether a package is installed, without importing it.
+    """
+    try:
+        return importlib.util.find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False